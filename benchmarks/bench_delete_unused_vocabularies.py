@@ -0,0 +1,82 @@
+"""Benchmark pruning unused vocabularies from large SOSO graphs.
+
+Run from the repository root::
+
+    python benchmarks/bench_delete_unused_vocabularies.py [number]
+
+The graph of a SPASE record is grown to many variableMeasured entries, and
+the pruning of delete_unused_vocabularies is timed against the previous
+approach of serializing the graph and searching it for each prefix. Both are
+checked to prune the @context identically.
+"""
+
+import sys
+import timeit
+from copy import deepcopy
+from json import dumps
+from soso.main import convert_to_graph
+from soso.utilities import delete_unused_vocabularies
+
+SCALES = [10, 100, 1000, 10000]
+
+
+def delete_unused_vocabularies_by_search(graph: dict) -> dict:
+    """
+    :param graph: The JSON-LD graph.
+
+    :returns: The JSON-LD graph, with unused vocabularies removed from the top
+        level @context by searching the serialized graph.
+    """
+    graph_copy = graph.copy()
+    del graph_copy["@context"]
+    graph_copy = dumps(graph_copy)
+    for key in list(graph["@context"]):
+        if key != "@vocab" and key + ":" not in graph_copy:
+            del graph["@context"][key]
+    return graph
+
+
+def make_graph(scale: int) -> dict:
+    """
+    :param scale: The number of times to repeat the variableMeasured entries.
+
+    :returns: The graph of a SPASE record, with unused vocabularies in its
+        @context and `scale` times its variableMeasured entries.
+    """
+    graph = convert_to_graph("tests/data/spase/spase-PT8S.xml", strategy="spase")
+    # add vocabularies that are not used, for pruning
+    graph["@context"].update(
+        {
+            "dbpedia": "http://dbpedia.org/resource/",
+            "prov": "http://www.w3.org/ns/prov#",
+            "rdfs": "https://www.w3.org/2001/sw/RDFCore/Schema/200212/",
+            "time": "http://www.w3.org/2006/time#",
+        }
+    )
+    graph["variableMeasured"] = graph["variableMeasured"] * scale
+    return graph
+
+
+def main(number: int = 20) -> None:
+    """
+    :param number: The number of prunings to time for each scale.
+    """
+    print(f"{'variables':>10}{'search ms':>12}{'walk ms':>10}")
+    for scale in SCALES:
+        graph = make_graph(scale)
+        expected = delete_unused_vocabularies_by_search(deepcopy(graph))["@context"]
+        assert delete_unused_vocabularies(deepcopy(graph))["@context"] == expected
+        times = []
+        for prune in [delete_unused_vocabularies_by_search, delete_unused_vocabularies]:
+            seconds = timeit.timeit(
+                lambda prune=prune, graph=graph: prune(
+                    {**graph, "@context": dict(graph["@context"])}
+                ),
+                number=number,
+            )
+            times.append(seconds / number * 1000)
+        print(f"{len(graph['variableMeasured']):>10}{times[0]:>12.2f}{times[1]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,85 @@
+"""Benchmark converting EML records with compiled XPath expressions.
+
+Run from the repository root::
+
+    python benchmarks/bench_eml_xpath.py [number]
+
+The example EML record is grown to thousands of data entities, each with its
+attribute list, and written to a temporary file. Each record is converted
+`number` times with the compiled expressions of the EML strategy, and with
+string expressions passed to `.xpath()`, as before they were compiled. Both
+are checked to return the same graph, and the throughput is reported in
+records per second.
+"""
+
+import sys
+import timeit
+from copy import deepcopy
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+from lxml import etree
+from soso.main import convert
+from soso.strategies.eml import eml
+from soso.utilities import get_example_metadata_file_path
+
+SCALES = [10, 100, 1000, 5000]
+
+
+def make_record(entities: int, directory: str) -> str:
+    """
+    :param entities: The number of data entities in the record.
+    :param directory: The directory to write the record to.
+
+    :returns: The path of an EML record with `entities` data tables, copied
+        from those of the example EML record.
+    """
+    tree = etree.parse(str(get_example_metadata_file_path("EML")))
+    dataset = tree.find(".//dataset")
+    tables = dataset.findall("dataTable")
+    for table in tables:
+        dataset.remove(table)
+    for number in range(entities):
+        table = deepcopy(tables[number % len(tables)])
+        table.find("entityName").text = f"table_{number}.csv"
+        dataset.append(table)
+    path = Path(directory, f"eml-{entities}.xml")
+    tree.write(str(path))
+    return str(path)
+
+
+def string_xpath(element: etree._Element, expression: str) -> list:
+    """
+    :param element: The XML element, or tree, to evaluate the expression on.
+    :param expression: The XPath expression to evaluate.
+
+    :returns: The result of the expression, parsed on every call.
+    """
+    return element.xpath(expression)
+
+
+def main(number: int = 5) -> None:
+    """
+    :param number: The number of conversions to time for each scale.
+    """
+    print(f"{'entities':>9}{'string rec/s':>14}{'compiled rec/s':>16}{'speedup':>9}")
+    with TemporaryDirectory() as directory:
+        for scale in SCALES:
+            file = make_record(scale, directory)
+            with mock.patch.object(eml, "xpath", string_xpath):
+                expected = convert(file, "eml")
+                string = timeit.timeit(
+                    lambda file=file: convert(file, "eml"), number=number
+                )
+            assert convert(file, "eml") == expected
+            compiled = timeit.timeit(
+                lambda file=file: convert(file, "eml"), number=number
+            )
+            print(
+                f"{scale:>9}{number / string:>14.2f}{number / compiled:>16.2f}"
+                f"{string / compiled:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,125 @@
+"""Benchmark looking up SPASE records in the list of records whose creators
+are not split.
+
+Run from the repository root::
+
+    python benchmarks/bench_ignore_creator_split.py [records]
+
+A batch of `records` records, half of them listed, is looked up in the
+bundled spase-ignoreCreatorSplit.txt, and in an override list of 10,000
+records. Each record is looked up twice, as by SPASE.get_creator and
+process_authors, once by its absolute path and once by its path relative to
+the home directory. The lookups are timed reading the list file on every
+lookup and searching its text, as it was originally done, searching the text
+read once, and checking membership in the normalized set of paths. All are
+checked to give the same answers, and the time per batch is reported in
+milliseconds.
+"""
+
+import importlib.resources
+import os
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from soso.strategies.spase.spase import (
+    configure_ignore_creator_split,
+    get_ignore_creator_split,
+    ignores_creator_split,
+)
+
+OVERRIDE_SIZE = 10_000
+
+
+def batch(records: list, lookup) -> list:
+    """
+    :param records: The paths of the records in the batch, relative to the
+        home directory.
+    :param lookup: The function answering whether a record is listed, given
+        its absolute or relative path.
+
+    :returns: The answers for each record.
+    """
+    home_dir = os.path.expanduser("~")
+    return [(lookup(f"{home_dir}/{record}"), lookup(record)) for record in records]
+
+
+def search_file(record: str, list_file: Path) -> bool:
+    """
+    :param record: The absolute or relative path of the record.
+    :param list_file: The list of records whose creators are not split.
+
+    :returns: Whether the list read from `list_file` contains the path of the
+        record relative to the home directory.
+    """
+    return search_text(record, list_file.read_text(encoding="utf-8"))
+
+
+def search_text(record: str, text: str) -> bool:
+    """
+    :param record: The absolute or relative path of the record.
+    :param text: The text of the list of records whose creators are not split.
+
+    :returns: Whether the text contains the path of the record relative to
+        the home directory.
+    """
+    return record.replace(f"{os.path.expanduser('~')}/", "") in text
+
+
+def main(records: int = 10_000) -> None:
+    """
+    :param records: The number of records in the batch.
+    """
+    print(
+        f"{'list':>8}{'records':>9}{'read each time ms':>19}{'text read once ms':>19}"
+        f"{'set ms':>19}"
+    )
+    with TemporaryDirectory() as directory:
+        override = Path(directory, "ignoreCreatorSplit.txt")
+        override.write_text(
+            "".join(
+                f"NASA/NumericalData/Consortium/Record{number}.xml\n"
+                for number in range(OVERRIDE_SIZE)
+            ),
+            encoding="utf-8",
+        )
+        for list_file in [None, override]:
+            listed = sorted(configure_ignore_creator_split(list_file))
+            if list_file is None:
+                list_file = importlib.resources.files("soso.strategies.spase").joinpath(
+                    "spase-ignoreCreatorSplit.txt"
+                )
+            text = list_file.read_text(encoding="utf-8")
+            lookups = {
+                "read each time": partial(search_file, list_file=list_file),
+                "text read once": partial(search_text, text=text),
+                "set": ignores_creator_split,
+            }
+            paths = [
+                (
+                    listed[number % len(listed)]
+                    if number % 2
+                    else f"NASA/NumericalData/Synthetic/Record{number}.xml"
+                )
+                for number in range(records)
+            ]
+            expected = batch(paths, lookups["set"])
+            row = f"{len(listed):>8}{records:>9}"
+            for lookup in lookups.values():
+                assert batch(paths, lookup) == expected
+                seconds = min(
+                    timeit.repeat(
+                        lambda paths=paths, lookup=lookup: batch(paths, lookup),
+                        number=1,
+                        repeat=3,
+                    )
+                )
+                row += f"{seconds * 1000:>19.2f}"
+            print(row)
+    configure_ignore_creator_split()
+    assert get_ignore_creator_split()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
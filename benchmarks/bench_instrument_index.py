@@ -0,0 +1,81 @@
+"""Benchmark looking up the instruments and observatories of SPASE records.
+
+Run from the repository root::
+
+    python benchmarks/bench_instrument_index.py [records]
+
+A synthetic corpus of `records` NumericalData records, each linking to one
+of as many Instrument records, is generated in a temporary home directory,
+with an Observatory record for every two instruments and an observatory group
+for every ten observatories. The instruments and observatories of each record
+are looked up with get_observatory, as by a worker process converting the
+records. The lookups are timed parsing each linked record, and in an
+InstrumentIndex built beforehand, whose build time is reported too. Both are
+checked to give the same answers, and the times are reported in milliseconds.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+from lxml import etree
+from soso.strategies.spase.corpus import generate_corpus
+from soso.strategies.spase.spase import (
+    InstrumentIndex,
+    configure_instrument_index,
+    get_observatory,
+    linked_records,
+)
+
+
+def lookup(records: list) -> list:
+    """
+    :param records: The parsed records, with their paths.
+
+    :returns: The observatories of each record, as from get_observatory.
+    """
+    return [get_observatory(metadata, path) for metadata, path in records]
+
+
+def main(records: int = 500) -> None:
+    """
+    :param records: The number of NumericalData records in the corpus.
+    """
+    cwd = os.getcwd()
+    print(f"{'records':>8}{'build ms':>12}{'parse ms':>12}{'index ms':>12}")
+    with TemporaryDirectory() as home, mock.patch.dict(os.environ, {"HOME": home}):
+        paths = generate_corpus(
+            home,
+            records=records,
+            instruments=records,
+            observatories=max(records // 2, 1),
+            observatory_groups=max(records // 20, 1),
+        )
+        parsed = [(etree.parse(path), path) for path in paths]
+        os.chdir(home)
+        try:
+            configure_instrument_index(None)
+            linked_records.clear()
+            start = time.perf_counter()
+            expected = lookup(parsed)
+            parse = time.perf_counter() - start
+            start = time.perf_counter()
+            InstrumentIndex(Path(home, "index.sqlite")).build()
+            build = time.perf_counter() - start
+            configure_instrument_index(Path(home, "index.sqlite"))
+            start = time.perf_counter()
+            assert lookup(parsed) == expected
+            index = time.perf_counter() - start
+            print(
+                f"{records:>8}{build * 1000:>12.1f}{parse * 1000:>12.1f}"
+                f"{index * 1000:>12.1f}"
+            )
+        finally:
+            configure_instrument_index()
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
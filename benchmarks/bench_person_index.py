@@ -0,0 +1,76 @@
+"""Benchmark looking up the contacts of SPASE records in their Person records.
+
+Run from the repository root::
+
+    python benchmarks/bench_person_index.py [persons]
+
+A synthetic corpus with `persons` Person records is generated in a temporary
+home directory, and each person is looked up once with
+get_orcid_and_affiliation, as by a worker process converting a batch of
+records. The lookups are timed parsing each Person record, and in a
+PersonIndex built beforehand, whose build time is reported too. Both are
+checked to give the same answers, and the times are reported in milliseconds.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+from soso.strategies.spase.corpus import generate_corpus
+from soso.strategies.spase.spase import (
+    PersonIndex,
+    configure_person_index,
+    get_orcid_and_affiliation,
+    linked_records,
+)
+
+
+def lookup(persons: list, record: str) -> list:
+    """
+    :param persons: The SPASE IDs of the Person records.
+    :param record: The path of the record the persons are contacts of.
+
+    :returns: The ORCiD ID, organization name and ROR ID of each person.
+    """
+    return [get_orcid_and_affiliation(person, record) for person in persons]
+
+
+def main(persons: int = 1000) -> None:
+    """
+    :param persons: The number of Person records in the corpus.
+    """
+    cwd = os.getcwd()
+    print(f"{'persons':>8}{'build ms':>12}{'parse ms':>12}{'index ms':>12}")
+    with TemporaryDirectory() as home, mock.patch.dict(os.environ, {"HOME": home}):
+        paths = generate_corpus(home, records=2, persons=persons)
+        ids = [
+            f"spase://SMWG/Person/{path.stem}"
+            for path in sorted(Path(home, "SMWG", "Person").glob("*.xml"))
+        ]
+        os.chdir(home)
+        try:
+            configure_person_index(None)
+            linked_records.clear()
+            start = time.perf_counter()
+            expected = lookup(ids, paths[0])
+            parse = time.perf_counter() - start
+            start = time.perf_counter()
+            PersonIndex(Path(home, "people.sqlite")).build()
+            build = time.perf_counter() - start
+            configure_person_index(Path(home, "people.sqlite"))
+            start = time.perf_counter()
+            assert lookup(ids, paths[0]) == expected
+            index = time.perf_counter() - start
+            print(
+                f"{persons:>8}{build * 1000:>12.1f}{parse * 1000:>12.1f}"
+                f"{index * 1000:>12.1f}"
+            )
+        finally:
+            configure_person_index()
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,54 @@
+"""Benchmark converting synthetic SPASE corpora with the conversion script.
+
+Run from the repository root::
+
+    python benchmarks/bench_spase_conversion.py [records]
+
+A synthetic corpus of `records` NumericalData records, and the records they
+link to, is generated in a temporary home directory. It is converted by the
+main function of the SPASE conversion script with 1 and 4 worker processes,
+and the throughput is reported in records per second.
+"""
+
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from shutil import rmtree
+from tempfile import TemporaryDirectory
+from unittest import mock
+from soso.strategies.spase.conversion import main as convert_folder
+from soso.strategies.spase.corpus import generate_corpus
+
+WORKERS = [1, 4]
+
+
+def main(records: int = 200) -> None:
+    """
+    :param records: The number of NumericalData records in the corpus.
+    """
+    cwd = os.getcwd()
+    print(f"{'records':>8}{'workers':>9}{'seconds':>9}{'rec/s':>9}")
+    with TemporaryDirectory() as home, mock.patch.dict(
+        os.environ, {"HOME": home}
+    ), mock.patch("builtins.input", lambda prompt: ""):
+        paths = generate_corpus(home, records=records)
+        os.chdir(home)
+        try:
+            for workers in WORKERS:
+                start = time.perf_counter()
+                with redirect_stdout(StringIO()):
+                    convert_folder(str(Path(paths[0]).parent), workers=workers)
+                seconds = time.perf_counter() - start
+                print(
+                    f"{records:>8}{workers:>9}{seconds:>9.2f}{records / seconds:>9.1f}"
+                )
+                rmtree("SPASE_JSONs")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,87 @@
+"""Benchmark the tree walks and wall time of converting SPASE records.
+
+Run from the repository root::
+
+    python benchmarks/bench_spase_index.py [number]
+
+Each SPASE record in ``tests/data/spase`` that converts without network access
+is converted `number` times. The walks over the record's XML tree and the mean
+wall time per conversion are reported. For comparison, the walks are also
+counted without the index, walking the tree for each lookup, as the strategy
+and its helpers did before records were indexed. Both give the same JSON-LD.
+"""
+
+import os
+import sys
+import timeit
+from glob import glob
+from unittest import mock
+from soso.main import convert
+from soso.strategies.spase import spase
+from soso.strategies.spase.spase import SpaseIndex
+
+RECORDS = sorted(glob(os.path.abspath("tests/data/spase/spase-*.xml")))
+
+
+class UnindexedLookups:  # pylint: disable=too-few-public-methods
+    """Stands in for the SpaseIndex of a record, walking its tree again for
+    each lookup."""
+
+    # SpaseIndex counts its walks on the class found under its name, which is
+    # this one while it stands in
+    walks = 0
+
+    def __init__(self, metadata):
+        """
+        :param metadata: The SPASE metadata object as an XML tree.
+        """
+        self.metadata = metadata
+
+    def __getattr__(self, name: str):
+        # each lookup indexes the tree anew, which walks it once
+        return getattr(SpaseIndex(self.metadata), name)
+
+
+def count_walks(file: str) -> tuple[int, str]:
+    """
+    :param file: The absolute path of the SPASE record to convert.
+
+    :returns: The tree walks of a conversion, and its JSON-LD.
+    """
+    walks = spase.SpaseIndex.walks
+    result = convert(file=file, strategy="spase")
+    return spase.SpaseIndex.walks - walks, result
+
+
+def bench(file: str, number: int) -> tuple[int, int, float]:
+    """
+    :param file: The absolute path of the SPASE record to convert.
+    :param number: The number of conversions to time.
+
+    :returns: The tree walks per conversion without and with the index, and
+        the mean wall time of a conversion with the index in milliseconds.
+    """
+    with mock.patch("soso.strategies.spase.spase.SpaseIndex", UnindexedLookups):
+        unindexed, expected = count_walks(file)
+    walks, result = count_walks(file)
+    assert result == expected
+    seconds = timeit.timeit(lambda: convert(file=file, strategy="spase"), number=number)
+    return unindexed, walks, seconds / number * 1000
+
+
+def main(number: int = 100) -> None:
+    """
+    :param number: The number of conversions to time for each record.
+    """
+    print(f"{'record':<30}{'unindexed':>11}{'walks':>8}{'ms':>10}")
+    for file in RECORDS:
+        try:
+            unindexed, walks, ms = bench(file, number)
+        except AttributeError:
+            # records that are not NumericalData, DisplayData, etc.
+            continue
+        print(f"{os.path.basename(file):<30}{unindexed:>11}{walks:>8}{ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,300 @@
+"""Benchmark suite for converting, cleaning and validating SOSO graphs.
+
+Run from the repository root::
+
+    python benchmarks/bench_suite.py [--scales 1 10 100] [--number 3]
+        [--output results.json] [--compare previous.json] [--threshold 0.25]
+
+The bundled EML and SPASE example records are scaled up by repeating their
+repeatable elements (creators, keywords, data entities, parameters, ...)
+`scale` times. For each strategy and scale, the suite times:
+
+- `convert`
+- each strategy getter, with memoization turned off
+- `delete_null_values` and `delete_unused_vocabularies` on the converted graph
+- `validate` on the converted graph, written to a JSON-LD file
+
+The SPASE records in ``tests/data/spase`` are laid out in a temporary home
+directory, as in a clone of the SPASE repositories, so the records linked from
+the SPASE record are found. DOI lookups are answered by a stub HTTP session,
+so the suite runs offline and times only the work of the package. Validating
+graphs scaled 1000 times takes a long time, so the 1000 scale is only run when
+asked for.
+
+The best time of `number` runs of each benchmark (or of one run, for those
+taking more than `LONG` seconds) is printed and, if
+`--output` is given, written as JSON with the commit it was run on. To track regressions between
+commits, pass the results of an earlier commit to `--compare`. The change of
+each benchmark is then reported, and the suite exits with status 1 if any is
+slower than before by more than `--threshold`.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import timeit
+from copy import deepcopy
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest import mock
+from lxml import etree
+from soso.interface import StrategyInterface
+from soso.main import convert, convert_to_graph
+from soso.strategies.eml.eml import EML
+from soso.strategies.spase.spase import SPASE
+from soso.utilities import (
+    configure_http_cache,
+    delete_null_values,
+    delete_unused_vocabularies,
+    get_example_metadata_file_path,
+)
+from soso.validation import validate
+
+SCALES = [1, 10, 100]
+
+# The number of seconds above which a benchmark is only run once
+LONG = 5
+
+# The number of seconds below which a benchmark is too fast to flag as a
+# regression, as its changes are mostly noise
+FLOOR = 1e-5
+
+# The elements repeated to scale a record, by strategy. Each element is
+# repeated in place, next to the original.
+REPEATED = {
+    "eml": {
+        "dataset": [
+            "creator",
+            "keywordSet",
+            "associatedParty",
+            "dataTable",
+            "otherEntity",
+        ],
+        "coverage": ["geographicCoverage"],
+    },
+    "spase": {
+        "ResourceHeader": ["Contact", "InformationURL"],
+        "NumericalData": [
+            "AccessInformation",
+            "ObservedRegion",
+            "Keyword",
+            "Parameter",
+        ],
+    },
+}
+
+STRATEGIES = {"eml": EML, "spase": SPASE}
+
+GETTERS = sorted(name for name in dir(StrategyInterface) if name.startswith("get_"))
+
+
+class StubSession:  # pylint: disable=too-few-public-methods
+    """An HTTP session answering DOI lookups without the network. DOIs resolve
+    to a SPASE landing page of a dataset, and other requests get DataCite
+    metadata of a dataset."""
+
+    def request(self, method: str, url: str, **kwargs: dict) -> SimpleNamespace:
+        """
+        :param method: The HTTP method.
+        :param url: The URL requested.
+        :param kwargs: The other arguments of `requests.Session.request`.
+
+        :returns: A response with the status code, headers and text used by
+            the package.
+        """
+        del kwargs  # the stub answers the same whatever the arguments
+        if method == "HEAD":
+            location = "https://spase-metadata.org/NASA/NumericalData/Stub"
+            return SimpleNamespace(
+                status_code=302, headers={"location": location}, text=""
+            )
+        text = json.dumps(
+            {
+                "types": {"resourceTypeGeneral": "Dataset"},
+                "titles": [{"title": url}],
+                "descriptions": [],
+                "rightsList": [],
+                "creators": [{"name": "Doe, Jane", "affiliation": []}],
+            }
+        )
+        return SimpleNamespace(status_code=200, headers={}, text=text)
+
+
+def scale_record(strategy: str, scale: int, directory: str) -> str:
+    """
+    :param strategy: The strategy of the record, "eml" or "spase".
+    :param scale: The number of times to repeat the repeatable elements.
+    :param directory: The directory to write the record to.
+
+    :returns: The path of the bundled example record of `strategy`, with the
+        elements in `REPEATED` repeated `scale` times.
+    """
+    tree = etree.parse(str(get_example_metadata_file_path(strategy)))
+    for parent in tree.iter():
+        if not isinstance(parent.tag, str):
+            continue
+        repeated = REPEATED[strategy].get(etree.QName(parent).localname, [])
+        for element in list(parent):
+            if isinstance(element.tag, str) and (
+                etree.QName(element).localname in repeated
+            ):
+                for _ in range(scale - 1):
+                    element.addnext(deepcopy(element))
+    path = Path(directory, f"{strategy}-{scale}.xml")
+    tree.write(str(path), encoding="utf-8")
+    return str(path)
+
+
+def link_records(home: str) -> None:
+    """
+    :param home: The home directory to lay the records out in.
+
+    Copies each SPASE record in ``tests/data/spase`` to the path of its
+    ResourceID (or PersonID) in `home`, as in a clone of the SPASE
+    repositories.
+    """
+    for record in Path("tests/data/spase").glob("spase-*.xml"):
+        tree = etree.parse(str(record))
+        for element in tree.iter():
+            if isinstance(element.tag, str) and (
+                etree.QName(element).localname in ("ResourceID", "PersonID")
+            ):
+                path = Path(home, element.text.replace("spase://", "") + ".xml")
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(record.read_bytes())
+                break
+
+
+def best_time(function: callable, number: int) -> float:
+    """
+    :param function: The function to time, called without arguments.
+    :param number: The number of times to time it.
+
+    :returns: The best wall time of a call, in seconds. Fast functions are
+        called in loops of at least 0.2 seconds, and functions taking longer
+        than `LONG` seconds are only timed once.
+    """
+    timer = timeit.Timer(function)
+    loops, seconds = timer.autorange()
+    if seconds > LONG or number < 2:
+        return seconds / loops
+    return min(seconds, *timer.repeat(repeat=number - 1, number=loops)) / loops
+
+
+def bench_record(file: str, strategy: str, directory: str, number: int) -> dict:
+    """
+    :param file: The path of the record to benchmark.
+    :param strategy: The strategy of the record, "eml" or "spase".
+    :param directory: The directory to write the converted graph to.
+    :param number: The number of runs of each benchmark.
+
+    :returns: The best time of each benchmark in seconds, by name.
+    """
+    times = {"convert": best_time(lambda: convert(file, strategy), number)}
+
+    instance = STRATEGIES[strategy](file)
+    instance.memoize = False
+    for getter in GETTERS:
+        times[f"getter.{getter}"] = best_time(getattr(instance, getter), number)
+
+    graph = convert_to_graph(file, strategy)
+    times["delete_null_values"] = best_time(lambda: delete_null_values(graph), number)
+    times["delete_unused_vocabularies"] = best_time(
+        lambda: delete_unused_vocabularies(
+            {**graph, "@context": dict(graph["@context"])}
+        ),
+        number,
+    )
+
+    data_graph = Path(directory, Path(file).stem + ".jsonld")
+    data_graph.write_text(json.dumps(graph), encoding="utf-8")
+    times["validate"] = best_time(lambda: validate(str(data_graph)), number)
+    return times
+
+
+def git_commit() -> str:
+    """
+    :returns: The commit the suite is run on, or None outside a git repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, previous: dict, threshold: float) -> list:
+    """
+    :param results: The results of this run.
+    :param previous: The results of an earlier run.
+    :param threshold: The relative slowdown above which a benchmark has
+        regressed, e.g. 0.25 for 25 percent.
+
+    :returns: The names of the benchmarks that regressed, ignoring those
+        faster than `FLOOR`. The change of each benchmark in both runs is
+        printed.
+    """
+    print(f"\nCompared to {previous.get('commit')}:")
+    print(f"{'benchmark':<60}{'before ms':>12}{'after ms':>12}{'change':>9}")
+    regressions = []
+    for name, seconds in results["benchmarks"].items():
+        before = previous["benchmarks"].get(name)
+        if not before:
+            continue
+        change = seconds / before - 1
+        regressed = change > threshold and seconds > FLOOR
+        if regressed:
+            regressions.append(name)
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"{name:<60}{before * 1000:>12.3f}{seconds * 1000:>12.3f}{change:>+9.1%}{flag}"
+        )
+    return regressions
+
+
+def main(arguments: list = None) -> int:
+    """
+    :param arguments: The command line arguments. Defaults to `sys.argv`.
+
+    :returns: The exit status, 1 if a benchmark regressed, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", nargs="+", type=int, default=SCALES)
+    parser.add_argument("--number", type=int, default=3)
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    arguments = parser.parse_args(arguments)
+
+    configure_http_cache()  # no cache, so every lookup reaches the stub
+    results = {"commit": git_commit(), "benchmarks": {}}
+    with TemporaryDirectory() as directory, mock.patch(
+        "soso.utilities.get_http_session", StubSession
+    ), mock.patch.dict(os.environ, {"HOME": directory}):
+        link_records(directory)
+        for strategy in STRATEGIES:
+            for scale in arguments.scales:
+                file = scale_record(strategy, scale, directory)
+                times = bench_record(file, strategy, directory, arguments.number)
+                for name, seconds in times.items():
+                    key = f"{strategy}.{name}[{scale}x]"
+                    results["benchmarks"][key] = seconds
+                    print(f"{key:<60}{seconds * 1000:>12.3f} ms")
+
+    if arguments.output:
+        Path(arguments.output).write_text(
+            json.dumps(results, indent=2), encoding="utf-8"
+        )
+    if arguments.compare:
+        previous = json.loads(Path(arguments.compare).read_text(encoding="utf-8"))
+        if compare(results, previous, arguments.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
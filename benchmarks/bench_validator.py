@@ -0,0 +1,110 @@
+"""Benchmark validating many data graphs against the same SHACL shape graph.
+
+Run from the repository root::
+
+    python benchmarks/bench_validator.py [graphs]
+
+A batch of `graphs` copies of a data graph is validated against the default
+SOSO shape graph, for the graph converted from the bundled EML example record
+and for a minimal Dataset graph. The batch is timed validating each graph with
+`validate`, which parses the shape graph on every call, and with a single
+`Validator`, created once per batch, given the graphs as JSON-LD files, as
+dictionaries of the JSON-LD returned by `convert`, or as rdflib Graphs parsed
+beforehand, and for dictionaries validated for structured results, read from
+the results graph of each validation. All are checked to give the same
+reports, and the time per batch is reported in milliseconds.
+"""
+
+import json
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import rdflib
+from soso.main import convert
+from soso.utilities import get_example_metadata_file_path
+from soso.validation import Validator, validate
+
+MINIMAL_GRAPH = {
+    "@context": {"@vocab": "https://schema.org/"},
+    "@id": "https://example.org/dataset",
+    "@type": "Dataset",
+    "name": "A minimal dataset",
+}
+
+
+def with_function(paths: list) -> list:
+    """
+    :param paths: The paths of the data graph files.
+
+    :returns: The results of `validate` for each data graph.
+    """
+    return [validate(path) for path in paths]
+
+
+def with_validator(data_graphs: list, structured: bool = False) -> list:
+    """
+    :param data_graphs: The data graphs, as file paths, dictionaries or
+        rdflib Graphs.
+    :param structured: Whether to validate for structured results.
+
+    :returns: The results of a `Validator`, created for the batch, for each
+        data graph.
+    """
+    validator = Validator()
+    return [validator.validate(data_graph, structured) for data_graph in data_graphs]
+
+
+def main(graphs: int = 20) -> None:
+    """
+    :param graphs: The number of data graphs in the batch.
+    """
+    examples = {
+        "EML": json.loads(convert(get_example_metadata_file_path("EML"), "EML")),
+        "minimal": MINIMAL_GRAPH,
+    }
+    print(
+        f"{'graph':<10}{'graphs':>8}{'validate ms':>14}{'files ms':>14}{'dicts ms':>14}"
+        f"{'Graphs ms':>14}{'structured ms':>15}"
+    )
+    with TemporaryDirectory() as directory:
+        for name, example in examples.items():
+            path = Path(directory, f"{name}.jsonld")
+            path.write_text(json.dumps(example), encoding="utf-8")
+            batches = [
+                (with_function, lambda path=path: [str(path)] * graphs),
+                (with_validator, lambda path=path: [str(path)] * graphs),
+                (with_validator, lambda example=example: [example] * graphs),
+                (
+                    with_validator,
+                    lambda example=example: [
+                        rdflib.Graph().parse(data=example, format="json-ld")
+                        for _ in range(graphs)
+                    ],
+                ),
+                (
+                    partial(with_validator, structured=True),
+                    lambda example=example: [example] * graphs,
+                ),
+            ]
+            row = f"{name:<10}{graphs:>8}"
+            expected = None
+            for run, make_graphs in batches:
+                seconds = []
+                for _ in range(3):
+                    # Graphs are made anew for each run, as rdflib Graphs
+                    # remember the text of nodes rendered in a report.
+                    data_graphs = make_graphs()
+                    start = time.perf_counter()
+                    results = run(data_graphs)
+                    seconds.append(time.perf_counter() - start)
+                    results = [result["report"] for result in results]
+                    assert expected is None or results == expected
+                    expected = results
+                row += f"{min(seconds) * 1000:>14.1f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -1,5 +1,13 @@
 """soso: For creating Science On Schema.Org (SOSO) markup."""
 
-from importlib.metadata import version
 
-__version__ = version("soso")
+def __getattr__(name: str) -> str:
+    """Looks up the version of the installed package on first use, as reading
+    the package metadata is slow."""
+    if name == "__version__":
+        from importlib.metadata import (  # pylint: disable=import-outside-toplevel
+            version,
+        )
+
+        return version("soso")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 """The strategy interface module."""
 
-from typing import Any
+from copy import deepcopy
+from functools import wraps
+from typing import Any, Callable
 
 
 class StrategyInterface:
@@ -23,8 +25,23 @@ class StrategyInterface:
             `strategy`. This can help in the case of unmappable properties.
             See the Notes section in the strategy's documentation for more
             information.
+
+        memoize:
+            Whether methods decorated with `memoized` compute their results
+            once per instance. True by default. Set it to False on an
+            instance, or on this class, to recompute results on every call.
+
+        memo:
+            The results of methods decorated with `memoized`, by method name
+            and arguments.
+
+        memo_hits:
+            The number of calls to methods decorated with `memoized` that
+            reused a result instead of recomputing it.
     """
 
+    memoize = True
+
     def __init__(
         self,
         metadata: Any = None,
@@ -37,6 +54,8 @@ class StrategyInterface:
         self.file = file
         self.schema_version = schema_version
         self.kwargs = kwargs
+        self.memo = {}
+        self.memo_hits = 0
 
     def get_id(self):
         """
@@ -197,3 +216,30 @@ class StrategyInterface:
         :returns:   An execution linking a program to source and derived
                     products.
         """
+
+
+def memoized(method: Callable) -> Callable:
+    """Decorate a strategy method so that its result is computed once per
+    instance and set of arguments, for methods whose results are used by other
+    methods. The result is copied once, when it is stored, so the caller that
+    computed it can modify it. Later calls return the stored result, which is
+    not to be modified.
+
+    :param method: The strategy method to memoize.
+
+    :returns: The memoized method.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.memoize:
+            return method(self, *args, **kwargs)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key in self.memo:
+            self.memo_hits += 1
+            return self.memo[key]
+        result = method(self, *args, **kwargs)
+        self.memo[key] = deepcopy(result)
+        return result
+
+    return wrapper
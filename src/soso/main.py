@@ -1,18 +1,27 @@
 """The validation module."""
 
 from json import dumps
-from soso.strategies.eml.eml import EML
-from soso.strategies.spase.spase import SPASE
+from typing import Iterable, Iterator, Union
+from soso.profiling import GetterProfile
 from soso.utilities import delete_unused_vocabularies
 
+# Each strategy is imported when first used, so converting with one strategy
+# doesn't pay for importing the others.
+# pylint: disable=import-outside-toplevel
 
-def convert(file: str, strategy: str, **kwargs: dict) -> str:
+
+def convert(
+    file: str, strategy: str, profile: GetterProfile = None, **kwargs: dict
+) -> str:
     """Return SOSO markup for a metadata file and specified strategy.
 
     :param file:    The path to the metadata file. Refer to the strategy's
                     documentation for a list of supported file types.
     :param strategy:    The conversion strategy to use. Available
                         strategies include: EML and SPASE.
+    :param profile: A profile to record the wall time, calls and I/O of the
+                    strategy's getters in. Optional. See
+                    `soso.profiling.GetterProfile`.
     :param kwargs:  Additional keyword arguments for passing information to
                     the chosen `strategy`. This can help in the case of
                     unmappable properties. See the Notes section in the
@@ -20,16 +29,49 @@ def convert(file: str, strategy: str, **kwargs: dict) -> str:
 
     :returns: The SOSO graph in JSON-LD format.
     """
+    return dumps(convert_to_graph(file, strategy, profile, **kwargs))
+
+
+def convert_to_graph(
+    file: str, strategy: str, profile: GetterProfile = None, **kwargs: dict
+) -> dict:
+    """Return SOSO markup for a metadata file and specified strategy, as a
+    Python dictionary rather than a JSON-LD string. Use this instead of
+    `convert` when the graph will be modified before it is serialized, to
+    avoid parsing the JSON-LD string back into a dictionary.
+
+    :param file:    The path to the metadata file. Refer to the strategy's
+                    documentation for a list of supported file types.
+    :param strategy:    The conversion strategy to use. Available
+                        strategies include: EML and SPASE.
+    :param profile: A profile to record the wall time, calls and I/O of the
+                    strategy's getters in. Optional. See
+                    `soso.profiling.GetterProfile`.
+    :param kwargs:  Additional keyword arguments for passing information to
+                    the chosen `strategy`. This can help in the case of
+                    unmappable properties. See the Notes section in the
+                    strategy's documentation for more information.
+
+    :returns: The SOSO graph, as a dictionary.
+    """
 
     # Load the strategy based on user choice. Pass kwargs, so the strategy can
     # operate on them.
     if strategy.lower() == "eml":
+        from soso.strategies.eml.eml import EML
+
         strategy = EML(file, **kwargs)
     elif strategy.lower() == "spase":
+        from soso.strategies.spase.spase import SPASE
+
         strategy = SPASE(file, **kwargs)
     else:
         raise ValueError("Invalid choice!")
 
+    # Record the getter calls, if profiling
+    if profile is not None:
+        strategy = profile.wrap(strategy)
+
     # Build the graph
     graph = {
         "@context": {
@@ -95,4 +137,47 @@ def convert(file: str, strategy: str, **kwargs: dict) -> str:
     # clean graph.
     graph = delete_unused_vocabularies(graph)
 
-    return dumps(graph)
+    return graph
+
+
+def convert_many(
+    files: Iterable[str], strategy: str, **kwargs: dict
+) -> Iterator[tuple[str, Union[str, Exception]]]:
+    """Return SOSO markup for a batch of metadata files and specified strategy.
+
+    Files are converted one at a time with `convert`, in the order given, and
+    each result is yielded as soon as it is ready. A file that fails to
+    convert does not stop the batch; the exception raised is yielded in place
+    of its graph. Nothing is shared between the files by `convert_many`
+    itself: resources the strategies keep for the process, such as the
+    bundled MIME types, the SPASE ignore-creator list and the cache of linked
+    SPASE records, are loaded by the first file needing them and reused by the
+    rest, as they are when calling `convert` in a loop.
+
+    :param files:   The paths to the metadata files.
+    :param strategy:    The conversion strategy to use. Available
+                        strategies include: EML and SPASE.
+    :param kwargs:  Additional keyword arguments for passing information to
+                    the chosen `strategy`, as for `convert`. They apply to
+                    every file. Pass a `profile` to aggregate the getter
+                    statistics of the whole batch.
+
+    :returns: An iterator of (file, result) tuples, where result is the SOSO
+        graph in JSON-LD format, or the exception raised converting the file.
+    """
+    if strategy.lower() not in ("eml", "spase"):
+        raise ValueError("Invalid choice!")
+    return _convert_many(files, strategy, **kwargs)
+
+
+def _convert_many(
+    files: Iterable[str], strategy: str, **kwargs: dict
+) -> Iterator[tuple[str, Union[str, Exception]]]:
+    """Yield the results of `convert_many`."""
+    for file in files:
+        try:
+            graph = convert(file, strategy, **kwargs)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            yield file, error
+        else:
+            yield file, graph
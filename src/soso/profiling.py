@@ -0,0 +1,144 @@
+"""The profiling module."""
+
+import time
+from copy import deepcopy
+from functools import partial
+from typing import Any, Callable, Union
+from soso.interface import StrategyInterface
+from soso.utilities import get_http_cache
+
+
+def _linked_records():
+    """
+    :returns: The cache of linked SPASE records, imported when first profiling
+        so that importing this module doesn't import the SPASE strategy.
+    """
+    # pylint: disable=import-outside-toplevel
+    from soso.strategies.spase.spase import linked_records
+
+    return linked_records
+
+
+# Running totals of I/O operations, by name. The difference in each total
+# over a getter call is attributed to the getter.
+COUNTERS = {
+    "http_requests": lambda: get_http_cache().misses,
+    "http_cache_hits": lambda: get_http_cache().hits,
+    "files_read": lambda: _linked_records().misses,
+    "linked_record_hits": lambda: _linked_records().hits,
+}
+
+
+class GetterProfile:
+    """Wall time, call counts and I/O counts of the strategy getters called
+    while converting metadata files. Pass the same profile to `convert`,
+    `convert_to_graph` or `convert_many` to accumulate them over a batch.
+
+    Attributes:
+        conversions: The number of conversions profiled.
+        getters: The statistics of each getter called, by getter name. Each
+            is a dictionary of the number of "calls", their total wall time in
+            "seconds", and the number of I/O operations of each kind in
+            `COUNTERS`:
+
+            - "http_requests": HTTP requests sent over the network, such as
+              DOI lookups
+            - "http_cache_hits": HTTP responses read from the HTTP cache
+            - "files_read": linked SPASE records read from disk
+            - "linked_record_hits": linked SPASE records reused from memory
+
+        callback: A function called after each getter call with the getter
+            name and the statistics of that call alone, e.g. to emit them to
+            a log. None by default.
+
+    Notes:
+        Getters called by other getters are counted as part of the calling
+        getter. Memoized getters are timed where they are first computed.
+    """
+
+    def __init__(self, callback: Callable[[str, dict], None] = None):
+        self.conversions = 0
+        self.getters = {}
+        self.callback = callback
+
+    def call(self, name: str, getter: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        :param name: The name of the getter.
+        :param getter: The getter to call.
+        :param args: The positional arguments of the getter.
+        :param kwargs: The keyword arguments of the getter.
+
+        :returns: The result of the getter, whose call is recorded in
+            `getters`, even if it raises an exception.
+        """
+        before = {counter: count() for counter, count in COUNTERS.items()}
+        start = time.perf_counter()
+        try:
+            return getter(*args, **kwargs)
+        finally:
+            stats = {"calls": 1, "seconds": time.perf_counter() - start}
+            for counter, count in COUNTERS.items():
+                stats[counter] = count() - before[counter]
+            self._add(name, stats)
+            if self.callback is not None:
+                self.callback(name, stats)
+
+    def wrap(self, strategy: StrategyInterface) -> "ProfiledStrategy":
+        """
+        :param strategy: The strategy converting a metadata file.
+
+        :returns: The strategy, with calls to its getters recorded in this
+            profile. Each strategy wrapped counts as one conversion.
+        """
+        self.conversions += 1
+        return ProfiledStrategy(strategy, self)
+
+    def as_dict(self) -> dict:
+        """
+        :returns: The profile as a dictionary of "conversions" and "getters",
+            which can be serialized as JSON, or merged into another profile,
+            e.g. one from another process.
+        """
+        return {"conversions": self.conversions, "getters": deepcopy(self.getters)}
+
+    def merge(self, other: Union["GetterProfile", dict]) -> None:
+        """
+        Adds the conversions and getter statistics of another profile to this
+        one.
+
+        :param other: The other profile, or its dictionary from `as_dict`.
+        """
+        if isinstance(other, GetterProfile):
+            other = other.as_dict()
+        self.conversions += other["conversions"]
+        for name, stats in other["getters"].items():
+            self._add(name, stats)
+
+    def _add(self, name: str, stats: dict) -> None:
+        """
+        :param name: The name of the getter.
+        :param stats: The statistics to add to those of the getter.
+        """
+        totals = self.getters.setdefault(name, dict.fromkeys(stats, 0))
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+
+
+class ProfiledStrategy:  # pylint: disable=too-few-public-methods
+    """A strategy whose getter calls are recorded in a profile. Other
+    attributes are those of the strategy.
+
+    Attributes:
+        strategy: The strategy wrapped.
+        profile: The profile recording the getter calls.
+    """
+
+    def __init__(self, strategy: StrategyInterface, profile: GetterProfile):
+        self.strategy = strategy
+        self.profile = profile
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.strategy, name)
+        if name.startswith("get_") and callable(attribute):
+            return partial(self.profile.call, name, attribute)
+        return attribute
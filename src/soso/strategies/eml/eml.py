@@ -2,7 +2,7 @@
 
 from typing import Union
 from lxml import etree
-from soso.interface import StrategyInterface
+from soso.interface import StrategyInterface, memoized
 from soso.utilities import (
     delete_null_values,
     limit_to_5000_characters,
@@ -11,6 +11,52 @@ from soso.utilities import (
     guess_mime_type_with_fallback,
 )
 
+# The EML data entity elements, in the order they are listed in the
+# distribution.
+DATA_ENTITIES = [
+    "dataTable",
+    "spatialRaster",
+    "spatialVector",
+    "storedProcedure",
+    "view",
+    "otherEntity",
+]
+
+# Compiled XPath expressions used by the EML strategy, keyed by expression.
+# A string expression passed to `.xpath()` is parsed on every call, so each
+# expression is compiled once here and reused. Evaluate them with `xpath`.
+XPATHS = {
+    expression: etree.XPath(expression)
+    for expression in [
+        "@packageId",
+        ".//dataset/abstract",
+        ".//dataset/keywordSet/keyword",
+        ".//dataset/annotation/valueURI",
+        ".//attributeList/attribute",
+        *[f".//{data_entity}" for data_entity in DATA_ENTITIES],
+        ".//dataset/coverage/temporalCoverage/rangeOfDates",
+        ".//dataset/coverage/temporalCoverage/singleDateTime",
+        ".//dataset/coverage/geographicCoverage",
+        ".//dataset/creator",
+        ".//dataset/contact",
+        ".//dataset/associatedParty",
+        ".//project/personnel",
+        ".//dataset/project/award",
+        ".//dataSource",
+        ".//physical/size",
+        ".//distribution/online/url",
+        ".//beginDate",
+        ".//endDate",
+        ".//alternativeTimeScale",
+        ".//boundingCoordinates",
+        ".//gRing",
+        "individualName",
+        "userId",
+        ".//methods",
+        ".//physical/authentication",
+    ]
+}
+
 
 class EML(StrategyInterface):
     """Define the conversion strategy for EML (Ecological Metadata Language).
@@ -20,6 +66,11 @@ class EML(StrategyInterface):
                 EML format.
         schema_version: The version of the EML schema used in the metadata
             file.
+        low_memory: Whether the metadata file was read in low-memory mode.
+            See the Notes section below for details.
+        streamed:   The values extracted while reading the metadata file in
+            low-memory mode, as returned by `iterparse_metadata`. None
+            otherwise.
         kwargs:   Additional keyword arguments for handling unmappable
                     properties. See the Notes section below for details.
 
@@ -47,15 +98,27 @@ class EML(StrategyInterface):
             - publisher
             - prov:wasRevisionOf
             - prov:wasGeneratedBy
+
+        Very large EML documents, such as those with tens of thousands of
+        attributes, can be read in low-memory mode by passing
+        `low_memory=True`. The file is then read in a single streaming pass,
+        and attribute and data entity elements are converted as they are
+        read and removed from the tree. The resulting graph is the same as
+        in the default mode. See `iterparse_metadata` for details.
     """
 
-    def __init__(self, file: str, **kwargs: dict):
+    def __init__(self, file: str, low_memory: bool = False, **kwargs: dict):
         """Initialize the strategy."""
         file = str(file)  # incase file is a Path object
         if not file.endswith(".xml"):  # file should be XML
             raise ValueError(file + " must be an XML file.")
-        super().__init__(metadata=etree.parse(file))
+        if low_memory:
+            metadata, self.streamed = iterparse_metadata(file)
+        else:
+            metadata, self.streamed = etree.parse(file), None
+        super().__init__(metadata=metadata)
         self.file = file
+        self.low_memory = low_memory
         self.schema_version = get_schema_version(self.metadata)
         self.kwargs = kwargs
 
@@ -68,7 +131,7 @@ class EML(StrategyInterface):
         return delete_null_values(name)
 
     def get_description(self) -> Union[str, None]:
-        description = self.metadata.xpath(".//dataset/abstract")
+        description = xpath(self.metadata, ".//dataset/abstract")
         if len(description) == 0:
             return None
         description = etree.tostring(description[0], encoding="utf-8", method="text")
@@ -94,9 +157,9 @@ class EML(StrategyInterface):
 
     def get_keywords(self) -> Union[list, None]:
         keywords = []
-        for item in self.metadata.xpath(".//dataset/keywordSet/keyword"):
+        for item in xpath(self.metadata, ".//dataset/keywordSet/keyword"):
             keywords.append(item.text)
-        for item in self.metadata.xpath(".//dataset/annotation/valueURI"):
+        for item in xpath(self.metadata, ".//dataset/annotation/valueURI"):
             defined_term = {
                 "@type": "DefinedTerm",
                 "name": item.attrib["label"],
@@ -106,7 +169,7 @@ class EML(StrategyInterface):
         return delete_null_values(keywords)
 
     def get_identifier(self) -> Union[str, None]:
-        identifier = self.metadata.xpath("@packageId")
+        identifier = xpath(self.metadata, "@packageId")
         if identifier:
             return delete_null_values(identifier[0])
         return None
@@ -116,22 +179,13 @@ class EML(StrategyInterface):
         return delete_null_values(citation)
 
     def get_variable_measured(self) -> Union[list, None]:
-        variable_measured = []
-        for item in self.metadata.xpath(".//attributeList/attribute"):
-            property_value = {
-                "@type": "PropertyValue",
-                "name": item.findtext("attributeName"),
-                "alternateName": item.findtext("attributeLabel"),
-                "propertyID": item.findtext(".//valueURI"),
-                "description": item.findtext("attributeDefinition"),
-                "measurementTechnique": get_methods(item),
-                "unitText": item.findtext(".//standardUnit")
-                or item.findtext(".//customUnit"),
-            }
-            property_value = {
-                key: value for key, value in property_value.items() if value is not None
-            }
-            variable_measured.append(property_value)
+        if self.streamed is not None:
+            variable_measured = self.streamed["attribute"]
+        else:
+            variable_measured = [
+                get_property_value(item)
+                for item in xpath(self.metadata, ".//attributeList/attribute")
+            ]
         return delete_null_values(variable_measured)
 
     def get_included_in_data_catalog(self) -> None:
@@ -159,26 +213,12 @@ class EML(StrategyInterface):
 
     def get_distribution(self) -> Union[list, None]:
         distribution = []
-        data_entities = [
-            "dataTable",
-            "spatialRaster",
-            "spatialVector",
-            "storedProcedure",
-            "view",
-            "otherEntity",
-        ]
-        for data_entity in data_entities:
-            for item in self.metadata.xpath(f".//{data_entity}"):
-                data_download = {
-                    "@type": "DataDownload",
-                    "name": item.findtext(".//entityName"),
-                    "description": item.findtext(".//entityDescription"),
-                    "contentSize": get_content_size(item),
-                    "contentUrl": get_content_url(item),
-                    "encodingFormat": get_data_entity_encoding_format(item),
-                    "spdx:checksum": get_checksum(item),
-                }
-                distribution.append(data_download)
+        for data_entity in DATA_ENTITIES:
+            if self.streamed is not None:
+                distribution.extend(self.streamed[data_entity])
+            else:
+                for item in xpath(self.metadata, f".//{data_entity}"):
+                    distribution.append(get_data_download(item))
         return delete_null_values(distribution)
 
     def get_potential_action(self) -> None:
@@ -189,6 +229,7 @@ class EML(StrategyInterface):
         date_created = None  # EML does not map to schema:dateCreated
         return delete_null_values(date_created)
 
+    @memoized
     def get_date_modified(self) -> Union[str, None]:
         date_modified = self.metadata.findtext(".//dataset/pubDate")
         return delete_null_values(date_modified)
@@ -202,11 +243,11 @@ class EML(StrategyInterface):
         return delete_null_values(expires)
 
     def get_temporal_coverage(self) -> Union[str, dict, None]:
-        range_of_dates = self.metadata.xpath(
-            ".//dataset/coverage/temporalCoverage/rangeOfDates"
+        range_of_dates = xpath(
+            self.metadata, ".//dataset/coverage/temporalCoverage/rangeOfDates"
         )
-        single_date_time = self.metadata.xpath(
-            ".//dataset/coverage/temporalCoverage/singleDateTime"
+        single_date_time = xpath(
+            self.metadata, ".//dataset/coverage/temporalCoverage/singleDateTime"
         )
         if range_of_dates:
             temporal_coverage = convert_range_of_dates(range_of_dates[0])
@@ -224,7 +265,7 @@ class EML(StrategyInterface):
 
     def get_spatial_coverage(self) -> Union[list, None]:
         geo = []
-        for item in self.metadata.xpath(".//dataset/coverage/geographicCoverage"):
+        for item in xpath(self.metadata, ".//dataset/coverage/geographicCoverage"):
             object_type = get_spatial_type(item)
             if object_type == "Point":
                 geo.append(get_point(item))
@@ -239,7 +280,7 @@ class EML(StrategyInterface):
 
     def get_creator(self) -> Union[list, None]:
         creator = []
-        creators = self.metadata.xpath(".//dataset/creator")
+        creators = xpath(self.metadata, ".//dataset/creator")
         for item in creators:
             creator.append(get_person_or_organization(item))  # can be either
         if len(creator) != 0:
@@ -277,7 +318,7 @@ class EML(StrategyInterface):
 
     def get_funding(self) -> Union[list, None]:
         funding = []
-        for item in self.metadata.xpath(".//dataset/project/award"):
+        for item in xpath(self.metadata, ".//dataset/project/award"):
             res = {
                 "@id": item.findtext("awardUrl"),
                 "@type": "MonetaryGrant",
@@ -306,11 +347,17 @@ class EML(StrategyInterface):
         was_revision_of = None  # EML does not map to prov:wasRevisionOf
         return delete_null_values(was_revision_of)
 
+    @memoized
     def get_was_derived_from(self) -> Union[list, None]:
         was_derived_from = []
-        datasource = self.metadata.xpath(".//dataSource")
-        for item in datasource:
-            url = item.findtext(".//distribution/online/url")
+        if self.streamed is not None:
+            urls = self.streamed["dataSource"]
+        else:
+            urls = [
+                item.findtext(".//distribution/online/url")
+                for item in xpath(self.metadata, ".//dataSource")
+            ]
+        for url in urls:
             if url:
                 was_derived_from.append({"@id": url})
         if len(was_derived_from) == 0:
@@ -329,6 +376,122 @@ class EML(StrategyInterface):
 # Below are utility functions for the EML strategy.
 
 
+def xpath(element: etree._Element, expression: str) -> list:
+    """
+    :param element: The XML element, or tree, to evaluate the expression on.
+    :param expression:  The XPath expression to evaluate.
+
+    :returns:   The result of evaluating the expression on `element`, using
+                its compiled form in `XPATHS`. Expressions not yet in `XPATHS`
+                are compiled and added to it on first use.
+    """
+    compiled = XPATHS.get(expression)
+    if compiled is None:
+        compiled = XPATHS[expression] = etree.XPath(expression)
+    return compiled(element)
+
+
+def get_property_value(attribute: etree._Element) -> dict:
+    """
+    :param attribute:   The EML attribute element to convert.
+
+    :returns:   The attribute as a schema:PropertyValue.
+    """
+    property_value = {
+        "@type": "PropertyValue",
+        "name": attribute.findtext("attributeName"),
+        "alternateName": attribute.findtext("attributeLabel"),
+        "propertyID": attribute.findtext(".//valueURI"),
+        "description": attribute.findtext("attributeDefinition"),
+        "measurementTechnique": get_methods(attribute),
+        "unitText": attribute.findtext(".//standardUnit")
+        or attribute.findtext(".//customUnit"),
+    }
+    property_value = {
+        key: value for key, value in property_value.items() if value is not None
+    }
+    return property_value
+
+
+def get_data_download(data_entity_element: etree._Element) -> dict:
+    """
+    :param data_entity_element: The EML data entity element to convert.
+
+    :returns:   The data entity as a schema:DataDownload.
+    """
+    data_download = {
+        "@type": "DataDownload",
+        "name": data_entity_element.findtext(".//entityName"),
+        "description": data_entity_element.findtext(".//entityDescription"),
+        "contentSize": get_content_size(data_entity_element),
+        "contentUrl": get_content_url(data_entity_element),
+        "encodingFormat": get_data_entity_encoding_format(data_entity_element),
+        "spdx:checksum": get_checksum(data_entity_element),
+    }
+    return data_download
+
+
+def iterparse_metadata(file: str) -> tuple:
+    """
+    :param file:    The path to the EML metadata file.
+
+    :returns:   A tuple of the metadata object as an XML tree, and a
+                dictionary of the values extracted while reading it. The
+                dictionary maps "attribute" to the attributes as
+                schema:PropertyValue, each of the `DATA_ENTITIES` to the data
+                entities of that type as schema:DataDownload, and "dataSource"
+                to the dataSource URLs (or None), all in document order.
+
+    Notes:
+        The file is read in a single streaming pass with
+        `lxml.etree.iterparse`. Each attribute (of an attributeList) and data
+        entity element is converted as soon as it has been read, and is then
+        cleared and removed from the tree, so the bulk of a large document is
+        never held in memory at once. The remaining tree holds everything the
+        other getters need.
+
+        Elements inside, or containing, a dataSource element are converted
+        but kept in the tree, because the dataSource URL is looked up
+        anywhere within the dataSource subtree, which is only complete once
+        the dataSource element has been read.
+    """
+    streamed = {name: [] for name in ["attribute", *DATA_ENTITIES, "dataSource"]}
+    pending = {}  # elements awaiting their end event, and their position
+    pinned = set()  # elements containing a dataSource element
+    open_data_sources = 0
+    context = etree.iterparse(file, events=("start", "end"))
+    for event, element in context:
+        tag = element.tag
+        if event == "start":
+            parent = element.getparent()
+            if tag in streamed and (
+                tag != "attribute"
+                or (parent is not None and parent.tag == "attributeList")
+            ):
+                pending[element] = len(streamed[tag])
+                streamed[tag].append(None)
+            if tag == "dataSource":
+                open_data_sources += 1
+                pinned.update(element.iterancestors())
+            continue
+        if element not in pending:
+            continue
+        position = pending.pop(element)
+        if tag == "dataSource":
+            open_data_sources -= 1
+            url = element.findtext(".//distribution/online/url")
+            streamed[tag][position] = url
+            continue
+        if tag == "attribute":
+            streamed[tag][position] = get_property_value(element)
+        else:
+            streamed[tag][position] = get_data_download(element)
+        if open_data_sources == 0 and element not in pinned:
+            element.clear(keep_tail=True)
+            element.getparent().remove(element)
+    return context.root.getroottree(), streamed
+
+
 def get_content_size(data_entity_element: etree._Element) -> Union[str, None]:
     """
     :param data_entity_element:     The data entity element to get the content
@@ -336,7 +499,7 @@ def get_content_size(data_entity_element: etree._Element) -> Union[str, None]:
 
     :returns: The content size of a data entity element.
     """
-    size_element = data_entity_element.xpath(".//physical/size")
+    size_element = xpath(data_entity_element, ".//physical/size")
     if size_element:
         size = size_element[0].text
         unit = size_element[0].get("unit")
@@ -358,7 +521,7 @@ def get_content_url(data_entity_element: etree._Element) -> Union[str, None]:
         "information", the url elements value does not semantically match the
         SOSO contentUrl property definition and None is returned.
     """
-    url_element = data_entity_element.xpath(".//distribution/online/url")
+    url_element = xpath(data_entity_element, ".//distribution/online/url")
     if url_element:
         if url_element[0].get("function") != "information":
             return url_element[0].text
@@ -374,8 +537,8 @@ def convert_range_of_dates(range_of_dates: etree._Element) -> Union[str, dict, N
                 datetime, or a dict if it represents a geologic age. The dict
                 is formatted as an OWL-Time ProperInterval type.
     """
-    begin_date = range_of_dates.xpath(".//beginDate")
-    end_date = range_of_dates.xpath(".//endDate")
+    begin_date = xpath(range_of_dates, ".//beginDate")
+    end_date = xpath(range_of_dates, ".//endDate")
     if not begin_date or not end_date:
         return None
     begin_date = convert_single_date_time_type(begin_date[0])
@@ -425,7 +588,7 @@ def convert_single_date_time_type(
     """
     if len(single_date_time) == 0:
         return None
-    if len(single_date_time.xpath(".//alternativeTimeScale")) == 0:
+    if len(xpath(single_date_time, ".//alternativeTimeScale")) == 0:
         calendar_date = single_date_time.findtext(".//calendarDate")
         time = single_date_time.findtext(".//time")
         instant = (
@@ -470,7 +633,7 @@ def get_spatial_type(geographic_coverage: etree._Element) -> Union[str, None]:
     # point if the north and south bounding coordinates are equal and the east
     # and west bounding coordinates are equal. Otherwise, the object type is a
     # box.
-    if geographic_coverage.xpath(".//boundingCoordinates"):
+    if xpath(geographic_coverage, ".//boundingCoordinates"):
         west = geographic_coverage.findtext(".//westBoundingCoordinate")
         east = geographic_coverage.findtext(".//eastBoundingCoordinate")
         south = geographic_coverage.findtext(".//southBoundingCoordinate")
@@ -479,7 +642,7 @@ def get_spatial_type(geographic_coverage: etree._Element) -> Union[str, None]:
             spatial_type = "Point"
         else:
             spatial_type = "Box"
-    elif geographic_coverage.xpath(".//gRing"):
+    elif xpath(geographic_coverage, ".//gRing"):
         # The geographic coverage is a polygon if the gRing element is present.
         spatial_type = "Polygon"
     else:
@@ -646,20 +809,20 @@ def get_person_or_organization(responsible_party: etree._Element) -> dict:
         handles them both and determines which type to return based on the
         presence/absense of the individualName element.
     """
-    if responsible_party.xpath("individualName"):
+    if xpath(responsible_party, "individualName"):
         res = {
             "@type": "Person",
             "honorificPrefix": responsible_party.findtext("salutation"),
             "givenName": responsible_party.findtext("individualName/givenName"),
             "familyName": responsible_party.findtext("individualName/surName"),
             "url": responsible_party.findtext("onlineUrl"),
-            "identifier": convert_user_id(responsible_party.xpath("userId")),
+            "identifier": convert_user_id(xpath(responsible_party, "userId")),
         }
     else:
         res = {
             "@type": "Organization",
             "name": responsible_party.findtext("organizationName"),
-            "identifier": convert_user_id(responsible_party.xpath("userId")),
+            "identifier": convert_user_id(xpath(responsible_party, "userId")),
         }
     return res
 
@@ -683,7 +846,7 @@ def get_methods(xml: etree._Element) -> Union[str, None]:
                 removed, and leading and trailing whitespace removed. None if
                 the methods section is not found.
     """
-    methods = xml.xpath(".//methods")
+    methods = xpath(xml, ".//methods")
     if len(methods) == 0:
         return None
     methods = etree.tostring(methods[0], encoding="utf-8", method="text")
@@ -701,7 +864,7 @@ def get_checksum(data_entity_element: etree._Element) -> Union[list, None]:
                 spdx:algorithm. Otherwise None.
     """
     checksum = []
-    for item in data_entity_element.xpath(".//physical/authentication"):
+    for item in xpath(data_entity_element, ".//physical/authentication"):
         if item.get("method") is not None and "spdx.org" in item.get("method"):
             algorithm = item.get("method").split("#")[-1]
             res = {
@@ -725,10 +888,10 @@ def get_contributor_elements(metadata: etree.ElementTree) -> Union[list, None]:
     elements = ["contact", "associatedParty", "personnel"]
     contributors = []
     for element in elements:
-        xpath = ".//dataset/" + element
+        path = ".//dataset/" + element
         if element == "personnel":  # personnel are in project not dataset
-            xpath = ".//project/" + element  # nested projects are out of scope
-        for item in metadata.xpath(xpath):
+            path = ".//project/" + element  # nested projects are out of scope
+        for item in xpath(metadata, path):
             contributors.append(item)
     return contributors
 
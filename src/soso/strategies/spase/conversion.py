@@ -1,9 +1,17 @@
 """Converts SPASE records into schema.org JSON-LD files."""
 
+import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
+from multiprocessing import get_context
 from pathlib import Path
 import json
-from soso.main import convert
+from typing import Union
+from soso.main import convert_to_graph
+from soso.profiling import GetterProfile
+from soso.utilities import configure_http_cache, get_http_cache, ProblemCollector
 from soso.strategies.spase.spase import (
     get_temporal,
     get_measurement_method,
@@ -12,12 +20,28 @@ from soso.strategies.spase.spase import (
     get_mentions,
     get_is_part_of,
     get_instrument,
-    get_problematic_records,
+    configure_ignore_creator_split,
+    get_ignore_creator_split,
+    configure_person_index,
+    get_person_index,
+    configure_instrument_index,
+    get_instrument_index,
+    HTTP_FAILURE,
+    take_problematic_records,
+    take_linked_records,
 )
 
 # pylint: disable=too-many-locals
 # pylint: disable=raise-missing-from
 # pylint: disable=too-many-statements
+# pylint: disable=too-many-branches
+
+# manifest of the records converted by main, for incremental runs
+MANIFEST_PATH = "./SPASE_JSONs/manifest.json"
+# reverse-dependency index of the manifest, for finding the JSONs to rebuild
+DEPENDENTS_PATH = "./SPASE_JSONs/dependents.json"
+# getter statistics of the records converted by main, when profiling
+PROFILE_PATH = "./SPASE_JSONs/profile.json"
 
 
 def get_paths(entry: str, paths: list) -> list:
@@ -103,10 +127,10 @@ def find_requirements(folder: str) -> None:
                 test_spase.get_creator()
                 test_spase.get_contributor()
                 try:
-                    get_instrument(test_spase.metadata, record)
-                    # get_observatory(test_spase.metadata, record)
-                    get_is_part_of(test_spase.metadata, record)
-                    get_mentions(test_spase.metadata, record)
+                    get_instrument(test_spase.metadata, record, test_spase.index)
+                    # get_observatory(test_spase.metadata, record, test_spase.index)
+                    get_is_part_of(test_spase.metadata, record, test_spase.index)
+                    get_mentions(test_spase.metadata, record, test_spase.index)
                     test_spase.get_was_revision_of()
                     test_spase.get_is_based_on()
                 # to ensure that main script will still run in
@@ -148,7 +172,244 @@ def make_json_path(record: str) -> tuple[str, str]:
     return path_to_file, file_name
 
 
-def main(folder: str, additional_license_info: bool = None) -> None:
+def hash_file(path: str, hashes: dict = None) -> Union[str, None]:
+    """
+    :param path: The path of the file to hash.
+    :param hashes: An optional dictionary of the hashes already computed, by path.
+        Used to look up and store the hash.
+
+    :returns: The SHA-256 hash of the contents of the file, or None if the file
+        does not exist.
+    """
+    if hashes is not None and path in hashes:
+        return hashes[path]
+    try:
+        with open(path, "rb") as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        file_hash = None
+    if hashes is not None:
+        hashes[path] = file_hash
+    return file_hash
+
+
+def load_manifest(manifest_path: str = MANIFEST_PATH) -> dict:
+    """
+    :param manifest_path: The path of the manifest written by main.
+
+    :returns: The manifest of the records converted by main, by record path. Each
+        entry holds the hash of the record, its output path, the hashes of the
+        linked records it depended on, the problematic records found, and the
+        additional license info used. Empty if there is no manifest yet.
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(manifest: dict, manifest_path: str = MANIFEST_PATH) -> None:
+    """
+    :param manifest: The manifest of the records converted, as from load_manifest,
+        or its reverse-dependency index, as from build_dependents.
+    :param manifest_path: The path to write the manifest to. Its folder is
+        created if needed, e.g. when no JSON was written before.
+    """
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=3, sort_keys=True)
+
+
+def build_dependents(manifest: dict) -> dict:
+    """
+    :param manifest: The manifest of the records converted, as from load_manifest.
+
+    :returns: The reverse-dependency index of the manifest: for each file (by
+        resolved path) that a JSON was made from, the records whose JSON it was used
+        for. This includes each record itself and every linked record it
+        depended on, whether directly or through another linked record.
+    """
+    dependents = {}
+    for record, entry in manifest.items():
+        for source in [str(Path(record).resolve()), *entry["dependencies"]]:
+            dependents.setdefault(source, []).append(record)
+    return {source: sorted(records) for source, records in dependents.items()}
+
+
+def find_outputs_to_rebuild(
+    changed: list, manifest_path: str = MANIFEST_PATH, dependents_path: str = None
+) -> dict:
+    """
+    Answers which JSONs written by main must be rebuilt if the given files changed,
+    using the reverse-dependency index saved by main.
+
+    :param changed: The paths of the changed (or added, or deleted) files.
+    :param manifest_path: The path of the manifest written by main.
+    :param dependents_path: The path of the reverse-dependency index written by
+        main. Defaults to DEPENDENTS_PATH in the directory of the manifest.
+
+    :returns: The records to convert again, mapped to the paths of their JSONs,
+        in sorted order.
+    """
+    manifest = load_manifest(manifest_path)
+    if dependents_path is None:
+        dependents_path = Path(manifest_path).with_name(Path(DEPENDENTS_PATH).name)
+    try:
+        with open(dependents_path, "r", encoding="utf-8") as f:
+            dependents = json.load(f)
+    except FileNotFoundError:
+        dependents = build_dependents(manifest)
+    records = {
+        record
+        for file in changed
+        for record in dependents.get(str(Path(file).resolve()), [])
+    }
+    # records of the index missing from the manifest, e.g. after an interrupted
+    #   run, have no JSON to rebuild
+    return {
+        record: manifest[record]["output"]
+        for record in sorted(records)
+        if record in manifest
+    }
+
+
+def is_up_to_date(
+    record: str, entry: dict, additional_license_info: list, hashes: dict
+) -> bool:
+    """
+    :param record: The absolute path of the SPASE record.
+    :param entry: The manifest entry of the record, or None if it has none.
+    :param additional_license_info: The additional license info given to main.
+    :param hashes: A dictionary of the file hashes already computed, by path.
+
+    :returns: Whether the record, and every linked record it depended on, is
+        unchanged since its JSON was written, and the JSON still exists.
+    """
+    return (
+        entry is not None
+        and entry["additional_license_info"] == additional_license_info
+        and os.path.isfile(entry["output"])
+        and entry["hash"] == hash_file(record, hashes)
+        and all(
+            file_hash == hash_file(dependency, hashes)
+            for dependency, file_hash in entry["dependencies"].items()
+        )
+    )
+
+
+def init_worker(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    http_cache_directory: Union[str, None],
+    http_cache_ttl: float,
+    http_cache_offline: bool,
+    ignore_creator_split: frozenset,
+    person_index: Union[str, None] = None,
+    instrument_index: Union[str, None] = None,
+) -> None:
+    """
+    Configures a worker process of main as the main process is configured.
+
+    :param http_cache_directory: The directory of the HTTP cache, as for
+        configure_http_cache.
+    :param http_cache_ttl: The time to live of the HTTP cache.
+    :param http_cache_offline: Whether the HTTP cache is offline.
+    :param ignore_creator_split: The records whose creators are not split, as from
+        get_ignore_creator_split.
+    :param person_index: The database of the index of Person records, as for
+        configure_person_index.
+    :param instrument_index: The database of the index of the hierarchy of
+        instruments and observatories, as for configure_instrument_index.
+    """
+    configure_http_cache(http_cache_directory, http_cache_ttl, http_cache_offline)
+    configure_ignore_creator_split(ignore_creator_split)
+    configure_person_index(person_index)
+    configure_instrument_index(instrument_index)
+
+
+def convert_record(
+    record: str, additional_license_info: list = None, profile: bool = False
+) -> tuple[dict, list, list, Union[dict, None]]:
+    """
+    Scrapes all desired metadata from the given SPASE record and creates its schema.org
+    JSON. Runs in a worker process when main is given more than one worker.
+
+    :param record: The absolute path of the SPASE record to convert.
+    :param additional_license_info: An optional argument used to pass an additional
+        metadata license, as described for main.
+    :param profile: Whether to record the wall time, calls and I/O of the getters
+        called to convert the record.
+
+    :returns: The schema.org JSON as a dictionary, the problems found while
+        converting the record, as from take_problematic_records, the list of linked
+        records the
+        conversion depended on, including those that could not be found, and the
+        getter statistics as a dictionary from GetterProfile.as_dict, or None if
+        not profiling.
+    """
+    # scrape metadata for the record
+    test_spase = SPASE(record)
+    # if more licenseInfo is given, overwrite the subjectOf function to reflect that
+    if additional_license_info:
+        subject_of = test_spase.get_subject_of(*additional_license_info)
+    temporal = get_temporal(
+        test_spase.metadata, test_spase.namespaces, test_spase.index
+    )
+    alternate_name = get_alternate_name(test_spase.metadata, test_spase.index)
+    in_language = "en"
+    mentions = get_mentions(test_spase.metadata, record, index=test_spase.index)
+    is_part_of = get_is_part_of(test_spase.metadata, record, index=test_spase.index)
+    measurement_method = get_measurement_method(
+        test_spase.metadata, test_spase.namespaces, test_spase.index
+    )
+
+    # additional schema.org properties not supported by SOSO
+    kwargs = {
+        "temporal": temporal,
+        "alternateName": alternate_name,
+        "inLanguage": in_language,
+        "mentions": mentions,
+        "isPartOf": is_part_of,
+        "measurementMethod": measurement_method,
+    }
+    if additional_license_info:
+        kwargs["subjectOf"] = subject_of
+
+    # create schema.org JSON
+    getter_profile = GetterProfile() if profile else None
+    updated_dict = convert_to_graph(
+        file=record, strategy="SPASE", profile=getter_profile
+    )
+    # add sosa ontology to json "@context"
+    updated_dict["@context"]["sosa"] = "https://w3c.github.io/sdw-sosa-ssn/ssn/#SOSA"
+    # update json to include nonSOSO-supported fields
+    updated_dict.update(kwargs)
+    problems = take_problematic_records()
+    missing_records = [
+        problem["subject"]
+        for problem in problems
+        if problem["category"] != HTTP_FAILURE
+    ]
+    dependencies = [
+        str(Path(linked_record).resolve())
+        for linked_record in take_linked_records() + missing_records
+    ]
+    dependencies = [
+        linked_record
+        for linked_record in dict.fromkeys(dependencies)
+        if linked_record != str(Path(record).resolve())
+    ]
+    if getter_profile is not None:
+        getter_profile = getter_profile.as_dict()
+    return updated_dict, problems, dependencies, getter_profile
+
+
+def main(
+    folder: str,
+    additional_license_info: bool = None,
+    workers: int = 1,
+    incremental: bool = False,
+    profile: bool = False,
+) -> None:
     """
     Scrapes all desired metadata from the given SPASE records and exports them as schema.org JSONs
     in the current working directory, following a similar directory structure as they appear in the
@@ -161,102 +422,153 @@ def main(folder: str, additional_license_info: bool = None) -> None:
         get_subject_of function in spase.py. The format should follow:
         [<full name> <identifier> <url>]. Refer to the spase-HowToConvert Jupyter notebook
         for more information.
+    :param workers: The number of processes converting records in parallel. Records are
+        converted one after another by default. The JSONs are written in the same order
+        either way.
+    :param incremental: Whether to skip records whose JSON was written by a previous
+        run and that, along with the linked records they depend on, have not changed
+        since. Runs record what they converted in a manifest in SPASE_JSONs.
+    :param profile: Whether to record the wall time, calls and I/O of the getters
+        called to convert the records, aggregated over all records and workers, in
+        profile.json in SPASE_JSONs.
     """
     # run pre-script which informs user which repos are needed for the main script
     find_requirements(folder)
     input("Once these are cloned, type anything to begin the main script. ")
+    # records are checked again as they are converted, so only report those
+    take_problematic_records()
+    take_linked_records()
 
-    # list that holds SPASE records already checked
-    searched = []
-
-    # obtains all filepaths to all SPASE records found in given directory
+    # obtains all filepaths to all SPASE records found in given directory,
+    #   skipping records already listed
     spase_paths = []
-    spase_paths = get_paths(folder, spase_paths)
+    spase_paths = list(dict.fromkeys(get_paths(folder, spase_paths)))
     # print("You entered " + folder)
-    num = 0
-    problematic_records = ""
+    problematic_records = {}
+    getter_profile = GetterProfile()
+    # records converted before, and the hashes of files checked in this run
+    manifest = load_manifest()
+    # forget the records deleted since they were converted, and delete their
+    #   JSONs; those of other folders, converted by other runs, are kept
+    spase_set = set(spase_paths)
+    for record in list(manifest):
+        if record not in spase_set and not os.path.isfile(record):
+            if os.path.isfile(manifest[record]["output"]):
+                os.remove(manifest[record]["output"])
+            del manifest[record]
+    hashes = {}
+    if incremental:
+        skipped = {
+            record
+            for record in spase_paths
+            if is_up_to_date(
+                record, manifest.get(record), additional_license_info, hashes
+            )
+        }
+        for record in skipped:
+            problematic_records[record] = manifest[record]["problems"]
+        records = [record for record in spase_paths if record not in skipped]
+    else:
+        records = spase_paths
 
     if len(spase_paths) == 0:
         print(
             "No records found. Make sure the directory path is correct and try again."
         )
     else:
-        # iterate through all SPASE records
-        for r, record in enumerate(spase_paths):
-            if record not in searched:
-                # print name and number of record being scraped
-                status_message = f"\r\033[KExtracting metadata from record {r+1}"
-                status_message += f" of {len(spase_paths)}"
-                print(status_message, end="")
-                # print(record)
-                print()
-                num = r
-
-                # create path to schema.org output json
-                path_to_file, file_name = make_json_path(record)
-
-                # scrape metadata for each record
-                test_spase = SPASE(record)
-                # if more licenseInfo is given, overwrite the subjectOf function to reflect that
-                if additional_license_info:
-                    subject_of = test_spase.get_subject_of(*additional_license_info)
-                temporal = get_temporal(test_spase.metadata, test_spase.namespaces)
-                alternate_name = get_alternate_name(test_spase.metadata)
-                in_language = "en"
-                mentions = get_mentions(test_spase.metadata, record)
-                is_part_of = get_is_part_of(test_spase.metadata, record)
-                measurement_method = get_measurement_method(
-                    test_spase.metadata, test_spase.namespaces
+        http_cache = get_http_cache()
+        # the manifest is saved even if a record fails to convert, so the
+        #   records converted before it are skipped by the next incremental run
+        try:
+            # workers are spawned rather than forked so that each one starts with
+            #   an empty collector of problematic records, and share the HTTP
+            #   cache, the list of records whose creators are not split and the
+            #   indexes of linked records
+            with (
+                ProcessPoolExecutor(
+                    workers,
+                    mp_context=get_context("spawn"),
+                    initializer=init_worker,
+                    initargs=(
+                        http_cache.directory,
+                        http_cache.ttl,
+                        http_cache.offline,
+                        get_ignore_creator_split(),
+                        get_person_index().database,
+                        get_instrument_index().database,
+                    ),
                 )
-                problematic_records = get_problematic_records()
-                # add record to searched
-                searched.append(record)
-
-                # additional schema.org properties not supported by SOSO
-                kwargs = {
-                    "temporal": temporal,
-                    "alternateName": alternate_name,
-                    "inLanguage": in_language,
-                    "mentions": mentions,
-                    "isPartOf": is_part_of,
-                    "measurementMethod": measurement_method,
-                }
-                if additional_license_info:
-                    kwargs["subjectOf"] = subject_of
-
-                # create schema.org JSON
-                creation = convert(file=record, strategy="SPASE")
-                updated_dict = json.loads(creation)
-                # add sosa ontology to json "@context"
-                updated_dict["@context"][
-                    "sosa"
-                ] = "https://w3c.github.io/sdw-sosa-ssn/ssn/#SOSA"
-                # update json to include nonSOSO-supported fields
-                updated_dict.update(kwargs)
-
-                # create json file using the result from convert method
-                with open(
-                    f"./SPASE_JSONs/{path_to_file}/{file_name}.json",
-                    "w",
-                    encoding="utf-8",
-                ) as f:
-                    json.dump(updated_dict, f, indent=3, sort_keys=True)
-
-                # if wish to see python printout instead
-                # from pprint import pprint
-                # finalDict = updated_dict | kwargs
-                # pprint(finalDict)
-        print(f"{num + 1} records successfully converted to schema.org JSONs")
+                if workers > 1
+                else nullcontext()
+            ) as executor:
+                results = (executor.map if executor else map)(
+                    convert_record,
+                    records,
+                    repeat(additional_license_info),
+                    repeat(profile),
+                )
+                # results arrive in the order of records
+                for r, (
+                    record,
+                    (updated_dict, problems, dependencies, record_profile),
+                ) in enumerate(zip(records, results)):
+                    # print name and number of record scraped
+                    status_message = f"\r\033[KExtracting metadata from record {r+1}"
+                    status_message += f" of {len(records)}"
+                    print(status_message, end="")
+                    # print(record)
+                    print()
+
+                    # create path to schema.org output json
+                    path_to_file, file_name = make_json_path(record)
+
+                    # create json file using the result from convert method
+                    output = f"./SPASE_JSONs/{path_to_file}/{file_name}.json"
+                    with open(output, "w", encoding="utf-8") as f:
+                        json.dump(updated_dict, f, indent=3, sort_keys=True)
+                    problematic_records[record] = problems
+                    # record what the JSON was made from
+                    manifest[record] = {
+                        "hash": hash_file(record),
+                        "output": output,
+                        "dependencies": {
+                            dependency: hash_file(dependency, hashes)
+                            for dependency in dependencies
+                        },
+                        "problems": problems,
+                        "additional_license_info": additional_license_info,
+                    }
+                    if record_profile is not None:
+                        getter_profile.merge(record_profile)
+
+                    # if wish to see python printout instead
+                    # from pprint import pprint
+                    # pprint(updated_dict)
+        finally:
+            save_manifest(manifest)
+            save_manifest(build_dependents(manifest), DEPENDENTS_PATH)
+        if profile:
+            with open(PROFILE_PATH, "w", encoding="utf-8") as f:
+                json.dump(getter_profile.as_dict(), f, indent=3, sort_keys=True)
+        print(f"{len(records)} records successfully converted to schema.org JSONs")
+        if incremental:
+            print(f"{len(spase_paths) - len(records)} unchanged records were skipped")
+        # report problems in the order of spase_paths
+        run_problems = ProblemCollector()
+        for record in spase_paths:
+            run_problems.merge(problematic_records[record])
+        problematic_records = ", ".join(run_problems.subjects())
         # print(problematic_records)
-        if problematic_records:
-            if "," in problematic_records:
-                num_of_problems = problematic_records.count(",") + 1
-            else:
-                num_of_problems = 1
-        else:
-            num_of_problems = 0
+        num_of_problems = len(run_problems.subjects())
         # Let user know which SPASE records caused issues for further analysis
         if num_of_problems > 0:
+            print(
+                "Problems by category: "
+                + ", ".join(
+                    f"{category}: {count}"
+                    for category, count in run_problems.counts().items()
+                )
+            )
             print(
                 f"The script had issues accessing {num_of_problems} of these files,"
                 + f" which are: {problematic_records}"
@@ -284,12 +596,35 @@ if __name__ == "__main__":
             " that you want to create schema.org JSONs for as an argument"
         )
     else:
+        # optional "--workers N" to convert records in N processes
+        WORKERS = int(argv[argv.index("--workers") + 1]) if "--workers" in argv else 1
+        if "--workers" in argv:
+            del argv[argv.index("--workers") : argv.index("--workers") + 2]
+        # optional "--incremental" to skip records unchanged since the last run
+        INCREMENTAL = "--incremental" in argv
+        if INCREMENTAL:
+            argv.remove("--incremental")
+        # optional "--profile" to record getter statistics in SPASE_JSONs
+        PROFILE = "--profile" in argv
+        if PROFILE:
+            argv.remove("--profile")
         if len(argv) == 2 and argv[1] == "--help":
             print(help(main))
         else:
             if "\\" in str(argv[1]):
                 argv[1] = argv[1].replace("\\", "/")
             if len(argv) > 2:
-                main(argv[1], [argv[2], argv[3], argv[4]])
+                main(
+                    argv[1],
+                    [argv[2], argv[3], argv[4]],
+                    WORKERS,
+                    INCREMENTAL,
+                    PROFILE,
+                )
             else:
-                main(argv[1])
+                main(
+                    argv[1],
+                    workers=WORKERS,
+                    incremental=INCREMENTAL,
+                    profile=PROFILE,
+                )
@@ -0,0 +1,229 @@
+"""Generates synthetic SPASE corpora for scale testing."""
+
+import importlib.resources
+import random
+from copy import deepcopy
+from pathlib import Path
+from typing import Union
+from lxml import etree
+
+# pylint: disable=too-many-arguments
+# pylint: disable=too-many-locals
+
+# The records the records of each resource type are derived from, in the
+# corpus_templates folder of the package, copied from tests/data/spase
+TEMPLATES = {
+    "NumericalData": "spase-PT8S.xml",
+    "Person": "spase-David.T.Young.xml",
+    "Instrument": "spase-FGM.xml",
+    "Observatory": "spase-MMS-4.xml",
+    "ObservatoryGroup": "spase-MMS.xml",
+}
+
+# The roles given to the contacts of a record, in turn
+ROLES = ["PrincipalInvestigator", "CoInvestigator", "MetadataContact"]
+
+# The types given to the associations of a NumericalData record, in turn
+ASSOCIATION_TYPES = ["DerivedFrom", "RevisionOf", "PartOf", "Other"]
+
+
+def generate_corpus(
+    home: Union[str, Path],
+    *,
+    records: int = 1000,
+    persons: int = 100,
+    instruments: int = 20,
+    observatories: int = 10,
+    observatory_groups: int = 2,
+    contacts_per_record: int = 4,
+    instruments_per_record: int = 1,
+    associations_per_record: int = 1,
+    templates: Union[str, Path, None] = None,
+    seed: int = 0,
+) -> list[str]:
+    """
+    Writes a synthetic corpus of SPASE NumericalData records, and the Person,
+    Instrument, Observatory and ObservatoryGroup records they link to, laid
+    out in `home` as in clones of the NASA and SMWG SPASE repositories. With
+    `home` as the home directory, the records convert without network access,
+    and the linked records are found as they would be in the real
+    repositories.
+
+    :param home: The home directory to write the corpus to.
+    :param records: The number of NumericalData records.
+    :param persons: The number of Person records.
+    :param instruments: The number of Instrument records.
+    :param observatories: The number of Observatory records.
+    :param observatory_groups: The number of ObservatoryGroup records.
+    :param contacts_per_record: The number of Person records each record
+        links to as a contact.
+    :param instruments_per_record: The number of Instrument records each
+        NumericalData record links to.
+    :param associations_per_record: The number of other NumericalData records
+        each NumericalData record links to as an association.
+    :param templates: The directory holding the records in `TEMPLATES`. The
+        records bundled with the package are used if None.
+    :param seed: The seed choosing which records link to which, so the same
+        arguments write the same corpus.
+
+    :returns: The paths of the NumericalData records, which are all in the
+        folder ``NASA/NumericalData/Synthetic`` of `home`.
+
+    Notes:
+        Instruments are spread evenly over observatories, and observatories
+        over observatory groups. Other links are chosen at random. The
+        NumericalData records have no DOI, so their related records are
+        identified by spase-metadata.org URLs, which are not looked up.
+    """
+    rng = random.Random(seed)
+    ids = {
+        "Person": [
+            f"spase://SMWG/Person/Synthetic.P.Person{number}"
+            for number in range(persons)
+        ],
+        "ObservatoryGroup": [
+            f"spase://SMWG/Observatory/Synthetic{number}"
+            for number in range(observatory_groups)
+        ],
+        "Observatory": [
+            f"spase://SMWG/Observatory/Synthetic{number % observatory_groups}/{number}"
+            for number in range(observatories)
+        ],
+        "Instrument": [
+            f"spase://SMWG/Instrument/Synthetic/Instrument{number}"
+            for number in range(instruments)
+        ],
+        "NumericalData": [
+            f"spase://NASA/NumericalData/Synthetic/Record{number}"
+            for number in range(records)
+        ],
+    }
+    if templates is None:
+        templates = importlib.resources.files("soso.strategies.spase").joinpath(
+            "corpus_templates"
+        )
+    paths = []
+    for resource_type, resource_ids in ids.items():
+        template = etree.parse(str(Path(templates, TEMPLATES[resource_type])))
+        for number, resource_id in enumerate(resource_ids):
+            tree = deepcopy(template)
+            resource = _find(tree, "ResourceID").getparent()
+            _find(resource, "ResourceID").text = resource_id
+            if resource_type == "Person":
+                _find(resource, "PersonName").text = f"Synthetic P. Person{number}"
+                _find(resource, "ORCIdentifier").text = f"0000-0000-0000-{number:04d}"
+                _find(resource, "OrganizationName").text = (
+                    f"Synthetic Organization {number % 10}"
+                )
+            else:
+                _find(resource, "ResourceName").text = (
+                    f"Synthetic {resource_type} {number}"
+                )
+                contacts = rng.sample(ids["Person"], contacts_per_record)
+                _set_contacts(resource, contacts)
+            if resource_type == "Observatory":
+                _find(resource, "ObservatoryGroupID").text = ids["ObservatoryGroup"][
+                    number % observatory_groups
+                ]
+            elif resource_type == "Instrument":
+                _find(resource, "ObservatoryID").text = ids["Observatory"][
+                    number % observatories
+                ]
+            elif resource_type == "NumericalData":
+                doi = _find(resource, "DOI")
+                doi.getparent().remove(doi)
+                # the author is the first contact, a PrincipalInvestigator
+                *_, author = contacts[0].rpartition(".")
+                _find(resource, "Authors").text = f"{author}, Synthetic, P."
+                _set_links(
+                    resource,
+                    "InstrumentID",
+                    rng.sample(ids["Instrument"], instruments_per_record),
+                )
+                others = (
+                    ids["NumericalData"][:number] + ids["NumericalData"][number + 1 :]
+                )
+                _set_associations(resource, rng.sample(others, associations_per_record))
+            path = Path(home, resource_id.replace("spase://", "") + ".xml")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tree.write(str(path), encoding="utf-8", xml_declaration=True)
+            if resource_type == "NumericalData":
+                paths.append(str(path))
+    return paths
+
+
+def _find(element: etree._Element, name: str) -> etree._Element:
+    """
+    :param element: The element, or tree, to search.
+    :param name: The local name of the element to find.
+
+    :returns: The first descendant of `element` named `name`, in the SPASE
+        namespace.
+    """
+    return element.find(f".//{{*}}{name}")
+
+
+def _set_contacts(resource: etree._Element, person_ids: list) -> None:
+    """
+    Replaces the contacts of a resource with contacts of the given persons,
+    with roles taken from `ROLES` in turn.
+
+    :param resource: The resource element, e.g. NumericalData.
+    :param person_ids: The IDs of the Person records of the contacts.
+    """
+    contacts = resource.findall("{*}ResourceHeader/{*}Contact")
+    for contact in contacts[1:]:
+        contact.getparent().remove(contact)
+    template = anchor = contacts[0]
+    for number, person_id in enumerate(person_ids):
+        contact = deepcopy(template)
+        _find(contact, "PersonID").text = person_id
+        _find(contact, "Role").text = ROLES[number % len(ROLES)]
+        anchor.addnext(contact)
+        anchor = contact
+    template.getparent().remove(template)
+
+
+def _set_links(resource: etree._Element, name: str, linked_ids: list) -> None:
+    """
+    Replaces the elements of a resource linking to other records.
+
+    :param resource: The resource element, e.g. NumericalData.
+    :param name: The local name of the linking elements, e.g. InstrumentID.
+    :param linked_ids: The IDs of the linked records.
+    """
+    links = resource.findall(f"{{*}}{name}")
+    for link in links[1:]:
+        resource.remove(link)
+    template = anchor = links[0]
+    for linked_id in linked_ids:
+        link = deepcopy(template)
+        link.text = linked_id
+        anchor.addnext(link)
+        anchor = link
+    resource.remove(template)
+
+
+def _set_associations(resource: etree._Element, associated_ids: list) -> None:
+    """
+    Adds associations to other records to the header of a resource, with
+    types taken from `ASSOCIATION_TYPES` in turn.
+
+    :param resource: The resource element, e.g. NumericalData.
+    :param associated_ids: The IDs of the associated records.
+    """
+    header = resource.find("{*}ResourceHeader")
+    namespace = etree.QName(header).namespace
+    anchor = header.findall("{*}Contact")[-1]
+    for information_url in header.findall("{*}InformationURL"):
+        anchor = information_url
+    for number, associated_id in enumerate(associated_ids):
+        association = etree.Element(f"{{{namespace}}}Association")
+        association_id = etree.SubElement(association, f"{{{namespace}}}AssociationID")
+        association_id.text = associated_id
+        association_type = etree.SubElement(
+            association, f"{{{namespace}}}AssociationType"
+        )
+        association_type.text = ASSOCIATION_TYPES[number % len(ASSOCIATION_TYPES)]
+        anchor.addnext(association)
+        anchor = association
@@ -1,18 +1,26 @@
 """The SPASE strategy module."""
 
-import atexit
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 import json
 import re
 import os
-import tempfile
 import importlib.resources
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Union, List, Dict
-import requests
+from typing import Iterable, Union, List, Dict
 from lxml import etree
-from soso.interface import StrategyInterface
-from soso.utilities import delete_null_values
+from soso.interface import StrategyInterface, memoized
+from soso.utilities import (
+    CachedResponse,
+    delete_null_values,
+    get_http_cache,
+    HTTP_POOL_SIZE,
+    ProblemCollector,
+)
 
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-lines
@@ -31,20 +39,33 @@ from soso.utilities import delete_null_values
 # pylint: disable=consider-using-with
 
 
-# create temp file which holds problematic records encountered during script
-# Create a named temporary file which is deleted via garbage collection
-temp_file = tempfile.NamedTemporaryFile(mode="w+", encoding="utf-8")
-temp_file_path = temp_file.name
-# print("Temp file exists?: " + str(os.path.exists(temp_file_path)) + ':' + temp_file_path)
+# categories of the problems found while converting records
+MISSING_PERSON = "missing Person"
+MISSING_INSTRUMENT = "missing Instrument"
+MISSING_OBSERVATORY = "missing Observatory"
+MISSING_OBSERVATORY_GROUP = "missing ObservatoryGroup"
+MISSING_RELATED_RECORD = "missing related record"
+HTTP_FAILURE = "HTTP failure"
 
+# problems found while converting records in this process
+problem_collector = ProblemCollector()
 
-def cleanup_temp_file():
-    """Cleanup the temporary file on exit."""
-    if not temp_file.closed:
-        temp_file.close()
 
+def add_problematic_record(record: str, category: str) -> None:
+    """
+    Adds a problem found while converting a record to problem_collector.
+
+    :param record: What the problem is about, e.g. the path of the linked
+        record that could not be found, or the URL that could not be fetched.
+    :param category: The category of the problem, one of MISSING_PERSON,
+        MISSING_INSTRUMENT, MISSING_OBSERVATORY, MISSING_OBSERVATORY_GROUP,
+        MISSING_RELATED_RECORD and HTTP_FAILURE.
+    """
+    problem_collector.add(category, record)
 
-atexit.register(cleanup_temp_file)
+
+# DataCite API queried by verify_type for the metadata of non-SPASE DOIs
+DATACITE_API = "https://api.datacite.org/application/vnd.datacite.datacite+json/"
 
 
 class SPASE(StrategyInterface):
@@ -95,19 +116,34 @@ class SPASE(StrategyInterface):
             if "spase-group" in ns:
                 namespace = ns
         self.namespaces = {"spase": namespace}
+        # walk the tree once, so getters can look up elements by tag name
+        self.index = SpaseIndex(self.metadata)
         # find element in tree to iterate over
-        for elt in self.root.iter(tag=etree.Element):
-            if (
-                elt.tag.endswith("NumericalData")
-                or elt.tag.endswith("DisplayData")
-                or elt.tag.endswith("Observatory")
-                or elt.tag.endswith("Instrument")
-                or elt.tag.endswith("Collection")
-            ):
-                self.desired_root = elt
+        desired_root = self.index.last(
+            "NumericalData", "DisplayData", "Observatory", "Instrument", "Collection"
+        )
+        if desired_root is not None:
+            self.desired_root = desired_root
         # if want to see entire xml file as a string
         # print(etree.tostring(self.desired_root, pretty_print = True).decode(), end=' ')
 
+    @memoized
+    def _get_authors(self, file: str = "PlaceholderText") -> tuple:
+        """
+        :param file: The path of the SPASE record, as for get_authors.
+
+        :returns: The results of get_authors for the record, computed once.
+        """
+        return get_authors(self.metadata, file, self.index)
+
+    @memoized
+    def _get_access_urls(self) -> tuple[Dict, Dict]:
+        """
+        :returns: The results of get_access_urls for the record, computed once.
+        """
+        return get_access_urls(self.metadata, self.index)
+
+    @memoized
     def get_id(self) -> str:
         # Mapping: schema:identifier = spase:ResourceHeader/spase:DOI
         #   OR spase-metadata.org landing page for the SPASE record
@@ -121,41 +157,24 @@ class SPASE(StrategyInterface):
 
     def get_name(self) -> str:
         # Mapping: schema:name = spase:ResourceHeader/spase:ResourceName
-        desired_tag = self.desired_root.tag.split("}")
-        spase_location = (
-            ".//spase:" + f"{desired_tag[1]}/spase:ResourceHeader/spase:ResourceName"
-        )
-        name = self.metadata.findtext(
-            spase_location,
-            namespaces=self.namespaces,
-        )
+        desired_tag = local_name(self.desired_root)
+        name = self.index.findtext(desired_tag, "ResourceHeader", "ResourceName")
         return delete_null_values(name)
 
     def get_description(self) -> str:
         # Mapping: schema:description = spase:ResourceHeader/spase:Description
-        desired_tag = self.desired_root.tag.split("}")
-        spase_location = (
-            ".//spase:" + f"{desired_tag[1]}/spase:ResourceHeader/spase:Description"
-        )
-        description = self.metadata.findtext(
-            spase_location,
-            namespaces=self.namespaces,
-        )
+        desired_tag = local_name(self.desired_root)
+        description = self.index.findtext(desired_tag, "ResourceHeader", "Description")
         return delete_null_values(description)
 
+    @memoized
     def get_url(self) -> str:
         # Mapping: schema:url = spase:ResourceHeader/spase:DOI
         #   (or https://spase-metadata.org landing page, if no DOI)
-        desired_tag = self.desired_root.tag.split("}")
-        spase_location = (
-            ".//spase:" + f"{desired_tag[1]}/spase:ResourceHeader/spase:DOI"
-        )
-        url = self.metadata.findtext(
-            spase_location,
-            namespaces=self.namespaces,
-        )
+        desired_tag = local_name(self.desired_root)
+        url = self.index.findtext(desired_tag, "ResourceHeader", "DOI")
         if delete_null_values(url) is None:
-            resource_id = get_resource_id(self.metadata, self.namespaces)
+            resource_id = get_resource_id(self.metadata, self.namespaces, self.index)
             if resource_id:
                 url = resource_id.replace("spase://", "https://spase-metadata.org/")
         return delete_null_values(url)
@@ -164,10 +183,9 @@ class SPASE(StrategyInterface):
         # Mapping: schema:sameAs = spase:ResourceHeader/spase:PriorID
         same_as = []
 
-        # traverse xml to extract needed info
-        for child in self.desired_root.iter(tag=etree.Element):
-            if child.tag.endswith("PriorID"):
-                same_as.append(child.text)
+        # look up needed info in the index
+        for child in self.index.iter("PriorID", within=self.desired_root):
+            same_as.append(child.text)
         if not same_as:
             same_as = None
         elif len(same_as) == 1:
@@ -206,10 +224,9 @@ class SPASE(StrategyInterface):
         # Mapping: schema:keywords = spase:Keyword
         keywords = []
 
-        # traverse xml to extract needed info
-        for child in self.desired_root.iter(tag=etree.Element):
-            if child.tag.endswith("Keyword"):
-                keywords.append(child.text)
+        # look up needed info in the index
+        for child in self.index.iter("Keyword", within=self.desired_root):
+            keywords.append(child.text)
         if not keywords:
             keywords = None
         return delete_null_values(keywords)
@@ -222,7 +239,7 @@ class SPASE(StrategyInterface):
         # Uses identifier scheme URI, provided at: https://schema.org/identifier
         #  OR schema:PropertyValue, provided at: https://schema.org/PropertyValue
         url = self.get_url()
-        spase_id = get_resource_id(self.metadata, self.namespaces)
+        spase_id = get_resource_id(self.metadata, self.namespaces, self.index)
         if url:
             # if SPASE record has a DOI
             if "doi" in url:
@@ -263,7 +280,7 @@ class SPASE(StrategyInterface):
     def get_citation(self) -> Union[List[Dict], None]:
         # Mapping: schema:citation = spase:ResourceHeader/spase:InformationURL
         citation = []
-        information_url = get_information_url(self.metadata)
+        information_url = get_information_url(self.metadata, self.index)
         if information_url:
             for each in information_url:
                 # most basic citation item
@@ -298,41 +315,39 @@ class SPASE(StrategyInterface):
         key = ""
         i = 0
 
-        # traverse xml to extract needed info
-        for child in self.desired_root.iter(tag=etree.Element):
-            if child.tag.endswith("Parameter"):
-                target_child = child
-                for child in target_child:
-                    units_found.append("")
-                    try:
-                        if child.tag.endswith("Name"):
-                            param_name = child.text
-                        elif child.tag.endswith("Description"):
-                            substring = child.text.split("\n", 1)
-                            param_desc = substring[0]
-                        elif child.tag.endswith("Units"):
-                            unit = child.text
-                            units_found[i] = unit
-                        elif child.tag.endswith("ParameterKey"):
-                            key = child.text
-                        # elif child.tag.endswith("ValidMin"):
-                        # minVal = child.text
-                        # elif child.tag.endswith("ValidMax"):
-                        # maxVal = child.text
-                    except AttributeError:
-                        continue
-                # most basic entry for variable measured
-                entry = {"@type": "PropertyValue", "name": param_name}
-                # "minValue": f"{minVal}",
-                # "maxValue": f"{maxVal}"})
-                if param_desc:
-                    entry["description"] = param_desc
-                if units_found[i]:
-                    entry["unitText"] = units_found[i]
-                if key:
-                    entry["alternateName"] = key
-                i += 1
-                variable_measured.append(entry)
+        # look up needed info in the index
+        for target_child in self.index.iter("Parameter", within=self.desired_root):
+            for child in target_child:
+                units_found.append("")
+                try:
+                    if child.tag.endswith("Name"):
+                        param_name = child.text
+                    elif child.tag.endswith("Description"):
+                        substring = child.text.split("\n", 1)
+                        param_desc = substring[0]
+                    elif child.tag.endswith("Units"):
+                        unit = child.text
+                        units_found[i] = unit
+                    elif child.tag.endswith("ParameterKey"):
+                        key = child.text
+                    # elif child.tag.endswith("ValidMin"):
+                    # minVal = child.text
+                    # elif child.tag.endswith("ValidMax"):
+                    # maxVal = child.text
+                except AttributeError:
+                    continue
+            # most basic entry for variable measured
+            entry = {"@type": "PropertyValue", "name": param_name}
+            # "minValue": f"{minVal}",
+            # "maxValue": f"{maxVal}"})
+            if param_desc:
+                entry["description"] = param_desc
+            if units_found[i]:
+                entry["unitText"] = units_found[i]
+            if key:
+                entry["alternateName"] = key
+            i += 1
+            variable_measured.append(entry)
         if len(variable_measured) == 0:
             variable_measured = None
         return delete_null_values(variable_measured)
@@ -346,12 +361,12 @@ class SPASE(StrategyInterface):
         #   AND spase:ResourceHeader/spase:ReleaseDate
         # Following type:DataDownload found at: https://schema.org/DataDownload
         date_modified = self.get_date_modified()
-        metadata_license = get_metadata_license(self.metadata)
+        metadata_license = get_metadata_license(self.metadata, self.index)
         content_url = self.get_id()
         doi = False
         if "doi" in content_url:
             doi = True
-            resource_id = get_resource_id(self.metadata, self.namespaces)
+            resource_id = get_resource_id(self.metadata, self.namespaces, self.index)
             content_url = resource_id.replace("spase://", "https://spase-metadata.org/")
         # small lookup table for commonly used licenses in SPASE
         #   (CC0 for NASA, CC-BY-NC-3.0 for ESA, etc)
@@ -437,7 +452,7 @@ class SPASE(StrategyInterface):
         #   {"@type": schema:DataDownload, "content_url": URL, "encodingFormat": Format}
         # Following schema:DataDownload found at: https://schema.org/DataDownload
         distribution = []
-        data_downloads, _ = get_access_urls(self.metadata)
+        data_downloads, _ = self._get_access_urls()
         for k, v in data_downloads.items():
             entry = {"@type": "DataDownload", "contentUrl": k, "encodingFormat": v[0]}
             # if AccessURL has a name
@@ -459,7 +474,7 @@ class SPASE(StrategyInterface):
         potential_action_list = []
         start_sent = ""
         end_sent = ""
-        _, potential_actions = get_access_urls(self.metadata)
+        _, potential_actions = self._get_access_urls()
         temp_covg = self.get_temporal_coverage()
         if temp_covg is not None:
             # obtain trial start and stop times for use in entry description
@@ -584,11 +599,12 @@ class SPASE(StrategyInterface):
         # date_created = date_created.replace(" ", "T")
         return delete_null_values(date_created)
 
+    @memoized
     def get_date_modified(self) -> Union[str, None]:
         # Mapping: schema:dateModified = spase:ResourceHeader/spase:ReleaseDate
         # Using schema:DateTime as defined in: https://schema.org/DateTime
         # trigger = False
-        release, _ = get_dates(self.metadata)
+        release, _ = get_dates(self.metadata, self.index)
         date_modified = str(release).replace(" ", "T")
         # date_created = date_modified
         # confirm that ReleaseDate is the latest date in the record
@@ -608,14 +624,15 @@ class SPASE(StrategyInterface):
         # trigger = True
         return delete_null_values(date_modified)
 
+    @memoized
     def get_date_published(self) -> Union[str, None]:
         # Mapping: schema:datePublished = spase:ResourceHeader/
         #   spase:PublicationInfo/spase:PublicationDate
         # OR spase:ResourceHeader/spase:RevisionHistory/spase:ReleaseDate
         # Using schema:DateTime as defined in: https://schema.org/DateTime
-        (_, _, pub_date, _, _, _, _, _) = get_authors(self.metadata)
+        (_, _, pub_date, _, _, _, _, _) = self._get_authors()
         date_published = None
-        _, revisions = get_dates(self.metadata)
+        _, revisions = get_dates(self.metadata, self.index)
         if pub_date == "":
             if revisions:
                 # find earliest date in revision history
@@ -635,6 +652,7 @@ class SPASE(StrategyInterface):
         expires = None
         return delete_null_values(expires)
 
+    @memoized
     def get_temporal_coverage(self) -> Union[str, Dict, None]:
         # Mapping: schema:temporal_coverage = spase:TemporalDescription/spase:TimeSpan/*
         # Each object is:
@@ -643,22 +661,12 @@ class SPASE(StrategyInterface):
         #   found at https://schema.org/Text and https://schema.org/DateTime
         # Using format as defined in: 'https://github.com/ESIPFed/science-on-schema
         #   .org/blob/main/guides/Dataset.md#temporal-coverage'
-        desired_tag = self.desired_root.tag.split("}")
-        spase_location = (
-            ".//spase:"
-            + f"{desired_tag[1]}/spase:TemporalDescription/spase:TimeSpan/spase:StartDate"
-        )
-        start = self.metadata.findtext(
-            spase_location,
-            namespaces=self.namespaces,
+        desired_tag = local_name(self.desired_root)
+        start = self.index.findtext(
+            desired_tag, "TemporalDescription", "TimeSpan", "StartDate"
         )
-        spase_location = (
-            ".//spase:"
-            + f"{desired_tag[1]}/spase:TemporalDescription/spase:TimeSpan/spase:StopDate"
-        )
-        stop = self.metadata.findtext(
-            spase_location,
-            namespaces=self.namespaces,
+        stop = self.index.findtext(
+            desired_tag, "TemporalDescription", "TimeSpan", "StopDate"
         )
 
         if start:
@@ -678,9 +686,8 @@ class SPASE(StrategyInterface):
     def get_spatial_coverage(self) -> Union[List[Dict], None]:
         # Mapping: schema:spatial_coverage = list of spase:NumericalData/spase:ObservedRegion
         spatial_coverage = []
-        desired_tag = self.desired_root.tag.split("}")
-        spase_location = ".//spase:" + f"{desired_tag[1]}/spase:ObservedRegion"
-        all_regions = self.metadata.findall(spase_location, namespaces=self.namespaces)
+        desired_tag = local_name(self.desired_root)
+        all_regions = self.index.findall(desired_tag, "ObservedRegion")
         for item in all_regions:
             # Split string on '.'
             pretty_name = item.text.replace(".", " ")
@@ -734,7 +741,7 @@ class SPASE(StrategyInterface):
             author_role,
             *_,
             contacts_list,
-        ) = get_authors(self.metadata, self.file.replace(f"{home_dir}/", ""))
+        ) = self._get_authors(self.file.replace(f"{home_dir}/", ""))
         author_str = str(author).replace("[", "").replace("]", "")
         if author:
             # if creators were found in Contact/PersonID
@@ -825,17 +832,9 @@ class SPASE(StrategyInterface):
                     person = author_str.replace('"', "")
                     person = author_str.replace("'", "")
                     # determine if creator is a consortium
-                    with open(
-                        importlib.resources.files("soso.strategies.spase").joinpath(
-                            "spase-ignoreCreatorSplit.txt"
-                        ),
-                        "r",
-                        encoding="utf-8",
-                    ) as f:
-                        do_not_split = f.read()
                     if ", " in person:
                         # if file is not in list of ones to not have their creators split
-                        if self.file.replace(home_dir, "") not in do_not_split:
+                        if not ignores_creator_split(self.file):
                             family_name, _, given_name = person.partition(", ")
                             # find matching person in contacts, if any, to get affiliation and ORCiD
                             for key, val in contacts_list.items():
@@ -893,7 +892,7 @@ class SPASE(StrategyInterface):
         #   plus the additional properties if available: affiliation and identifier (ORCiD ID),
         #       which are pulled from SMWG Person SPASE records
         # Using schema:Person as defined in: https://schema.org/Person
-        (*_, contributors, _, backups, contacts_list) = get_authors(self.metadata)
+        (*_, contributors, _, backups, contacts_list) = self._get_authors()
         contributor = []
         first_contrib = True
         # holds role values that are not initially considered for contributor var
@@ -1026,7 +1025,7 @@ class SPASE(StrategyInterface):
             _,
             _,
             _,
-        ) = get_authors(self.metadata)
+        ) = self._get_authors()
         # ror = None
 
         # commented out ROR for now until capability added in SPASE
@@ -1061,16 +1060,14 @@ class SPASE(StrategyInterface):
         award = []
         # ror = None
         # iterate thru to find all info related to funding
-        for child in self.desired_root.iter(tag=etree.Element):
-            if child.tag.endswith("Funding"):
-                target_child = child
-                for child in target_child:
-                    if child.tag.endswith("Agency"):
-                        agency.append(child.text)
-                    elif child.tag.endswith("Project"):
-                        project.append(child.text)
-                    elif child.tag.endswith("AwardNumber"):
-                        award.append(child.text)
+        for target_child in self.index.iter("Funding", within=self.desired_root):
+            for child in target_child:
+                if child.tag.endswith("Agency"):
+                    agency.append(child.text)
+                elif child.tag.endswith("Project"):
+                    project.append(child.text)
+                elif child.tag.endswith("AwardNumber"):
+                    award.append(child.text)
         # if funding info was found
         if agency:
             i = 0
@@ -1113,19 +1110,13 @@ class SPASE(StrategyInterface):
             </Rights>
         </RightsList>"""
 
-        desired_tag = self.desired_root.tag.split("}")
+        desired_tag = local_name(self.desired_root)
         rights_uri = None
-        spase_location = (
-            ".//spase:"
-            + f"{desired_tag[1]}/spase:AccessInformation/spase:RightsList/spase:Rights"
-        )
-        for item in self.metadata.findall(
-            spase_location,
-            namespaces=self.namespaces,
+        for item in self.index.findall(
+            desired_tag, "AccessInformation", "RightsList", "Rights"
         ):
-            for child in item.iter(tag=etree.Element):
-                if child.tag.endswith("RightsURI"):
-                    rights_uri = child.text
+            for child in self.index.iter("RightsURI", within=item):
+                rights_uri = child.text
             if rights_uri not in licenses:
                 licenses.append(rights_uri)
         if not licenses:
@@ -1138,7 +1129,9 @@ class SPASE(StrategyInterface):
         # Mapping: prov:wasRevisionOf = spase:Association/spase:AssociationID
         #   (if spase:AssociationType is "RevisionOf")
         # prov:wasRevisionOf found at https://www.w3.org/TR/prov-o/#wasRevisionOf
-        was_revision_of = get_relation(self.desired_root, ["RevisionOf"], self.file)
+        was_revision_of = get_relation(
+            self.desired_root, ["RevisionOf"], self.file, index=self.index
+        )
         return delete_null_values(was_revision_of)
 
     def get_was_derived_from(self) -> Union[Dict, None]:
@@ -1150,12 +1143,16 @@ class SPASE(StrategyInterface):
         was_derived_from = self.get_is_based_on()
         return delete_null_values(was_derived_from)
 
+    @memoized
     def get_is_based_on(self) -> Union[List[Dict], Dict, None]:
         # Mapping: schema:isBasedOn = spase:Association/spase:AssociationID
         #   (if spase:AssociationType is "DerivedFrom" or "ChildEventOf")
         # schema:isBasedOn found at https://schema.org/isBasedOn
         is_based_on = get_relation(
-            self.desired_root, ["ChildEventOf", "DerivedFrom"], self.file
+            self.desired_root,
+            ["ChildEventOf", "DerivedFrom"],
+            self.file,
+            index=self.index,
         )
         return delete_null_values(is_based_on)
 
@@ -1170,12 +1167,12 @@ class SPASE(StrategyInterface):
         # prov:wasGeneratedBy found at https://www.w3.org/TR/prov-o/#wasGeneratedBy
 
         # commenting out observatories because of the email with Baptiste and Donny
-        instruments = get_instrument(self.metadata, self.file)
+        instruments = get_instrument(self.metadata, self.file, index=self.index)
         # only uncomment if trying to generate snapshot spase.json
         # instruments = get_instrument(
         #    self.metadata, self.file, **{"testing": "soso-spase/tests/data/spase/"}
         #    )
-        # observatories = get_observatory(self.metadata, self.file)
+        # observatories = get_observatory(self.metadata, self.file, self.index)
         was_generated_by = []
 
         # if observatories:
@@ -1196,6 +1193,625 @@ class SPASE(StrategyInterface):
 # Below are utility functions for the SPASE strategy.
 
 
+class SpaseIndex:
+    """An index of the elements in a SPASE record, keyed by local tag name.
+
+    The tree is walked exactly once, when the index is created. Every element
+    is recorded under its local tag name, in document order, together with
+    the span of document positions covered by its subtree. The getters of the
+    SPASE strategy and the utility functions below answer their
+    ``root.iter()``/``tag.endswith()`` style lookups from this index instead
+    of re-walking the tree.
+
+    Attributes:
+        root: The root element of the indexed tree.
+        tags: Elements of the tree grouped by local tag name, in document
+            order.
+        walks: The number of tree walks performed to build indexes, across
+            all instances. Useful for checking how often records are walked.
+
+    :param metadata: The SPASE metadata object as an XML tree.
+    """
+
+    walks = 0
+
+    def __init__(self, metadata: etree.ElementTree):
+        SpaseIndex.walks += 1
+        self.root = metadata.getroot()
+        self.tags = {}
+        self._start = {}
+        self._end = {}
+        self._suffix_cache = {}
+        position = 0
+        for event, elt in etree.iterwalk(self.root, events=("start", "end")):
+            if event == "start":
+                self._start[elt] = position
+                self.tags.setdefault(local_name(elt), []).append(elt)
+                position += 1
+            else:
+                self._end[elt] = position
+
+    def iter(self, suffix: str, within: etree.Element) -> List:
+        """
+        :param suffix: The tag suffix to match, as in ``tag.endswith(suffix)``.
+        :param within: The element to search. Only elements in its subtree
+            (including the element itself) are returned. Pass `root` to search
+            the whole record.
+
+        :returns: The elements whose tag ends with `suffix`, in document order.
+        """
+        elements = self._suffix_cache.get(suffix)
+        if elements is None:
+            names = [name for name in self.tags if name.endswith(suffix)]
+            if len(names) == 1:
+                elements = self.tags[names[0]]
+            else:
+                elements = sorted(
+                    (elt for name in names for elt in self.tags[name]),
+                    key=self._start.__getitem__,
+                )
+            self._suffix_cache[suffix] = elements
+        if within not in self._start:
+            # mirror calling within.iter() on a missing element
+            raise AttributeError(f"{within!r} is not an element of the indexed tree")
+        first = bisect_left(elements, self._start[within], key=self._start.__getitem__)
+        last = bisect_left(elements, self._end[within], key=self._start.__getitem__)
+        return elements[first:last]
+
+    def last(self, *suffixes: str) -> Union[etree.Element, None]:
+        """
+        :param suffixes: The tag suffixes to match.
+
+        :returns: The last element, in document order, whose tag ends with one
+            of `suffixes`. None if there is no such element.
+        """
+        candidates = [
+            elements[-1]
+            for elements in (self.iter(suffix, self.root) for suffix in suffixes)
+            if elements
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=self._start.__getitem__)
+
+    def findall(self, *path: str) -> List:
+        """
+        :param path: Local tag names, the first matched anywhere below the
+            root and each following one as a child of the previous, like the
+            ElementPath ``.//spase:A/spase:B/spase:C``.
+
+        :returns: The elements matching `path`, in document order.
+        """
+        matches = [elt for elt in self.tags.get(path[0], []) if elt is not self.root]
+        for name in path[1:]:
+            matches = [
+                child
+                for elt in matches
+                for child in elt.iterchildren(tag=etree.Element)
+                if local_name(child) == name
+            ]
+        return matches
+
+    def findtext(self, *path: str) -> Union[str, None]:
+        """
+        :param path: Local tag names, as for `findall`.
+
+        :returns: The text of the first element matching `path`, an empty
+            string if that element has no text, or None if nothing matches.
+        """
+        matches = self.findall(*path)
+        if not matches:
+            return None
+        return matches[0].text or ""
+
+
+def local_name(element: etree.Element) -> str:
+    """
+    :param element: An element of a SPASE metadata tree.
+
+    :returns: The tag name of the element without its namespace.
+    """
+    return element.tag.rpartition("}")[2]
+
+
+class LinkedRecordCache:
+    """A size-bounded LRU cache of parsed SPASE records linked to by other
+    records, such as Person, Instrument, Observatory and ObservatoryGroup
+    records. Records are keyed by their resolved path, and a record changed on
+    disk since it was parsed is parsed again.
+
+    Attributes:
+        maxsize: The maximum number of parsed records kept.
+        hits: The number of records served from the cache.
+        misses: The number of records parsed.
+
+    :param maxsize: The maximum number of parsed records kept.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._records = OrderedDict()
+        self._taken = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, record: str) -> SPASE:
+        """
+        :param record: The path of the linked SPASE record.
+
+        :returns: The SPASE strategy instance of the record. It is shared by
+            all callers and must not be modified.
+        """
+        path = Path(record).resolve()
+        mtime = path.stat().st_mtime_ns
+        self._taken[str(path)] = None
+        cached = self._records.get(path)
+        if cached is not None and cached[0] == mtime:
+            self.hits += 1
+            self._records.move_to_end(path)
+            return cached[1]
+        self.misses += 1
+        test_spase = SPASE(str(path))
+        self._records[path] = (mtime, test_spase)
+        self._records.move_to_end(path)
+        if len(self._records) > self.maxsize:
+            self._records.popitem(last=False)
+        return test_spase
+
+    def note(self, record: str) -> None:
+        """
+        :param record: The path of a linked SPASE record whose information was
+            found without parsing it, e.g. in a PersonIndex. It is taken along
+            with the records asked for.
+        """
+        self._taken[str(Path(record).resolve())] = None
+
+    def take(self) -> List:
+        """
+        :returns: The resolved paths of the records asked for since the last
+            call, in the order first asked for. They are then forgotten.
+        """
+        taken = list(self._taken)
+        self._taken.clear()
+        return taken
+
+    def clear(self) -> None:
+        """Empties the cache and resets its counters."""
+        self._records.clear()
+        self._taken.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# process-wide cache shared by the functions following links between records
+linked_records = LinkedRecordCache()
+
+
+def get_linked_record(record: str) -> SPASE:
+    """
+    :param record: The path of a SPASE record linked to by another record.
+
+    :returns: The SPASE strategy instance of the record, from the process-wide
+        `linked_records` cache.
+    """
+    return linked_records.get(record)
+
+
+def take_linked_records() -> List:
+    """Returns the paths of the linked records loaded with get_linked_record
+    since the last call, and forgets them. Lets each record (or worker process)
+    report the linked records its conversion depended on."""
+    return linked_records.take()
+
+
+_IGNORE_CREATOR_SPLIT = None
+
+
+def normalize_record_path(record: str) -> str:
+    """
+    :param record: The path of a SPASE record.
+
+    :returns: The path of the record relative to the home directory, where the
+        SPASE repositories are cloned, with forward slashes and no leading
+        slash, as listed in spase-ignoreCreatorSplit.txt. For example,
+        NASA/NumericalData/SOHO/UVCS/PT9M.xml.
+    """
+    record = str(record).strip().replace("\\", "/")
+    # only absolute paths can be in the home directory
+    if record.startswith("/") or record[1:3] == ":/":
+        home_dir = os.path.expanduser("~").replace("\\", "/")
+        if record.startswith(f"{home_dir}/"):
+            record = record[len(home_dir) + 1 :]
+    return record.lstrip("/")
+
+
+def read_ignore_creator_split(list_file: Union[str, Path, None] = None) -> frozenset:
+    """
+    :param list_file: A text file listing the paths of SPASE records whose
+        creators are consortia, one per line. The bundled
+        spase-ignoreCreatorSplit.txt if None.
+
+    :returns: The normalized paths of the records listed, as from
+        normalize_record_path.
+    """
+    if list_file is None:
+        list_file = importlib.resources.files("soso.strategies.spase").joinpath(
+            "spase-ignoreCreatorSplit.txt"
+        )
+    with open(list_file, "r", encoding="utf-8") as f:
+        return frozenset(normalize_record_path(line) for line in f if line.strip())
+
+
+# pylint: disable=global-statement
+def get_ignore_creator_split() -> frozenset:
+    """
+    Returns the SPASE records whose creators are consortia and should not be
+    split into people. Unless set with configure_ignore_creator_split, they are
+    read once per process from the file named by the
+    ``SOSO_IGNORE_CREATOR_SPLIT`` environment variable, or from the bundled
+    spase-ignoreCreatorSplit.txt if it is unset.
+
+    :returns: The normalized paths of the records, as from
+        normalize_record_path.
+    """
+    global _IGNORE_CREATOR_SPLIT
+    if _IGNORE_CREATOR_SPLIT is None:
+        _IGNORE_CREATOR_SPLIT = read_ignore_creator_split(
+            os.environ.get("SOSO_IGNORE_CREATOR_SPLIT")
+        )
+    return _IGNORE_CREATOR_SPLIT
+
+
+def configure_ignore_creator_split(
+    records: Union[str, Path, Iterable[str], None] = None,
+) -> frozenset:
+    """
+    Sets the SPASE records whose creators are consortia and should not be split
+    into people, overriding the bundled list.
+
+    :param records: A text file listing the paths of the records, one per
+        line, or the paths themselves. If None, the default list is read again,
+        as described for get_ignore_creator_split.
+
+    :returns: The normalized paths of the records, as from
+        normalize_record_path.
+    """
+    global _IGNORE_CREATOR_SPLIT
+    if records is None:
+        _IGNORE_CREATOR_SPLIT = None
+        return get_ignore_creator_split()
+    if isinstance(records, (str, Path)):
+        _IGNORE_CREATOR_SPLIT = read_ignore_creator_split(records)
+    else:
+        _IGNORE_CREATOR_SPLIT = frozenset(
+            normalize_record_path(record) for record in records
+        )
+    return _IGNORE_CREATOR_SPLIT
+
+
+def ignores_creator_split(record: str) -> bool:
+    """
+    :param record: The path of a SPASE record.
+
+    :returns: Whether the creators of the record are a consortium, which should
+        not be split into people, as listed by get_ignore_creator_split.
+    """
+    return normalize_record_path(record) in get_ignore_creator_split()
+
+
+def read_person_record(test_spase: SPASE) -> tuple[str, str, str]:
+    """
+    :param test_spase: The SPASE strategy instance of a Person or Repository
+        record.
+
+    :returns: The ORCiD ID, organization name and ROR ID given in the record,
+        as strings, empty if not given.
+    """
+    desired_root = test_spase.index.last("Person", "Repository")
+    orcid_id = ""
+    affiliation = ""
+    ror = ""
+    for child in test_spase.index.iter("ORCIdentifier", desired_root):
+        orcid_id = child.text
+    for child in test_spase.index.iter("OrganizationName", desired_root):
+        affiliation = child.text
+    for child in test_spase.index.iter("RORIdentifier", desired_root):
+        ror = child.text
+    return orcid_id, affiliation, ror
+
+
+class RecordIndex(ABC):
+    """A persistent index of information read from linked SPASE records, so
+    that it is looked up without parsing the records. It is built once with
+    `build`, from a clone of the SMWG repository, and kept in a table of a
+    SQLite database, which is read whole into memory when the index is
+    opened. Records are keyed by their normalized path, as from
+    normalize_record_path, and a record changed on disk since it was indexed
+    is not found. Subclasses name the table and its columns, the folders
+    indexed by default, and read the records.
+
+    Attributes:
+        database: The path of the SQLite database holding the index. When
+            None, no records are indexed.
+        hits: The number of records found in the index.
+        misses: The number of records not indexed, or changed since.
+
+    :param database: The path of the SQLite database holding the index,
+        created by `build` if needed. Indexes of different kinds can share a
+        database.
+    """
+
+    # the table holding the index, and its columns besides the path and
+    #   modification time of the records
+    table = ""
+    columns = ()
+    # the folders indexed by default, relative to the home directory
+    folders = ()
+
+    def __init__(self, database: Union[str, Path, None] = None):
+        self.database = database
+        self.hits = 0
+        self.misses = 0
+        self._records = {}
+        if database is not None and os.path.isfile(database):
+            with closing(self._connect()) as connection:
+                self._records = {
+                    row[0]: row[1:]
+                    for row in connection.execute(
+                        f"SELECT path, mtime, {', '.join(self.columns)} "
+                        f"FROM {self.table}"
+                    )
+                }
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _connect(self):
+        # sqlite3 is only needed for indexes, so it is imported here
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        connection = sqlite3.connect(self.database, timeout=60)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} (path TEXT PRIMARY KEY, "
+            f"mtime INTEGER, {', '.join(f'{column} TEXT' for column in self.columns)})"
+        )
+        return connection
+
+    def get(self, record: str) -> Union[tuple, None]:
+        """
+        :param record: The path of a linked SPASE record.
+
+        :returns: The values read from the record, as from `read`, or None if
+            the record is not indexed or has changed since.
+        """
+        if not self._records:
+            return None
+        indexed = self._records.get(normalize_record_path(os.path.abspath(record)))
+        if indexed is None or indexed[0] != os.stat(record).st_mtime_ns:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return indexed[1:]
+
+    @abstractmethod
+    def read(self, test_spase: SPASE) -> Union[tuple, None]:
+        """
+        :param test_spase: The SPASE strategy instance of a record.
+
+        :returns: The values of the record for each of `columns`, or None if
+            the record is not of a kind indexed.
+        """
+
+    def build(self, folder: Union[str, Path, None] = None) -> int:
+        """
+        Indexes the records in a folder and its subfolders, and saves them in
+        `database`. Records indexed before and unchanged since are not parsed
+        again.
+
+        :param folder: The folder holding the records. The `folders` of the
+            SMWG repository cloned in the home directory if None.
+
+        :returns: The number of records parsed and indexed.
+        """
+        if self.database is None:
+            raise ValueError(f"A {type(self).__name__} needs a database to be built.")
+        folders = [Path.home() / name for name in self.folders]
+        rows = []
+        for path in sorted(
+            path
+            for folder in (folders if folder is None else [folder])
+            for path in Path(folder).rglob("*.xml")
+        ):
+            key = normalize_record_path(os.path.abspath(path))
+            mtime = path.stat().st_mtime_ns
+            if key in self._records and self._records[key][0] == mtime:
+                continue
+            values = self.read(SPASE(str(path)))
+            if values is None:
+                continue
+            rows.append((key, mtime, *values))
+            self._records[key] = rows[-1][1:]
+        with closing(self._connect()) as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} VALUES "
+                f"({', '.join('?' * (len(self.columns) + 2))})",
+                rows,
+            )
+            connection.commit()
+        return len(rows)
+
+
+class PersonIndex(RecordIndex):
+    """An index of the ORCiD ID, organization name and ROR ID of SPASE Person
+    and Repository records, used by get_orcid_and_affiliation, so that
+    contacts are looked up without parsing their records. By default, it
+    indexes the Person folder of the SMWG repository.
+    """
+
+    table = "people"
+    columns = ("orcid", "affiliation", "ror")
+    folders = ("SMWG/Person",)
+
+    def read(self, test_spase: SPASE) -> Union[tuple[str, str, str], None]:
+        """
+        :param test_spase: The SPASE strategy instance of a record.
+
+        :returns: The ORCiD ID, organization name and ROR ID of the record, as
+            from read_person_record, or None if it is not a Person or
+            Repository record.
+        """
+        if test_spase.index.last("Person", "Repository") is None:
+            return None
+        return read_person_record(test_spase)
+
+
+_PERSON_INDEX = None
+
+
+def get_person_index() -> PersonIndex:
+    """
+    Returns the index of Person records used by get_orcid_and_affiliation.
+    Unless set with configure_person_index, it is opened once per process from
+    the SQLite database named by the ``SOSO_PERSON_INDEX`` environment
+    variable. If it is unset, no records are indexed, and each Person record
+    is parsed when first looked up.
+
+    :returns: The shared PersonIndex.
+    """
+    global _PERSON_INDEX
+    if _PERSON_INDEX is None:
+        _PERSON_INDEX = PersonIndex(os.environ.get("SOSO_PERSON_INDEX"))
+    return _PERSON_INDEX
+
+
+def configure_person_index(database: Union[str, Path, None] = None) -> PersonIndex:
+    """
+    Sets the index of Person records used by get_orcid_and_affiliation.
+
+    :param database: The SQLite database holding the index, as built by
+        PersonIndex.build. If None, the default index is opened again, as
+        described for get_person_index.
+
+    :returns: The shared PersonIndex.
+    """
+    global _PERSON_INDEX
+    _PERSON_INDEX = None if database is None else PersonIndex(database)
+    return get_person_index()
+
+
+# the element of each kind of record in the hierarchy of instruments and
+#   observatories holding the ID of its parent
+PARENT_IDS = {"Instrument": "ObservatoryID", "Observatory": "ObservatoryGroupID"}
+
+
+class InstrumentIndex(RecordIndex):
+    """An index of the hierarchy of SPASE Instrument and Observatory records,
+    including observatory groups, used by get_instrument and get_observatory,
+    so that the instruments and observatories of a record are looked up
+    without parsing their records. Each record is indexed with its kind, name,
+    URL and the ID of its parent, as in PARENT_IDS. By default, it indexes the
+    Instrument and Observatory folders of the SMWG repository.
+    """
+
+    table = "hierarchy"
+    columns = ("kind", "name", "url", "parent")
+    folders = ("SMWG/Instrument", "SMWG/Observatory")
+
+    def read(self, test_spase: SPASE) -> Union[tuple[str, str, str, str], None]:
+        """
+        :param test_spase: The SPASE strategy instance of a record.
+
+        :returns: The kind of the record, "Instrument" or "Observatory", and
+            its name, URL and parent ID, as from read_hierarchy_record, or
+            None if it is neither kind.
+        """
+        for kind in PARENT_IDS:
+            if test_spase.index.last(kind) is not None:
+                return kind, *read_hierarchy_record(test_spase, kind)
+        return None
+
+
+def read_hierarchy_record(
+    test_spase: SPASE, kind: str = None
+) -> tuple[str, str, Union[str, None]]:
+    """
+    :param test_spase: The SPASE strategy instance of an Instrument or
+        Observatory record.
+    :param kind: The kind of the record, "Instrument" or "Observatory", to
+        read the ID of its parent. Only its name and URL are read if None.
+
+    :returns: The name and URL of the record, and the last ID of its parent
+        given in the record, as in PARENT_IDS, which is empty if the element
+        is, or None if not given.
+    """
+    parent = None
+    if kind is not None:
+        desired_root = test_spase.index.last(kind)
+        for child in test_spase.index.iter(PARENT_IDS[kind], desired_root):
+            parent = child.text or ""
+    return test_spase.get_name(), test_spase.get_url(), parent
+
+
+def get_hierarchy_record(
+    record: str, kind: str = None
+) -> tuple[str, str, Union[str, None]]:
+    """
+    :param record: The path of an Instrument or Observatory record, which
+        exists.
+    :param kind: The kind of the record, as for read_hierarchy_record.
+
+    :returns: The name, URL and parent ID of the record, as from
+        read_hierarchy_record, looked up in the index of the hierarchy of
+        instruments and observatories, or else read from the record.
+    """
+    indexed = get_instrument_index().get(record)
+    if indexed is not None and kind in (None, indexed[0]):
+        linked_records.note(record)
+        return indexed[1:]
+    return read_hierarchy_record(get_linked_record(record), kind)
+
+
+_INSTRUMENT_INDEX = None
+
+
+def get_instrument_index() -> InstrumentIndex:
+    """
+    Returns the index of the hierarchy of instruments and observatories used
+    by get_instrument and get_observatory. Unless set with
+    configure_instrument_index, it is opened once per process from the SQLite
+    database named by the ``SOSO_INSTRUMENT_INDEX`` environment variable. If
+    it is unset, no records are indexed, and each record is parsed when first
+    looked up.
+
+    :returns: The shared InstrumentIndex.
+    """
+    global _INSTRUMENT_INDEX
+    if _INSTRUMENT_INDEX is None:
+        _INSTRUMENT_INDEX = InstrumentIndex(os.environ.get("SOSO_INSTRUMENT_INDEX"))
+    return _INSTRUMENT_INDEX
+
+
+def configure_instrument_index(
+    database: Union[str, Path, None] = None,
+) -> InstrumentIndex:
+    """
+    Sets the index of the hierarchy of instruments and observatories used by
+    get_instrument and get_observatory.
+
+    :param database: The SQLite database holding the index, as built by
+        InstrumentIndex.build. If None, the default index is opened again, as
+        described for get_instrument_index.
+
+    :returns: The shared InstrumentIndex.
+    """
+    global _INSTRUMENT_INDEX
+    _INSTRUMENT_INDEX = None if database is None else InstrumentIndex(database)
+    return get_instrument_index()
+
+
 def get_schema_version(metadata: etree.ElementTree) -> str:
     """
     :param metadata: The SPASE metadata object as an XML tree.
@@ -1211,7 +1827,7 @@ def get_schema_version(metadata: etree.ElementTree) -> str:
 
 
 def get_authors(
-    metadata: etree.ElementTree, file="PlaceholderText"
+    metadata: etree.ElementTree, file="PlaceholderText", index: SpaseIndex = None
 ) -> tuple[List, List, str, str, List, str, Dict, Dict]:
     """
     Takes an XML tree and scrapes the desired authors (with their roles), publication date,
@@ -1222,6 +1838,7 @@ def get_authors(
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param file: The absolute path of the SPASE record being scraped.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The highest priority authors found within the SPASE record as a list
                 as well as a list of their roles, the publication date, publisher,
@@ -1239,89 +1856,82 @@ def get_authors(
     dataset = ""
     backups = {}
     pi_child = None
-    desired_root = None
-    root = metadata.getroot()
+    if index is None:
+        index = SpaseIndex(metadata)
     if file:
         file = file.replace("\\", "/")
-    for elt in root.iter(tag=etree.Element):
-        if elt.tag.endswith("NumericalData") or elt.tag.endswith("DisplayData"):
-            desired_root = elt
+    desired_root = index.last("NumericalData", "DisplayData")
 
-    # traverse xml to extract needed info
+    # look up needed info in the index
     # iterate thru to find ResourceHeader
     if desired_root is not None:
-        for child in desired_root.iter(tag=etree.Element):
-            if child.tag.endswith("ResourceHeader"):
-                target_child = child
-                # iterate thru to find PublicationInfo
-                for child in target_child:
-                    try:
-                        if child.tag.endswith("PublicationInfo"):
-                            pi_child = child
-                        elif child.tag.endswith("Contact"):
-                            c_child = child
-                            # iterate thru Contact to find PersonID and Role
-                            for child in c_child:
-                                try:
-                                    # find PersonID
-                                    if child.tag.endswith("PersonID"):
-                                        # store PersonID
-                                        person_id = child.text.strip()
-                                        backups[person_id] = []
-                                        contacts_list[person_id] = []
-                                    # find Role
-                                    elif child.tag.endswith("Role"):
-                                        # backup author
-                                        if (
-                                            ("PrincipalInvestigator" in child.text)
-                                            or ("PI" in child.text)
-                                            or ("CoInvestigator" in child.text)
-                                            or ("Author" in child.text)
-                                        ):
-                                            if person_id not in author:
-                                                author.append(person_id)
-                                                author_role.append(child.text.strip())
-                                            else:
-                                                index = author.index(person_id)
-                                                author_role[index] = [
-                                                    author_role[index],
-                                                    child.text.strip(),
-                                                ]
-                                            # store author roles found here in case PubInfo present
-                                            contacts_list[person_id] += [
-                                                child.text.strip()
-                                            ]
-                                        # preferred contributor
-                                        elif child.text == "Contributor":
-                                            contributor.append(person_id)
-                                        # backup publisher (none found in SPASE currently)
-                                        elif child.text == "Publisher":
-                                            pub = child.text.strip()
+        for target_child in index.iter("ResourceHeader", desired_root):
+            # iterate thru to find PublicationInfo
+            for child in target_child:
+                try:
+                    if child.tag.endswith("PublicationInfo"):
+                        pi_child = child
+                    elif child.tag.endswith("Contact"):
+                        c_child = child
+                        # iterate thru Contact to find PersonID and Role
+                        for child in c_child:
+                            try:
+                                # find PersonID
+                                if child.tag.endswith("PersonID"):
+                                    # store PersonID
+                                    person_id = child.text.strip()
+                                    backups[person_id] = []
+                                    contacts_list[person_id] = []
+                                # find Role
+                                elif child.tag.endswith("Role"):
+                                    # backup author
+                                    if (
+                                        ("PrincipalInvestigator" in child.text)
+                                        or ("PI" in child.text)
+                                        or ("CoInvestigator" in child.text)
+                                        or ("Author" in child.text)
+                                    ):
+                                        if person_id not in author:
+                                            author.append(person_id)
+                                            author_role.append(child.text.strip())
                                         else:
-                                            # use list for values in case one person
-                                            #   has multiple roles
-                                            # store contacts w non-author roles for
-                                            #   use in contributors
-                                            backups[person_id] += [child.text.strip()]
-                                except AttributeError:
-                                    continue
-                    except AttributeError:
-                        continue
+                                            position = author.index(person_id)
+                                            author_role[position] = [
+                                                author_role[position],
+                                                child.text.strip(),
+                                            ]
+                                        # store author roles found here in case PubInfo present
+                                        contacts_list[person_id] += [child.text.strip()]
+                                    # preferred contributor
+                                    elif child.text == "Contributor":
+                                        contributor.append(person_id)
+                                    # backup publisher (none found in SPASE currently)
+                                    elif child.text == "Publisher":
+                                        pub = child.text.strip()
+                                    else:
+                                        # use list for values in case one person
+                                        #   has multiple roles
+                                        # store contacts w non-author roles for
+                                        #   use in contributors
+                                        backups[person_id] += [child.text.strip()]
+                            except AttributeError:
+                                continue
+                except AttributeError:
+                    continue
         if pi_child is not None:
-            for child in pi_child.iter(tag=etree.Element):
-                # collect preferred author
-                if child.tag.endswith("Authors"):
-                    author = [child.text.strip()]
-                    author_role = ["Author"]
-                # collect preferred publication date
-                elif child.tag.endswith("PublicationDate"):
-                    pub_date = child.text.strip()
-                # collect preferred publisher
-                elif child.tag.endswith("PublishedBy"):
-                    pub = child.text.strip()
-                # collect preferred dataset
-                elif child.tag.endswith("Title"):
-                    dataset = child.text.strip()
+            # collect preferred author
+            for child in index.iter("Authors", pi_child):
+                author = [child.text.strip()]
+                author_role = ["Author"]
+            # collect preferred publication date
+            for child in index.iter("PublicationDate", pi_child):
+                pub_date = child.text.strip()
+            # collect preferred publisher
+            for child in index.iter("PublishedBy", pi_child):
+                pub = child.text.strip()
+            # collect preferred dataset
+            for child in index.iter("Title", pi_child):
+                dataset = child.text.strip()
 
         # remove contacts w/o role values
         contacts_copy = {}
@@ -1347,12 +1957,15 @@ def get_authors(
     )
 
 
-def get_access_urls(metadata: etree.ElementTree) -> tuple[Dict, Dict]:
+def get_access_urls(
+    metadata: etree.ElementTree, index: SpaseIndex = None
+) -> tuple[Dict, Dict]:
     """
     Splits the SPASE AccessURLs present in the record into either the distribution
     or potentialAction schema.org properties.
 
     :param metadata: The SPASE metadata object as an XML tree.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The AccessURLs found in the SPASE record, separated into two dictionaries,
                 data_downloads and potential_actions, depending on if they are a direct
@@ -1368,54 +1981,43 @@ def get_access_urls(metadata: etree.ElementTree) -> tuple[Dict, Dict]:
     encoder = []
     i = 0
     j = 0
-    desired_root = None
-    root = metadata.getroot()
-    for elt in root.iter(tag=etree.Element):
-        if elt.tag.endswith("NumericalData") or elt.tag.endswith("DisplayData"):
-            desired_root = elt
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData")
 
     # get Formats before iteration due to order of elements in SPASE record
-    desired_tag = desired_root.tag.split("}")
-    spase_location = (
-        ".//spase:" + f"{desired_tag[1]}/spase:AccessInformation/spase:Format"
-    )
-    namespace = ""
-    for ns in list(root.nsmap.values()):
-        if "spase-group" in ns:
-            namespace = ns
-    for item in metadata.findall(spase_location, namespaces={"spase": namespace}):
+    desired_tag = local_name(desired_root)
+    for item in index.findall(desired_tag, "AccessInformation", "Format"):
         encoding.append(item.text)
 
-    # traverse xml to extract needed info
+    # look up needed info in the index
     # iterate thru children to locate Access Information
-    for child in desired_root.iter(tag=etree.Element):
-        if child.tag.endswith("AccessInformation"):
-            target_child = child
-            # iterate thru children to locate AccessURL and Format
-            for child in target_child:
-                if child.tag.endswith("AccessURL"):
-                    target_child = child
-                    name = ""
-                    # iterate thru children to locate URL
-                    for child in target_child:
-                        if child.tag.endswith("URL"):
-                            url = child.text
-                            # provide "NULL" value in case no keys are found
-                            access_urls[url] = {"keys": [], "name": name}
-                            # append an encoder for each URL
-                            encoder.append(encoding[j])
-                        # check if URL has a product key
-                        elif child.tag.endswith("ProductKey"):
-                            prod_key = child.text
-                            # if only one prod_key exists
-                            if access_urls[url]["keys"] == []:
-                                access_urls[url]["keys"] = [prod_key]
-                            # if multiple prod_keys exist
-                            else:
-                                access_urls[url]["keys"] += [prod_key]
-                        elif child.tag.endswith("Name"):
-                            name = child.text
-            j += 1
+    for target_child in index.iter("AccessInformation", desired_root):
+        # iterate thru children to locate AccessURL and Format
+        for child in target_child:
+            if child.tag.endswith("AccessURL"):
+                target_child = child
+                name = ""
+                # iterate thru children to locate URL
+                for child in target_child:
+                    if child.tag.endswith("URL"):
+                        url = child.text
+                        # provide "NULL" value in case no keys are found
+                        access_urls[url] = {"keys": [], "name": name}
+                        # append an encoder for each URL
+                        encoder.append(encoding[j])
+                    # check if URL has a product key
+                    elif child.tag.endswith("ProductKey"):
+                        prod_key = child.text
+                        # if only one prod_key exists
+                        if access_urls[url]["keys"] == []:
+                            access_urls[url]["keys"] = [prod_key]
+                        # if multiple prod_keys exist
+                        else:
+                            access_urls[url]["keys"] += [prod_key]
+                    elif child.tag.endswith("Name"):
+                        name = child.text
+        j += 1
     for k, v in access_urls.items():
         # if URL has no access key
         if not v["keys"]:
@@ -1462,69 +2064,62 @@ def get_access_urls(metadata: etree.ElementTree) -> tuple[Dict, Dict]:
 
 
 def get_dates(
-    metadata: etree.ElementTree,
+    metadata: etree.ElementTree, index: SpaseIndex = None
 ) -> Union[tuple[datetime, List[datetime]], tuple[str, List]]:
     """
     Scrapes the ReleaseDate and RevisionHistory:ReleaseDate(s) SPASE properties for use
     in the dateModified, dateCreated, and datePublished schema.org properties.
 
     :param metadata: The SPASE metadata object as an XML tree.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The ReleaseDate and a list of all the dates found in RevisionHistory
     """
-    desired_root = None
-    root = metadata.getroot()
-    for elt in root.iter(tag=etree.Element):
-        if (
-            elt.tag.endswith("NumericalData")
-            or elt.tag.endswith("DisplayData")
-            or elt.tag.endswith("Collection")
-        ):
-            desired_root = elt
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData", "Collection")
     revision_history = []
     release_date = ""
 
-    # traverse xml to extract needed info
-    for child in desired_root.iter(tag=etree.Element):
-        if child.tag.endswith("ResourceHeader"):
-            target_child = child
-            for child in target_child:
-                # find ReleaseDate and construct datetime object from the string
-                try:
-                    if child.tag.endswith("ReleaseDate"):
-                        date, _, time_str = child.text.partition("T")
-                        if "Z" in child.text:
-                            time_str = time_str.replace("Z", "")
-                        if "." in child.text:
-                            time_str, _, _ = time_str.partition(".")
-                        dt_string = date + " " + time_str
-                        dt_obj = datetime.strptime(dt_string, "%Y-%m-%d %H:%M:%S")
-                        release_date = dt_obj
-                    elif child.tag.endswith("RevisionHistory"):
-                        rev_hist_child = child
-                        for child in rev_hist_child:
-                            rev_ev_child = child
-                            for child in rev_ev_child:
-                                if child.tag.endswith("ReleaseDate"):
-                                    date, _, time_str = child.text.partition("T")
-                                    if "Z" in child.text:
-                                        time_str = time_str.replace("Z", "")
-                                    if "." in child.text:
-                                        time_str, _, _ = time_str.partition(".")
-                                    dt_string = date + " " + time_str
-                                    try:
-                                        dt_obj = datetime.strptime(
-                                            dt_string, "%Y-%m-%d %H:%M:%S"
-                                        )
-                                    # catch error when RevisionHistory is not formatted w time
-                                    except ValueError:
-                                        dt_obj = datetime.strptime(
-                                            dt_string.strip(), "%Y-%m-%d"
-                                        ).date()
-                                    finally:
-                                        revision_history.append(dt_obj)
-                except AttributeError:
-                    continue
+    # look up needed info in the index
+    for target_child in index.iter("ResourceHeader", desired_root):
+        for child in target_child:
+            # find ReleaseDate and construct datetime object from the string
+            try:
+                if child.tag.endswith("ReleaseDate"):
+                    date, _, time_str = child.text.partition("T")
+                    if "Z" in child.text:
+                        time_str = time_str.replace("Z", "")
+                    if "." in child.text:
+                        time_str, _, _ = time_str.partition(".")
+                    dt_string = date + " " + time_str
+                    dt_obj = datetime.strptime(dt_string, "%Y-%m-%d %H:%M:%S")
+                    release_date = dt_obj
+                elif child.tag.endswith("RevisionHistory"):
+                    rev_hist_child = child
+                    for child in rev_hist_child:
+                        rev_ev_child = child
+                        for child in rev_ev_child:
+                            if child.tag.endswith("ReleaseDate"):
+                                date, _, time_str = child.text.partition("T")
+                                if "Z" in child.text:
+                                    time_str = time_str.replace("Z", "")
+                                if "." in child.text:
+                                    time_str, _, _ = time_str.partition(".")
+                                dt_string = date + " " + time_str
+                                try:
+                                    dt_obj = datetime.strptime(
+                                        dt_string, "%Y-%m-%d %H:%M:%S"
+                                    )
+                                # catch error when RevisionHistory is not formatted w time
+                                except ValueError:
+                                    dt_obj = datetime.strptime(
+                                        dt_string.strip(), "%Y-%m-%d"
+                                    ).date()
+                                finally:
+                                    revision_history.append(dt_obj)
+            except AttributeError:
+                continue
     return release_date, revision_history
 
 
@@ -1746,71 +2341,66 @@ def name_splitter(person: str) -> tuple[str, str, str]:
     return name_str, given_name, family_name
 
 
-def get_information_url(metadata: etree.ElementTree) -> Union[List[Dict], None]:
+def get_information_url(
+    metadata: etree.ElementTree, index: SpaseIndex = None
+) -> Union[List[Dict], None]:
     """
     Returns all relevant information from the SPASE informationURL(s) property for use
     within the schema.org citation property.
 
     :param metadata: The SPASE metadata object as an XML tree.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The name, description, and url(s) for all InformationURL
                 sections found in the ResourceHeader, formatted as a
                 list of dictionaries.
     """
-    root = metadata.getroot()
     information_url = []
     name = ""
     description = ""
     url = ""
-    desired_root = None
-    for elt in root.iter(tag=etree.Element):
-        if (
-            elt.tag.endswith("NumericalData")
-            or elt.tag.endswith("DisplayData")
-            or elt.tag.endswith("Observatory")
-            or elt.tag.endswith("Instrument")
-            or elt.tag.endswith("Collection")
-        ):
-            desired_root = elt
-    # traverse xml to extract needed info
-    for child in desired_root.iter(tag=etree.Element):
-        if child.tag.endswith("ResourceHeader"):
-            target_child = child
-            # iterate thru children to locate AccessURL and Format
-            for child in target_child:
-                try:
-                    if child.tag.endswith("InformationURL"):
-                        target_child = child
-                        # iterate thru children to locate URL
-                        for child in target_child:
-                            if child.tag.endswith("Name"):
-                                name = child.text
-                            elif child.tag.endswith("URL"):
-                                url = child.text
-                            elif child.tag.endswith("Description"):
-                                description = child.text
-                        if name:
-                            if description:
-                                information_url.append(
-                                    {
-                                        "name": name,
-                                        "url": url,
-                                        "description": description,
-                                    }
-                                )
-                            else:
-                                information_url.append({"name": name, "url": url})
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last(
+        "NumericalData", "DisplayData", "Observatory", "Instrument", "Collection"
+    )
+    # look up needed info in the index
+    for target_child in index.iter("ResourceHeader", desired_root):
+        # iterate thru children to locate AccessURL and Format
+        for child in target_child:
+            try:
+                if child.tag.endswith("InformationURL"):
+                    target_child = child
+                    # iterate thru children to locate URL
+                    for child in target_child:
+                        if child.tag.endswith("Name"):
+                            name = child.text
+                        elif child.tag.endswith("URL"):
+                            url = child.text
+                        elif child.tag.endswith("Description"):
+                            description = child.text
+                    if name:
+                        if description:
+                            information_url.append(
+                                {
+                                    "name": name,
+                                    "url": url,
+                                    "description": description,
+                                }
+                            )
                         else:
-                            information_url.append({"url": url})
-                except AttributeError:
-                    continue
+                            information_url.append({"name": name, "url": url})
+                    else:
+                        information_url.append({"url": url})
+            except AttributeError:
+                continue
     if not information_url:
         information_url = None
     return information_url
 
 
 def get_instrument(
-    metadata: etree.ElementTree, path: str, **kwargs: dict
+    metadata: etree.ElementTree, path: str, index: SpaseIndex = None, **kwargs: dict
 ) -> Union[List[Dict], None]:
     """
     Attempts to retrieve all relevant information associated with all InstrumentID fields
@@ -1818,6 +2408,7 @@ def get_instrument(
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param path: The absolute file path of the XML file the user wishes to pull info from.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The name, url, and ResourceID for each instrument found in the InstrumentID section,
                 formatted as a list of dictionaries.
@@ -1827,18 +2418,15 @@ def get_instrument(
     # prov:Entity found at https://www.w3.org/TR/prov-o/#Entity
     # sosa:System found at https://w3c.github.io/sdw-sosa-ssn/ssn/#SOSASystem
 
-    root = metadata.getroot()
-    desired_root = None
     instrument = []
     instrument_ids = {}
     if path:
         path = path.replace("\\", "/")
-    for elt in root.iter(tag=etree.Element):
-        if elt.tag.endswith("NumericalData") or elt.tag.endswith("DisplayData"):
-            desired_root = elt
-    for child in desired_root.iter(tag=etree.Element):
-        if child.tag.endswith("InstrumentID"):
-            instrument_ids[child.text] = {}
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData")
+    for child in index.iter("InstrumentID", desired_root):
+        instrument_ids[child.text] = {}
     if not instrument_ids:
         instrument = None
     else:
@@ -1888,18 +2476,12 @@ def get_instrument(
                 record = abs_path + item.replace("spase://", "") + ".xml"
             record = record.replace("'", "")
             if os.path.isfile(record):
-                test_spase = SPASE(record)
-                root = test_spase.metadata.getroot()
-                instrument_ids[item]["name"] = test_spase.get_name()
-                instrument_ids[item]["URL"] = test_spase.get_url()
+                name, url, _ = get_hierarchy_record(record)
+                instrument_ids[item]["name"] = name
+                instrument_ids[item]["URL"] = url
             else:
                 # add file to log containing problematic records/files
-                if os.path.exists(temp_file_path):
-                    temp_file.seek(0)
-                    if temp_file.read():
-                        temp_file.write(f", {record}")
-                    else:
-                        temp_file.write(f"{record}")
+                add_problematic_record(record, MISSING_INSTRUMENT)
         for k in instrument_ids.keys():
             if instrument_ids[k]["URL"]:
                 instrument.append(
@@ -1919,7 +2501,9 @@ def get_instrument(
     return instrument
 
 
-def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict], None]:
+def get_observatory(
+    metadata: etree.ElementTree, path: str, index: SpaseIndex = None
+) -> Union[List[Dict], None]:
     """
     Uses the get_instrument function to attempt to retrieve all relevant information
     associated with any ObservatoryID (and ObservatoryGroupID) fields
@@ -1928,6 +2512,7 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param path: The absolute file path of the XML file the user wishes to pull info from.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns:   The name, url, and ResourceID for each observatory related to this dataset,
                 formatted as a list of dictionaries.
@@ -1939,7 +2524,7 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
     # prov:Entity found at https://www.w3.org/TR/prov-o/#Entity
     # sosa:Platform found at https://w3c.github.io/sdw-sosa-ssn/ssn/#SOSAPlatform
 
-    instrument = get_instrument(metadata, path)
+    instrument = get_instrument(metadata, path, index)
     if instrument is not None:
         observatory = []
         observatory_group_id = ""
@@ -1976,14 +2561,9 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
             # follow link provided by instrument to instrument page,
             #   from there grab ObservatoryID
             if os.path.isfile(record):
-                test_spase = SPASE(record)
-                root = test_spase.metadata.getroot()
-                for elt in root.iter(tag=etree.Element):
-                    if elt.tag.endswith("Instrument"):
-                        desired_root = elt
-                for child in desired_root.iter(tag=etree.Element):
-                    if child.tag.endswith("ObservatoryID"):
-                        observatory_id = child.text
+                _, _, parent = get_hierarchy_record(record, "Instrument")
+                if parent is not None:
+                    observatory_id = parent
                 # add SPASE repo that contains observatories to log file also
                 repo_name, _, after = observatory_id.replace("spase://", "").partition(
                     "/"
@@ -2003,17 +2583,9 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
                     record = abs_path + observatory_id.replace("spase://", "") + ".xml"
                 record = record.replace("'", "")
                 if os.path.isfile(record):
-                    url = ""
-                    test_spase = SPASE(record)
-                    root = test_spase.metadata.getroot()
-                    for elt in root.iter(tag=etree.Element):
-                        if elt.tag.endswith("Observatory"):
-                            desired_root = elt
-                    for child in desired_root.iter(tag=etree.Element):
-                        if child.tag.endswith("ObservatoryGroupID"):
-                            observatory_group_id = child.text
-                    name = test_spase.get_name()
-                    url = test_spase.get_url()
+                    name, url, parent = get_hierarchy_record(record, "Observatory")
+                    if parent is not None:
+                        observatory_group_id = parent
                     # finally, follow that link to grab name and url from there
                     if observatory_group_id:
                         # add SPASE repo that contains observatory group to log file also
@@ -2040,10 +2612,7 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
                             )
                         record = record.replace("'", "")
                         if os.path.isfile(record):
-                            group_url = ""
-                            test_spase = SPASE(record)
-                            group_name = test_spase.get_name()
-                            group_url = test_spase.get_url()
+                            group_name, group_url, _ = get_hierarchy_record(record)
                             if group_url:
                                 if observatory_group_id not in recorded_ids:
                                     observatory.append(
@@ -2067,12 +2636,7 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
                                     recorded_ids.append(observatory_group_id)
                         else:
                             # add obsGrp to log file containing problematic records/files
-                            if os.path.exists(temp_file_path):
-                                temp_file.seek(0)
-                                if temp_file.read():
-                                    temp_file.write(f", {record}")
-                                else:
-                                    temp_file.write(f"{record}")
+                            add_problematic_record(record, MISSING_OBSERVATORY_GROUP)
                     if url and (observatory_id not in recorded_ids):
                         observatory.append(
                             {
@@ -2094,43 +2658,33 @@ def get_observatory(metadata: etree.ElementTree, path: str) -> Union[List[Dict],
                         )
                         recorded_ids.append(observatory_id)
                 else:
-                    if os.path.exists(temp_file_path):
-                        temp_file.seek(0)
-                        if temp_file.read():
-                            temp_file.write(f", {record}")
-                        else:
-                            temp_file.write(f"{record}")
+                    add_problematic_record(record, MISSING_OBSERVATORY)
     else:
         observatory = None
     return observatory
 
 
-def get_alternate_name(metadata: etree.ElementTree) -> Union[str, None]:
+def get_alternate_name(
+    metadata: etree.ElementTree, index: SpaseIndex = None
+) -> Union[str, None]:
     """
     :param metadata: The SPASE metadata object as an XML tree.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The alternate name of the dataset as a string.
     """
-    root = metadata.getroot()
     alternate_name = None
-    desired_root = None
-    for elt in root.iter(tag=etree.Element):
-        if (
-            elt.tag.endswith("NumericalData")
-            or elt.tag.endswith("DisplayData")
-            or elt.tag.endswith("Collection")
-        ):
-            desired_root = elt
-    for child in desired_root.iter(tag=etree.Element):
-        if child.tag.endswith("ResourceHeader"):
-            target_child = child
-            # iterate thru children to locate AlternateName for dataset
-            for child in target_child:
-                try:
-                    if child.tag.endswith("AlternateName"):
-                        alternate_name = child.text
-                except AttributeError:
-                    continue
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData", "Collection")
+    for target_child in index.iter("ResourceHeader", desired_root):
+        # iterate thru children to locate AlternateName for dataset
+        for child in target_child:
+            try:
+                if child.tag.endswith("AlternateName"):
+                    alternate_name = child.text
+            except AttributeError:
+                continue
     return alternate_name
 
 
@@ -2184,7 +2738,7 @@ def get_cadence_context(cadence: str) -> Union[str, None]:
 
 
 def get_mentions(
-    metadata: etree.ElementTree, file: str, **kwargs: dict
+    metadata: etree.ElementTree, file: str, index: SpaseIndex = None, **kwargs: dict
 ) -> Union[List[Dict], Dict, None]:
     """
     Scrapes any AssociationIDs with the AssociationType "Other" and formats them
@@ -2192,6 +2746,7 @@ def get_mentions(
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param file: The file path of the SPASE record being scraped.
+    :param index: The index of `metadata`, built from `metadata` if not given.
     :param **kwargs: Allows for additional parameters to be passed (only to be used for testing).
 
     :returns: The ID's of other SPASE records related to this one in some way.
@@ -2199,21 +2754,15 @@ def get_mentions(
     # Mapping: schema:mentions = spase:Association/spase:AssociationID
     #   (if spase:AssociationType is "Other")
     # schema:mentions found at https://schema.org/mentions
-    root = metadata.getroot()
-    desired_root = None
-    for elt in root.iter(tag=etree.Element):
-        if (
-            elt.tag.endswith("NumericalData")
-            or elt.tag.endswith("DisplayData")
-            or elt.tag.endswith("Collection")
-        ):
-            desired_root = elt
-    mentions = get_relation(desired_root, ["Other"], file, **kwargs)
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData", "Collection")
+    mentions = get_relation(desired_root, ["Other"], file, index=index, **kwargs)
     return mentions
 
 
 def get_is_part_of(
-    metadata: etree.ElementTree, file: str, **kwargs: dict
+    metadata: etree.ElementTree, file: str, index: SpaseIndex = None, **kwargs: dict
 ) -> Union[List[Dict], Dict, None]:
     """
     Scrapes any AssociationIDs with the AssociationType "PartOf" and formats them
@@ -2221,6 +2770,7 @@ def get_is_part_of(
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param file: The file path of the SPASE record being scraped.
+    :param index: The index of `metadata`, built from `metadata` if not given.
     :param **kwargs: Allows for additional parameters to be passed (only to be used for testing).
 
     :returns: The ID(s) of the larger resource this SPASE record is a portion of, as a dictionary.
@@ -2228,16 +2778,10 @@ def get_is_part_of(
     # Mapping: schema:isBasedOn = spase:Association/spase:AssociationID
     #   (if spase:AssociationType is "PartOf")
     # schema:isPartOf found at https://schema.org/isPartOf
-    root = metadata.getroot()
-    desired_root = None
-    for elt in root.iter(tag=etree.Element):
-        if (
-            elt.tag.endswith("NumericalData")
-            or elt.tag.endswith("DisplayData")
-            or elt.tag.endswith("Collection")
-        ):
-            desired_root = elt
-    is_part_of = get_relation(desired_root, ["PartOf"], file, **kwargs)
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData", "Collection")
+    is_part_of = get_relation(desired_root, ["PartOf"], file, index=index, **kwargs)
     return is_part_of
 
 
@@ -2256,7 +2800,6 @@ def get_orcid_and_affiliation(spase_id: str, file: str) -> tuple[str, str, str]:
     orcid_id = ""
     affiliation = ""
     ror = ""
-    desired_root = None
     if file:
         file = file.replace("\\", "/")
     if (spase_id is not None) and (file is not None):
@@ -2290,37 +2833,32 @@ def get_orcid_and_affiliation(spase_id: str, file: str) -> tuple[str, str, str]:
             record = abs_path + spase_id.replace("spase://", "") + ".xml"
         record = record.replace("'", "")
         if os.path.isfile(record):
-            test_spase = SPASE(record)
-            root = test_spase.metadata.getroot()
-            # iterate thru xml to get desired info
-            for elt in root.iter(tag=etree.Element):
-                if elt.tag.endswith("Person") or elt.tag.endswith("Repository"):
-                    desired_root = elt
-            for child in desired_root.iter(tag=etree.Element):
-                if child.tag.endswith("ORCIdentifier"):
-                    orcid_id = child.text
-                elif child.tag.endswith("OrganizationName"):
-                    affiliation = child.text
-                elif child.tag.endswith("RORIdentifier"):
-                    ror = child.text
+            # look up desired info in the index of Person records, or else
+            #   parse the record
+            indexed = get_person_index().get(record)
+            if indexed is not None:
+                linked_records.note(record)
+                orcid_id, affiliation, ror = indexed
+            else:
+                orcid_id, affiliation, ror = read_person_record(
+                    get_linked_record(record)
+                )
         else:
             # add file to log containing problematic records/files
-            if os.path.exists(temp_file_path):
-                temp_file.seek(0)
-                if temp_file.read():
-                    temp_file.write(f", {record}")
-                else:
-                    temp_file.write(f"{record}")
+            add_problematic_record(record, MISSING_PERSON)
     return orcid_id, affiliation, ror
 
 
-def get_temporal(metadata: etree.ElementTree, namespaces: Dict) -> Union[List, None]:
+def get_temporal(  # pylint: disable=unused-argument
+    metadata: etree.ElementTree, namespaces: Dict, index: SpaseIndex = None
+) -> Union[List, None]:
     """
     Scrapes the TemporalDescription:Cadence field in SPASE for use in the
     schema.org temporal property.
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param namespaces: The SPASE namespaces used in the form of a dictionary.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The cadence or common time interval between the start of successive measurements,
                 given in its ISO 8601 formatting as well as a explanation sentence.
@@ -2329,20 +2867,12 @@ def get_temporal(metadata: etree.ElementTree, namespaces: Dict) -> Union[List, N
     # Each object is:
     #   [ explanation (string explaining meaning of cadence), Cadence]
     # Schema found at https://schema.org/temporal
-    root = metadata.getroot()
-    desired_root = None
-    for elt in root.iter(tag=etree.Element):
-        if elt.tag.endswith("NumericalData") or elt.tag.endswith("DisplayData"):
-            desired_root = elt
-
-    desired_tag = desired_root.tag.split("}")
-    spase_location = (
-        ".//spase:" + f"{desired_tag[1]}/spase:TemporalDescription/spase:Cadence"
-    )
-    repeat_frequency = metadata.findtext(
-        spase_location,
-        namespaces=namespaces,
-    )
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData")
+
+    desired_tag = local_name(desired_root)
+    repeat_frequency = index.findtext(desired_tag, "TemporalDescription", "Cadence")
 
     explanation = ""
 
@@ -2354,9 +2884,12 @@ def get_temporal(metadata: etree.ElementTree, namespaces: Dict) -> Union[List, N
     return delete_null_values(temporal)
 
 
-def get_metadata_license(metadata: etree.ElementTree) -> Union[str, None]:
+def get_metadata_license(
+    metadata: etree.ElementTree, index: SpaseIndex = None
+) -> Union[str, None]:
     """
     :param metadata: The metadata object as an XML tree.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The metadata license(s) of the SPASE record.
     """
@@ -2373,18 +2906,14 @@ def get_metadata_license(metadata: etree.ElementTree) -> Union[str, None]:
             </Rights>
         </MetadataRightsList>"""
     metadata_license = []
-    desired_root = None
-    root = metadata.getroot()
-    for elt in root.iter(tag=etree.Element):
-        if elt.tag.endswith("MetadataRightsList"):
-            desired_root = elt
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("MetadataRightsList")
     if desired_root is not None:
-        for elt in desired_root.iter(tag=etree.Element):
-            if elt.tag.endswith("Rights"):
-                target_child = elt
-                for child in target_child:
-                    if child.tag.endswith("RightsName"):
-                        metadata_license.append(child.text)
+        for target_child in index.iter("Rights", desired_root):
+            for child in target_child:
+                if child.tag.endswith("RightsName"):
+                    metadata_license.append(child.text)
         if not metadata_license:
             metadata_license = None
     else:
@@ -2442,14 +2971,7 @@ def process_authors(
     # if all creators were found in PublicationInfo/Authors
     else:
         # determine if authors are a consortium
-        with open(
-            importlib.resources.files("soso.strategies.spase").joinpath(
-                "spase-ignoreCreatorSplit.txt"
-            ),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            do_not_split = f.read()
+        split_creators = not ignores_creator_split(file)
         # if file is not in list of ones to not have their creators split
         # and there are multiple authors
         if (
@@ -2457,7 +2979,7 @@ def process_authors(
             or ("., " in author_str)
             or (" and " in author_str)
             or (" & " in author_str)
-        ) and file not in do_not_split:
+        ) and split_creators:
             if ";" in author_str:
                 author = author_str.split("; ")
             elif ".," in author_str:
@@ -2561,7 +3083,7 @@ def process_authors(
             person = author_str.replace("'", "")
             if author_role == ["Author"]:
                 # if author is a person (assuming names contain a comma)
-                if ", " in person and file not in do_not_split:
+                if ", " in person and split_creators:
                     family_name, _, given_name = person.partition(", ")
                     # also used when there are 3+ comma separated orgs
                     #   listed as authors - not intended (how to fix?)
@@ -2574,7 +3096,7 @@ def process_authors(
                     author[0] = (f"{family_name}, {given_name}").strip()
                 else:
                     # handle case when assumption 'names have commas' fails
-                    if ". " in person and file not in do_not_split:
+                    if ". " in person and split_creators:
                         given_name, _, family_name = person.partition(". ")
                         if " " in family_name:
                             initial, _, family_name = family_name.partition(" ")
@@ -2590,6 +3112,30 @@ def process_authors(
     return author, author_role, contacts_list
 
 
+def request_and_record_failures(
+    method: str, url: str, timeout: float = 30
+) -> CachedResponse:
+    """
+    Sends an HTTP request through the shared HTTP cache. A request that fails, or
+    whose response is an error, is added to problem_collector as an HTTP_FAILURE.
+    Errors are raised as they would be without recording them.
+
+    :param method: The HTTP method, e.g. "GET".
+    :param url: The URL requested.
+    :param timeout: The number of seconds to wait for the server.
+
+    :returns: The response.
+    """
+    try:
+        response = get_http_cache().request(method, url, timeout=timeout)
+    except Exception:
+        add_problematic_record(url, HTTP_FAILURE)
+        raise
+    if response.status_code >= 400:
+        add_problematic_record(url, HTTP_FAILURE)
+    return response
+
+
 def verify_type(url: str) -> tuple[bool, bool, dict]:
     """
     Verifies that the link found in AssociationID is to a dataset or journal article and acquires
@@ -2611,7 +3157,7 @@ def verify_type(url: str) -> tuple[bool, bool, dict]:
                 is_dataset = True
         # case where url provided is a DOI
         else:
-            link = requests.head(url, timeout=30)
+            link = request_and_record_failures("HEAD", url, timeout=30)
             # check to make sure doi resolved to an spase-metadata.org page
             if "spase-metadata.org" in link.headers["location"]:
                 if "Data" in link.headers["location"]:
@@ -2623,9 +3169,8 @@ def verify_type(url: str) -> tuple[bool, bool, dict]:
                 # dataciteLink = f"https://api.datacite.org/dois/{doi}"
                 # headers = {"accept": "application/vnd.api+json"}
                 # response = requests.get(dataciteLink, headers=headers)
-                response = requests.get(
-                    f"https://api.datacite.org/application/vnd.datacite.datacite+json/{doi}",
-                    timeout=30,
+                response = request_and_record_failures(
+                    "GET", f"{DATACITE_API}{doi}", timeout=30
                 )
                 if response.raise_for_status() is None:
                     datacite_dict = json.loads(response.text)
@@ -2709,36 +3254,52 @@ def verify_type(url: str) -> tuple[bool, bool, dict]:
     return is_dataset, is_article, non_spase_info
 
 
-def get_resource_id(metadata: etree.ElementTree, namespaces: Dict) -> Union[str, None]:
+def verify_types(urls: List) -> Dict:
+    """
+    Runs verify_type for each of the given links concurrently, with up to
+    HTTP_POOL_SIZE requests in flight. Requests share a session, so
+    connections to doi.org and DataCite are reused.
+
+    :param urls: The links provided as Associated works/references for the SPASE record.
+
+    :returns: A dictionary mapping each link to the result of verify_type for it.
+    """
+    urls = list(dict.fromkeys(urls))
+    if len(urls) < 2:
+        return {url: verify_type(url) for url in urls}
+    with ThreadPoolExecutor(min(len(urls), HTTP_POOL_SIZE)) as executor:
+        return dict(zip(urls, executor.map(verify_type, urls)))
+
+
+def get_resource_id(  # pylint: disable=unused-argument
+    metadata: etree.ElementTree, namespaces: Dict, index: SpaseIndex = None
+) -> Union[str, None]:
     """
     :param metadata: The SPASE metadata object as an XML tree.
     :param namespaces: The SPASE namespaces used in the form of a dictionary.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The ResourceID for the SPASE record.
     """
-    root = metadata.getroot()
-    desired_root = None
     dataset_id = None
-    # pylint: disable=too-many-boolean-expressions
-    for elt in root.iter(tag=etree.Element):
-        if (
-            elt.tag.endswith("NumericalData")
-            or elt.tag.endswith("DisplayData")
-            or elt.tag.endswith("Observatory")
-            or elt.tag.endswith("Instrument")
-            or elt.tag.endswith("Person")
-            or elt.tag.endswith("Collection")
-        ):
-            desired_root = elt
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last(
+        "NumericalData",
+        "DisplayData",
+        "Observatory",
+        "Instrument",
+        "Person",
+        "Collection",
+    )
 
-    desired_tag = desired_root.tag.split("}")
-    spase_location = ".//spase:" + f"{desired_tag[1]}/spase:ResourceID"
-    dataset_id = metadata.findtext(spase_location, namespaces=namespaces)
+    desired_tag = local_name(desired_root)
+    dataset_id = index.findtext(desired_tag, "ResourceID")
     return dataset_id
 
 
-def get_measurement_method(
-    metadata: etree.ElementTree, namespaces: Dict
+def get_measurement_method(  # pylint: disable=unused-argument
+    metadata: etree.ElementTree, namespaces: Dict, index: SpaseIndex = None
 ) -> Union[List, None]:
     """
     Scrapes all measurementType fields found in the SPASE record and maps them to
@@ -2746,20 +3307,18 @@ def get_measurement_method(
 
     :param metadata: The SPASE metadata object as an XML tree.
     :param namespaces: The SPASE namespaces used in the form of a dictionary.
+    :param index: The index of `metadata`, built from `metadata` if not given.
 
     :returns: The MeasurementType(s) for the SPASE record.
     """
     # Mapping: schema:measurementMethod = spase:MeasurementType
     # schema:measurementMethod found at https://schema.org/measurementMethod
     measurement_method = []
-    desired_root = None
-    root = metadata.getroot()
-    for elt in root.iter(tag=etree.Element):
-        if elt.tag.endswith("NumericalData") or elt.tag.endswith("DisplayData"):
-            desired_root = elt
-    desired_tag = desired_root.tag.split("}")
-    spase_location = ".//spase:" + f"{desired_tag[1]}/spase:MeasurementType"
-    all_measures = metadata.findall(spase_location, namespaces=namespaces)
+    if index is None:
+        index = SpaseIndex(metadata)
+    desired_root = index.last("NumericalData", "DisplayData")
+    desired_tag = local_name(desired_root)
+    all_measures = index.findall(desired_tag, "MeasurementType")
     for item in all_measures:
         # Split string on uppercase characters
         res = re.split(r"(?=[A-Z])", item.text)
@@ -2795,7 +3354,11 @@ def get_measurement_method(
 
 
 def get_relation(
-    desired_root: etree.Element, association: list[str], file="", **kwargs: dict
+    desired_root: etree.Element,
+    association: list[str],
+    file="",
+    index: SpaseIndex = None,
+    **kwargs: dict,
 ) -> Union[List[Dict], Dict, None]:
     """
     Scrapes through the SPASE record and returns the AssociationIDs which have the
@@ -2805,6 +3368,8 @@ def get_relation(
     :param desired_root: The element in the SPASE metadata tree object we are searching from.
     :param association: The AssociationType(s) we are searching for in the SPASE record.
     :param file: The file path of the SPASE record being converted.
+    :param index: The index of the tree `desired_root` belongs to, built from
+        that tree if not given.
     :param **kwargs: Allows for additional parameters to be passed (only to be used for testing).
 
     :returns: The ID's of other SPASE records related to this one in some way.
@@ -2815,19 +3380,19 @@ def get_relation(
     relational_records = {}
     if file:
         file = file.replace("\\", "/")
-    # iterate thru xml to find desired info
+    # look up desired info in the index
     if desired_root is not None:
-        for child in desired_root.iter(tag=etree.Element):
-            if child.tag.endswith("Association"):
-                target_child = child
-                for child in target_child:
-                    if child.tag.endswith("AssociationID"):
-                        assoc_id = child.text
-                    elif child.tag.endswith("AssociationType"):
-                        assoc_type = child.text
-                for each in association:
-                    if assoc_type == each:
-                        relations.append(assoc_id)
+        if index is None:
+            index = SpaseIndex(desired_root.getroottree())
+        for target_child in index.iter("Association", desired_root):
+            for child in target_child:
+                if child.tag.endswith("AssociationID"):
+                    assoc_id = child.text
+                elif child.tag.endswith("AssociationType"):
+                    assoc_type = child.text
+            for each in association:
+                if assoc_type == each:
+                    relations.append(assoc_id)
         if not relations:
             relation = None
         else:
@@ -2871,7 +3436,7 @@ def get_relation(
                     record = home_dir + "/" + record.replace("spase://", "") + ".xml"
                 record = record.replace("'", "")
                 if os.path.isfile(record):
-                    test_spase = SPASE(record)
+                    test_spase = get_linked_record(record)
                     url = test_spase.get_url()
                     name = test_spase.get_name()
                     description = test_spase.get_description()
@@ -2895,23 +3460,22 @@ def get_relation(
                         relational_records[url]["license"] = spase_license
 
                 else:
-                    if os.path.exists(temp_file_path):
-                        temp_file.seek(0)
-                        if temp_file.read():
-                            temp_file.write(f", {record}")
-                        else:
-                            temp_file.write(f"{record}")
+                    add_problematic_record(record, MISSING_RELATED_RECORD)
                 i += 1
             # add correct type
             if len(relations) > 1:
                 relation = []
             # not SPASE records
             if not relational_records:
+                # verify all links at once
+                types = verify_types(
+                    [each for each in relations if "spase" not in each]
+                )
                 for each in relations:
                     if "spase" not in each:
                         # most basic entry into relation
                         entry = {"@id": each, "identifier": each, "url": each}
-                        is_dataset, is_article, non_spase_info = verify_type(each)
+                        is_dataset, is_article, non_spase_info = types[each]
                         if is_dataset:
                             entry["@type"] = "Dataset"
                             entry["name"] = non_spase_info["name"]
@@ -2926,10 +3490,12 @@ def get_relation(
                         else:
                             relation = entry
             else:
+                # verify all links at once
+                types = verify_types(list(relational_records.keys()))
                 for each in relational_records.keys():
                     # most basic entry into relation
                     entry = {"@id": each, "identifier": each, "url": each}
-                    is_dataset, is_article, non_spase_info = verify_type(each)
+                    is_dataset, is_article, non_spase_info = types[each]
                     if is_dataset:
                         entry["@type"] = "Dataset"
                         entry["name"] = relational_records[each]["name"]
@@ -3083,12 +3649,20 @@ def find_match(
 
 
 def get_problematic_records() -> str:
-    """Saves input from various functions to the temp file containing problematic
-    records found during script, closes the file, and returns the content."""
-    problematic_records = ""
-    if os.path.exists(temp_file_path):
-        temp_file.seek(0)
-        problematic_records = temp_file.read()
-        # print("Records are: " + problematic_records)
-        temp_file.close()  # Close and remove the temp file object
+    """Returns the problematic records found during script, and forgets them.
+
+    :returns: The distinct subjects of the problems in problem_collector, such as
+        the paths of linked records that could not be found, separated by
+        commas."""
+    problematic_records = ", ".join(problem_collector.subjects())
+    problem_collector.take()
     return problematic_records
+
+
+def take_problematic_records() -> List[Dict]:
+    """Returns the problems found since the last call and forgets them. Lets each
+    record (or worker process) report its own problematic records.
+
+    :returns: The problems in problem_collector, as dictionaries of "category",
+        "subject" and "count", as from ProblemCollector.take."""
+    return problem_collector.take()
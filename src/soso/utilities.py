@@ -1,17 +1,26 @@
 """Utilities"""
 
 import mimetypes
+import os
 import re
-import logging
+import threading
+import time
 from urllib.parse import urlparse
 from importlib import resources
 from numbers import Number
-from json import dumps
+from json import dumps, loads
+from json.encoder import encode_basestring_ascii
 import pathlib
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Union
 import warnings
-import requests
-import daiquiri
+
+if TYPE_CHECKING:
+    import requests
+
+# requests, daiquiri, sqlite3 and logging are slow to import, and only needed
+# to look up DOIs, cache them and set up logging, so they are imported where
+# used.
+# pylint: disable=import-outside-toplevel
 
 
 def get_sssom_file_path(strategy: str) -> pathlib.Path:
@@ -147,19 +156,379 @@ def delete_unused_vocabularies(graph: dict) -> dict:
     :returns:   The JSON-LD graph, with unused vocabularies removed from the
                 top level @context.
     """
-    # Create a copy of the graph for comparison
+    # Look for the vocabularies everywhere but in the @context itself
     graph_copy = graph.copy()
     del graph_copy["@context"]
-    graph_copy = dumps(graph_copy)
+    prefixes = [key for key in graph["@context"] if key != "@vocab"]
+    used = find_used_prefixes(graph_copy, prefixes)
     # Remove vocabularies whose keys are not in the graph, @vocab is preserved
-    for key in list(graph["@context"]):
-        if (
-            key != "@vocab" and key + ":" not in graph_copy
-        ):  # ":" is added to avoid partial matches
+    for key in prefixes:
+        if key not in used:
             del graph["@context"][key]
     return graph
 
 
+def find_used_prefixes(graph: Any, prefixes: list) -> set:
+    """Find which vocabulary prefixes are used in a JSON-LD graph, walking
+    its keys and string values once.
+
+    :param graph: The JSON-LD graph, or any part of it.
+    :param prefixes: The vocabulary prefixes to look for, e.g. "prov".
+
+    :returns:   The prefixes followed by ":" in a key or string value of the
+                graph.
+
+    Notes:
+        A prefix is used if "prefix:" appears in the graph as serialized to
+        JSON, including as the end of a longer word (e.g. "xprov:" uses
+        "prov"). Strings are checked in their JSON escaped form, so the
+        results match searching the output of `json.dumps` for each prefix,
+        without building that string.
+    """
+    prefixes = set(prefixes)
+    lengths = sorted({len(prefix) for prefix in prefixes})
+    used = set()
+
+    def search(text: str) -> None:
+        """Add the prefixes followed by ":" in the JSON escaped `text`."""
+        text = encode_basestring_ascii(text)
+        position = text.find(":")
+        while position != -1:
+            for length in lengths:
+                if length > position:
+                    break
+                if text[position - length : position] in prefixes:
+                    used.add(text[position - length : position])
+            position = text.find(":", position + 1)
+
+    # Containers are walked from a stack, and their strings searched in place
+    stack = [[graph]]
+    while stack and len(used) < len(prefixes):
+        container = stack.pop()
+        if isinstance(container, dict):
+            for key in container:
+                if isinstance(key, str) and ":" in key:
+                    search(key)
+            container = container.values()
+        for value in container:
+            if isinstance(value, str):
+                if ":" in value:
+                    search(value)
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+    return used
+
+
+# Maximum number of concurrent requests, and of open connections kept per host
+# by the shared HTTP session
+HTTP_POOL_SIZE = 8
+
+_HTTP_SESSION = None
+
+
+# pylint: disable=global-statement
+def get_http_session() -> "requests.Session":
+    """
+    Returns the HTTP session shared by functions looking up DOIs and their
+    metadata, created on first use. The session keeps connections to each host
+    open for reuse, up to `HTTP_POOL_SIZE` per host, so concurrent lookups
+    from threads don't open a new connection per request.
+
+    :returns: The shared requests Session.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+
+        _HTTP_SESSION = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+        )
+        _HTTP_SESSION.mount("http://", adapter)
+        _HTTP_SESSION.mount("https://", adapter)
+    return _HTTP_SESSION
+
+
+# Default number of seconds HTTP responses are kept in the HTTP cache
+HTTP_CACHE_TTL = 30 * 24 * 60 * 60
+
+
+class CachedResponse:  # pylint: disable=too-few-public-methods
+    """An HTTP response, fetched or read from the HTTP cache. Offers the parts
+    of `requests.Response` used by the functions looking up DOIs.
+
+    Attributes:
+        url: The URL requested.
+        status_code: The HTTP status code of the response.
+        headers: The headers of the response, with case-insensitive keys.
+        text: The body of the response.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, text: str):
+        from requests.structures import CaseInsensitiveDict
+
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.text = text
+
+    def raise_for_status(self) -> None:
+        """Raises a `requests.HTTPError` if the response is an error."""
+        if self.status_code >= 400:
+            from requests import HTTPError
+
+            raise HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+class HttpCache:  # pylint: disable=too-few-public-methods
+    """A persistent cache of the HTTP responses of DOI resolvers, DataCite and
+    crosscite, stored in a SQLite database in a directory. Responses are
+    reused until they are older than the time to live, so re-running a
+    conversion makes no network requests for the DOIs already looked up.
+
+    Attributes:
+        directory: The directory holding the cache database. When None,
+            nothing is cached and every request goes to the network.
+        ttl: The number of seconds a response is reused for.
+        offline: Whether to only read responses from the cache, whatever their
+            age. Requests missing from the cache raise a
+            `requests.ConnectionError` instead of going to the network.
+        hits: The number of responses read from the cache.
+        misses: The number of responses fetched from the network.
+
+    :param directory: The directory holding the cache database, created if
+        needed.
+    :param ttl: The number of seconds a response is reused for.
+    :param offline: Whether to only read responses from the cache.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, pathlib.Path, None] = None,
+        ttl: float = HTTP_CACHE_TTL,
+        offline: bool = False,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._database = None
+        if directory is not None:
+            pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+            import sqlite3
+
+            self._database = sqlite3.connect(
+                pathlib.Path(directory) / "http_cache.sqlite",
+                timeout=60,
+                check_same_thread=False,
+            )
+            self._database.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "url TEXT, status_code INTEGER, headers TEXT, text TEXT, "
+                "fetched REAL)"
+            )
+            self._database.commit()
+
+    def request(
+        self, method: str, url: str, headers: dict = None, timeout: float = 10
+    ) -> CachedResponse:
+        """
+        :param method: The HTTP method, e.g. "GET" or "HEAD".
+        :param url: The URL to request.
+        :param headers: The headers to send. Requests with different headers
+            are cached separately.
+        :param timeout: The number of seconds to wait for the server.
+
+        :returns: The response from the cache if it is there and fresh, or
+            else from the network. As with `requests`, redirects are followed
+            except for HEAD requests.
+        """
+        key = dumps([method, url, sorted((headers or {}).items())])
+        if self._database is not None:
+            with self._lock:
+                row = self._database.execute(
+                    "SELECT status_code, headers, text, fetched FROM responses "
+                    "WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                fresh = row is not None and (
+                    self.offline or time.time() - row[3] < self.ttl
+                )
+                if fresh:
+                    self.hits += 1
+            if fresh:
+                return CachedResponse(url, row[0], loads(row[1]), row[2])
+        if self.offline:
+            from requests import ConnectionError as RequestsConnectionError
+
+            raise RequestsConnectionError(
+                f"{method} {url} is not in the HTTP cache, and it is offline."
+            )
+        with self._lock:
+            self.misses += 1
+        response = get_http_session().request(
+            method,
+            url,
+            headers=headers,
+            timeout=timeout,
+            allow_redirects=method != "HEAD",
+        )
+        response = CachedResponse(
+            url, response.status_code, dict(response.headers), response.text
+        )
+        # server errors are likely temporary, so only keep other responses
+        if self._database is not None and response.status_code < 500:
+            with self._lock:
+                self._database.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        url,
+                        response.status_code,
+                        dumps(dict(response.headers)),
+                        response.text,
+                        time.time(),
+                    ),
+                )
+                self._database.commit()
+        return response
+
+
+_HTTP_CACHE = None
+
+
+def get_http_cache() -> HttpCache:
+    """
+    Returns the HTTP cache shared by functions looking up DOIs and their
+    metadata. Unless set with `configure_http_cache`, it is configured from
+    the environment variables:
+
+    - ``SOSO_HTTP_CACHE_DIR``: The directory holding the cache. Responses are
+      not cached if unset.
+    - ``SOSO_HTTP_CACHE_TTL``: The number of seconds a response is reused for.
+      Defaults to `HTTP_CACHE_TTL`.
+    - ``SOSO_HTTP_CACHE_OFFLINE``: Set to "1" to only read responses from the
+      cache.
+
+    The SPASE conversion script passes the cache settings on to its worker
+    processes, so a batch conversion in parallel shares one cache.
+
+    :returns: The shared HttpCache.
+    """
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None:
+        _HTTP_CACHE = HttpCache(
+            os.environ.get("SOSO_HTTP_CACHE_DIR"),
+            float(os.environ.get("SOSO_HTTP_CACHE_TTL", HTTP_CACHE_TTL)),
+            os.environ.get("SOSO_HTTP_CACHE_OFFLINE") == "1",
+        )
+    return _HTTP_CACHE
+
+
+def configure_http_cache(
+    directory: Union[str, pathlib.Path, None] = None,
+    ttl: float = HTTP_CACHE_TTL,
+    offline: bool = False,
+) -> HttpCache:
+    """
+    Sets the HTTP cache shared by functions looking up DOIs and their
+    metadata, replacing any configured from the environment.
+
+    :param directory: The directory holding the cache. Responses are not
+        cached if None.
+    :param ttl: The number of seconds a response is reused for.
+    :param offline: Whether to only read responses from the cache.
+
+    :returns: The shared HttpCache.
+    """
+    global _HTTP_CACHE
+    _HTTP_CACHE = HttpCache(directory, ttl, offline)
+    return _HTTP_CACHE
+
+
+class ProblemCollector:
+    """Problems found while converting records, such as linked records that
+    could not be found, or HTTP requests that failed, kept in memory. Each
+    problem is a category and a subject, e.g. the path of the missing record,
+    and is kept once, along with the number of times it was found. Problems are
+    kept in the order first found.
+
+    The problems of each worker process are collected separately. A conversion
+    run gathers them with `take` in each worker, and `merge` in the parent.
+    Problems can be added from several threads, such as those looking up DOIs.
+    """
+
+    def __init__(self):
+        self._counts = {}
+        # reentrant, as take gets the problems while holding it
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, category: str, subject: str) -> None:
+        """
+        :param category: The category of the problem, e.g. "missing Person".
+        :param subject: What the problem is about, e.g. the path of the record
+            that could not be found.
+        """
+        key = (category, subject)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def merge(self, problems: list) -> None:
+        """
+        :param problems: Problems to add, as returned by `problems` or `take`
+            of another collector.
+        """
+        with self._lock:
+            for problem in problems:
+                key = (problem["category"], problem["subject"])
+                self._counts[key] = self._counts.get(key, 0) + problem["count"]
+
+    def problems(self) -> list:
+        """
+        :returns: The problems, as dictionaries of "category", "subject" and
+            "count", which can be serialized as JSON or sent to another process.
+        """
+        with self._lock:
+            return [
+                {"category": category, "subject": subject, "count": count}
+                for (category, subject), count in self._counts.items()
+            ]
+
+    def subjects(self) -> list:
+        """
+        :returns: The distinct subjects of the problems, whatever their
+            category.
+        """
+        with self._lock:
+            return list(dict.fromkeys(subject for _, subject in self._counts))
+
+    def counts(self) -> dict:
+        """
+        :returns: The number of distinct problems of each category.
+        """
+        counts = {}
+        with self._lock:
+            for category, _ in self._counts:
+                counts[category] = counts.get(category, 0) + 1
+        return counts
+
+    def take(self) -> list:
+        """
+        :returns: The problems, as for `problems`, which are then forgotten.
+        """
+        with self._lock:
+            problems = self.problems()
+            self._counts.clear()
+        return problems
+
+
 def generate_citation_from_doi(url: str, style: str, locale: str) -> Union[str, None]:
     """
     :param url: The URL prefixed DOI.
@@ -176,9 +545,11 @@ def generate_citation_from_doi(url: str, style: str, locale: str) -> Union[str,
         This function supports the DOI registration agencies and methods listed
         `here <https://citation.crosscite.org/docs.html#sec-4>`_.
     """
+    from requests.exceptions import RequestException
+
     try:
         headers = {"Accept": "text/x-bibliography; style=" + style, "locale": locale}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = get_http_cache().request("GET", url, headers=headers, timeout=10)
         response.raise_for_status()
 
         # An HTTPS prefixed invalid DOI will return an HTML document that is
@@ -188,7 +559,7 @@ def generate_citation_from_doi(url: str, style: str, locale: str) -> Union[str,
             return None
 
         return response.text
-    except requests.exceptions.RequestException as citation_error:
+    except RequestException as citation_error:
         print(f"An error occurred while generating the citation: " f"{citation_error}")
         return None
 
@@ -314,6 +685,9 @@ def setup_logging(level: str = "INFO", log_file: str = None):
     :param level: Logging level to use (e.g., "DEBUG", "INFO", "WARNING", "ERROR").
     :param log_file: If provided, log output will also be written to this file.
     """
+    import logging
+    import daiquiri
+
     outputs = [daiquiri.output.Stream(formatter=daiquiri.formatter.ColorFormatter())]
     if log_file:
         outputs.append(daiquiri.output.File(log_file, formatter=logging.Formatter()))
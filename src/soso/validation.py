@@ -1,35 +1,88 @@
 """The validation module."""
 
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from importlib import resources
+from multiprocessing import get_context
 import pathlib
-import pyshacl.validate
+import string
+from typing import TYPE_CHECKING, Iterable, Union
+from soso.utilities import get_http_cache
 
+if TYPE_CHECKING:
+    import rdflib
 
-def validate(data_graph: str, shacl_graph: str = None) -> dict:
+# pyshacl, and rdflib with it, are slow to import, so they are only imported
+# when validating.
+# pylint: disable=import-outside-toplevel
+
+# The validator of a worker process of validate_many
+_WORKER_VALIDATOR = None
+
+# The characters JSON-LD strings may start with before the document: white
+# space, and the byte order mark of text read as UTF-8 rather than UTF-8-SIG
+_LEADING = string.whitespace + "\ufeff"
+
+
+def validate(
+    data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"],
+    shacl_graph: str = None,
+    contexts: dict = None,
+    structured: bool = False,
+) -> dict:
     """
     Validate a data graph against a SHACL shape graph.
 
     This is a simple wrapper around `pyshacl.validate`.
 
-    :param data_graph: The path to the data graph file in JSON-LD format.
+    :param data_graph: The path to the data graph file in JSON-LD format, its
+        ``http://`` or ``https://`` URL, fetched through the HTTP cache, or
+        the data graph itself, as a JSON-LD string or dictionary, such as
+        returned by `convert` and `convert_to_graph`, or as an rdflib Graph.
+        Data graphs in memory are validated without writing them to a file,
+        and rdflib Graphs without parsing them again.
     :param shacl_graph: The path to the SHACL shape graph file in Turtle format.
         If shacl_graph is a valid file path,use it. If it matches a known
         resource, resolve from package. If `None`, a default SOSO SHACL shape is
         used. Available package resources include: ``soso_common_v1.2.3.ttl``.
+    :param contexts: Remote JSON-LD context documents, such as that of
+        ``https://schema.org/``, by URL. A context referenced by the data graph
+        is fetched when not found in `contexts`, and added to it, so passing
+        the same dictionary to each call fetches each context once. Contexts
+        can also be added beforehand, e.g. to validate offline. Optional.
+    :param structured: Whether to also return the validation results as
+        data, read from the results graph of the validation. The text report
+        is rendered either way, as pyshacl renders the description of each
+        result as it is found, so this takes as long as validating for the
+        text report alone.
 
     :returns: A dictionary with validation results, including:
-        ``data_graph``: The input data graph path.
+        ``data_graph``: The input data graph.
         ``shacl_graph``: The resolved SHACL shape graph path.
         ``conforms``: Boolean indicating if the data graph conforms to the SHACL shape.
         ``report``: Full SHACL validation report as text.
+        ``results``: If `structured`, the validation results, each a
+        dictionary of the names of the ``shape`` and its ``severity``, the
+        ``path`` of the property validated, or `None`, the ``focus_node``
+        validated, and the ``message`` of the result, or `None`. Blank focus
+        nodes are named after their type, e.g.
+        ``[ a <https://schema.org/Dataset> ]``.
+
+    The SHACL shape graph is parsed on every call. Use a `Validator` to
+    validate many data graphs against the same shape graph.
     """
+    import pyshacl
+
+    if structured:
+        return Validator(shacl_graph, contexts).validate(data_graph, structured)
     if not shacl_graph:
         shacl_graph = _get_shacl_file_path()
     shape_file = _resolve_shacl_shape(shacl_graph)
     conforms, _, results_text = pyshacl.validate(
-        data_graph=data_graph,
+        data_graph=_load_data_graph(data_graph, contexts),
         shacl_graph=shape_file,
-        data_graph_format="json-ld",
         shacl_graph_format="turtle",
         inference="none",
         debug=False,
@@ -42,6 +95,398 @@ def validate(data_graph: str, shacl_graph: str = None) -> dict:
     }
 
 
+class Validator:  # pylint: disable=too-few-public-methods
+    """Validates data graphs against a SHACL shape graph that is parsed once.
+
+    Validating with a `Validator` gives the same results as `validate`, without
+    reading the shape graph again for each data graph. pyshacl still gathers
+    the shapes from the parsed graph for each data graph, and most of the time
+    of validating a large data graph is spent rendering its report, so a
+    `Validator` saves the most time on small data graphs.
+
+    Attributes:
+        shacl_graph: The resolved SHACL shape graph path.
+        contexts: The remote JSON-LD context documents by URL, fetched once
+            and reused for each data graph referencing them.
+    """
+
+    def __init__(self, shacl_graph: str = None, contexts: dict = None):
+        """
+        :param shacl_graph: The path to the SHACL shape graph file in Turtle
+            format, or the name of a bundled resource, as for `validate`. If
+            `None`, a default SOSO SHACL shape is used.
+        :param contexts: Remote JSON-LD context documents by URL, as for
+            `validate`. Optional.
+        """
+        import rdflib
+
+        self.shacl_graph = _resolve_shacl_shape(shacl_graph or _get_shacl_file_path())
+        self.contexts = {} if contexts is None else contexts
+        self._shapes = rdflib.Graph().parse(self.shacl_graph, format="turtle")
+
+    def validate(
+        self,
+        data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"],
+        structured: bool = False,
+    ) -> dict:
+        """
+        Validate a data graph against the SHACL shape graph.
+
+        :param data_graph: The path to the data graph file in JSON-LD format,
+            or the data graph itself, as for `validate`.
+        :param structured: Whether to also return the validation results as
+            data, as for `validate`.
+
+        :returns: A dictionary with validation results, as returned by
+            `validate`, where ``data_graph`` is the input data graph.
+        """
+        import pyshacl
+        from rdflib.namespace import RDF, SH
+
+        conforms, results_graph, results_text = pyshacl.validate(
+            data_graph=_load_data_graph(data_graph, self.contexts),
+            shacl_graph=self._shapes,
+            inference="none",
+            debug=False,
+        )
+        result = {
+            "data_graph": data_graph,
+            "shacl_graph": self.shacl_graph,
+            "conforms": conforms,
+            "report": results_text,
+        }
+        if structured:
+            result["results"] = [
+                self._result(results_graph, node)
+                for node in results_graph.subjects(RDF.type, SH.ValidationResult)
+            ]
+        return result
+
+    def _result(self, results_graph: "rdflib.Graph", node) -> dict:
+        """
+        :param results_graph: The results graph of a validation.
+        :param node: The node of a validation result in the results graph.
+
+        :returns: The validation result, as a dictionary of the names of its
+            shape, severity, path, focus node and its message, as for
+            `validate`.
+        """
+        from rdflib.namespace import SH
+
+        path = results_graph.value(node, SH.resultPath)
+        messages = [
+            str(message) for message in results_graph.objects(node, SH.resultMessage)
+        ]
+        return {
+            "shape": self._shape_name(results_graph.value(node, SH.sourceShape)),
+            "severity": _local_name(results_graph.value(node, SH.resultSeverity)),
+            "path": None if path is None else _node_name(path, results_graph),
+            "focus_node": _node_name(
+                results_graph.value(node, SH.focusNode), results_graph
+            ),
+            "message": "\n".join(messages) or None,
+        }
+
+    def _shape_name(self, shape) -> str:
+        """
+        :param shape: A shape of the SHACL shape graph.
+
+        :returns: The IRI of the shape or, for a blank property shape, the
+            name of the shape it belongs to followed by its path.
+        """
+        from rdflib import BNode
+        from rdflib.namespace import SH
+
+        graph = self._shapes
+        parent = graph.value(None, SH.property, shape)
+        if isinstance(shape, BNode) and parent is not None:
+            path = graph.value(shape, SH.path)
+            return f"{self._shape_name(parent)} {_node_name(path, graph)}"
+        return _node_name(shape, graph)
+
+
+def validate_many(
+    graphs: Iterable[Union[str, os.PathLike, dict, "rdflib.Graph"]],
+    shacl_graph: str = None,
+    workers: int = 1,
+    contexts: dict = None,
+) -> dict:
+    """
+    Validate many data graphs against a SHACL shape graph, and summarize the
+    results.
+
+    :param graphs: The data graphs, as file paths in JSON-LD format, or as
+        JSON-LD strings, dictionaries or rdflib Graphs, as for `validate`.
+    :param shacl_graph: The SHACL shape graph, as for `validate`.
+    :param workers: The number of processes validating graphs in parallel,
+        each loading the SHACL shape graph once. Graphs are validated one
+        after another by default.
+    :param contexts: Remote JSON-LD context documents by URL, as for
+        `validate`. Each process fetches the contexts not given once.
+
+    :returns: A summary of the validation results, which can be serialized as
+        JSON, including:
+        ``graphs``: The number of data graphs validated.
+        ``conforming``: The number of data graphs conforming to the SHACL shape.
+        ``nonconforming``: The names of the data graphs not conforming, in the
+        order given. Graphs given as file paths are named by their path, and
+        the others by their position, e.g. ``graph 3``.
+        ``errors``: The error raised by each data graph that could not be
+        validated, e.g. because it is not valid JSON-LD, by name.
+        ``shapes``: The results of each shape with results, by shape name, as
+        dictionaries of the shape's ``severity``, the number of ``results``,
+        and the sorted names of the ``focus_nodes`` and ``data_graphs`` with
+        results, as for the structured results of `validate`.
+    """
+    graphs = list(graphs)
+    with (
+        ProcessPoolExecutor(
+            workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(shacl_graph, contexts),
+        )
+        if workers > 1
+        else nullcontext()
+    ) as executor:
+        if executor:
+            outcomes = executor.map(
+                _validate_in_worker,
+                graphs,
+                chunksize=max(1, len(graphs) // (workers * 4)),
+            )
+        else:
+            validator = Validator(shacl_graph, contexts)
+            outcomes = (_validate_outcome(validator, graph) for graph in graphs)
+        summary = {
+            "graphs": len(graphs),
+            "conforming": 0,
+            "nonconforming": [],
+            "errors": {},
+            "shapes": {},
+        }
+        for index, (graph, outcome) in enumerate(zip(graphs, outcomes)):
+            _add_outcome(summary, _graph_name(graph, index), *outcome)
+    for shape in summary["shapes"].values():
+        shape["focus_nodes"] = sorted(shape["focus_nodes"])
+        shape["data_graphs"] = sorted(shape["data_graphs"])
+    return summary
+
+
+def _add_outcome(
+    summary: dict, name: str, conforms: bool, results: list, error: str
+) -> None:
+    """
+    Adds the outcome of validating a data graph to the summary of validate_many.
+
+    :param summary: The summary, whose shapes have sets of focus nodes and
+        data graphs.
+    :param name: The name of the data graph.
+    :param conforms: Whether the data graph conforms.
+    :param results: The results of the data graph.
+    :param error: The error raised validating the data graph, or `None`.
+    """
+    if error is not None:
+        summary["errors"][name] = error
+        return
+    if conforms:
+        summary["conforming"] += 1
+    else:
+        summary["nonconforming"].append(name)
+    for result in results:
+        shape = summary["shapes"].setdefault(
+            result["shape"],
+            {
+                "severity": result["severity"],
+                "results": 0,
+                "focus_nodes": set(),
+                "data_graphs": set(),
+            },
+        )
+        shape["results"] += 1
+        shape["focus_nodes"].add(result["focus_node"])
+        shape["data_graphs"].add(name)
+
+
+# pylint: disable=global-statement
+def _init_worker(shacl_graph: Union[str, None], contexts: Union[dict, None]) -> None:
+    """
+    Loads the SHACL shape graph of a worker process of validate_many.
+
+    :param shacl_graph: The SHACL shape graph, as for `validate`.
+    :param contexts: Remote JSON-LD context documents by URL, as for
+        `validate`.
+    """
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = Validator(shacl_graph, contexts)
+
+
+def _validate_in_worker(
+    data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"]
+) -> tuple:
+    """
+    :param data_graph: The data graph, as for `Validator.validate`.
+
+    :returns: The outcome of validating the data graph with the validator of
+        the worker process, as from _validate_outcome.
+    """
+    return _validate_outcome(_WORKER_VALIDATOR, data_graph)
+
+
+def _validate_outcome(
+    validator: Validator, data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"]
+) -> tuple:
+    """
+    :param validator: The validator.
+    :param data_graph: The data graph, as for `Validator.validate`.
+
+    :returns: Whether the data graph conforms, its structured results, as
+        from `Validator.validate`, and `None` or, if the data graph could not
+        be validated, `None`, `None` and the error raised.
+    """
+    try:
+        result = validator.validate(data_graph, structured=True)
+        return result["conforms"], result["results"], None
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return None, None, f"{type(exc).__name__}: {exc}"
+
+
+def _graph_name(
+    data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"], index: int
+) -> str:
+    """
+    :param data_graph: A data graph given to validate_many.
+    :param index: The position of the data graph in those given.
+
+    :returns: The path or URL of the data graph, if given as a file path or
+        URL, or its position.
+    """
+    if _is_file_path(data_graph) or _is_remote(data_graph):
+        return os.fspath(data_graph)
+    return f"graph {index}"
+
+
+def _is_file_path(data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"]) -> bool:
+    """
+    :param data_graph: A data graph, as for `validate`.
+
+    :returns: Whether the data graph is given as a file path, rather than as a
+        URL, JSON-LD string, dictionary or rdflib Graph.
+    """
+    if isinstance(data_graph, os.PathLike):
+        return True
+    return (
+        isinstance(data_graph, str)
+        and not _is_remote(data_graph)
+        and not data_graph.lstrip(_LEADING).startswith(("{", "["))
+    )
+
+
+def _load_data_graph(
+    data_graph: Union[str, os.PathLike, dict, "rdflib.Graph"], contexts: dict = None
+) -> "rdflib.Graph":
+    """
+    Load a data graph, parsing dictionaries without serializing them, and
+    replacing remote JSON-LD contexts with those in `contexts`.
+
+    :param data_graph: The data graph, as for `validate`.
+    :param contexts: Remote JSON-LD context documents by URL, as for
+        `validate`, to which the contexts fetched are added.
+
+    :returns: The data graph as an rdflib Graph, or the rdflib Graph given.
+    """
+    import rdflib
+
+    if isinstance(data_graph, rdflib.Graph):
+        return data_graph
+    public_id = None
+    if _is_file_path(data_graph):
+        # The file is the base of the relative IRIs in it.
+        public_id = pathlib.Path(data_graph).resolve().as_uri() + "#"
+        data_graph = json.loads(pathlib.Path(data_graph).read_bytes())
+    elif _is_remote(data_graph):
+        public_id = data_graph
+        data_graph = _fetch_json(data_graph)
+    elif isinstance(data_graph, str):
+        data_graph = json.loads(data_graph.lstrip(_LEADING))
+    if contexts is not None:
+        data_graph = _with_cached_contexts(data_graph, contexts)
+    return rdflib.Graph().parse(data=data_graph, format="json-ld", publicID=public_id)
+
+
+def _with_cached_contexts(data_graph: Union[dict, list], contexts: dict) -> dict:
+    """
+    :param data_graph: A JSON-LD document.
+    :param contexts: Remote JSON-LD context documents by URL, to which the
+        contexts fetched are added.
+
+    :returns: The document, with the URLs of the remote contexts of its
+        top-level ``@context`` replaced by the context documents.
+    """
+    if not isinstance(data_graph, dict) or "@context" not in data_graph:
+        return data_graph
+    context = data_graph["@context"]
+    sources = context if isinstance(context, list) else [context]
+    if not any(_is_remote(source) for source in sources):
+        return data_graph
+    for source in sources:
+        if _is_remote(source) and source not in contexts:
+            contexts[source] = _fetch_json(source)
+    sources = [contexts[source] if _is_remote(source) else source for source in sources]
+    return {
+        **data_graph,
+        "@context": sources if isinstance(context, list) else sources[0],
+    }
+
+
+def _fetch_json(url: str) -> Union[dict, list]:
+    """
+    :param url: The URL of a JSON-LD document, e.g. a data graph or context.
+
+    :returns: The document, fetched through the HTTP cache.
+    """
+    response = get_http_cache().request(
+        "GET", url, headers={"Accept": "application/ld+json, application/json"}
+    )
+    response.raise_for_status()
+    return json.loads(response.text)
+
+
+def _is_remote(source) -> bool:
+    """
+    :param source: A JSON-LD context or data graph, or the URL of one.
+
+    :returns: Whether the source is the absolute URL of a remote document.
+    """
+    return isinstance(source, str) and source.startswith(("http://", "https://"))
+
+
+def _node_name(node, graph) -> str:
+    """
+    :param node: A node of a graph.
+    :param graph: The graph.
+
+    :returns: The IRI or value of the node or, for a blank node, its type in
+        Turtle, e.g. ``[ a <https://schema.org/Dataset> ]``.
+    """
+    from rdflib import BNode
+    from rdflib.namespace import RDF
+
+    if not isinstance(node, BNode):
+        return str(node)
+    types = " , ".join(sorted(f"<{type_}>" for type_ in graph.objects(node, RDF.type)))
+    return f"[ a {types} ]" if types else "[]"
+
+
+def _local_name(node) -> str:
+    """
+    :param node: An IRI, e.g. of a SHACL severity.
+
+    :returns: The part of the IRI after its namespace, e.g. ``Violation``.
+    """
+    return str(node).rsplit("#", 1)[-1].rsplit("/", 1)[-1]
+
+
 def _get_shacl_file_path() -> pathlib.Path:
     """Return the SHACL shape file path for the SOSO dataset graph.
 
@@ -1,6 +1,12 @@
 """Configure the test suite."""
 
+import shutil
 import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from pathlib import Path
 from typing import Any, Type, Union
 from urllib.parse import urlparse
 from numbers import Number
@@ -186,6 +192,100 @@ def interface_methods() -> list:
     return res
 
 
+@pytest.fixture
+def spase_repo(tmp_path, monkeypatch) -> Path:
+    """A SPASE repository of records that convert without network access,
+    cloned into a temporary home directory."""
+    records = Path("tests/data/spase").resolve()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+    repo = tmp_path / "SPASE" / "NumericalData"
+    repo.mkdir(parents=True)
+    for duration in ["P1D", "PT0.25S", "PT8S"]:
+        shutil.copy(records / f"spase-{duration}.xml", repo)
+    return repo
+
+
+class DoiStubHandler(BaseHTTPRequestHandler):
+    """Answers DOI resolution (HEAD /doi.org/<doi>) and DataCite API
+    (GET /datacite/<doi>) requests like doi.org and DataCite would, for any
+    DOI. Requests, connections and concurrency are counted on the server."""
+
+    protocol_version = "HTTP/1.1"  # keep connections alive
+
+    def do_HEAD(self):  # pylint: disable=invalid-name
+        """Redirect a DOI to its (non-SPASE) landing page."""
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.connections.add(self.client_address)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+        time.sleep(0.05)
+        self.send_response(302)
+        self.send_header("Location", "https://example.org/landing-page")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return DataCite metadata of a Dataset named after the DOI."""
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.connections.add(self.client_address)
+        doi = self.path.removeprefix("/datacite/")
+        body = dumps(
+            {
+                "types": {"resourceTypeGeneral": "Dataset"},
+                "titles": [{"title": doi}],
+                "descriptions": [],
+                "rightsList": [],
+                "creators": [
+                    {
+                        "name": "Doe, Jane",
+                        "givenName": "Jane",
+                        "familyName": "Doe",
+                        "affiliation": [],
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def doi_stub_server(monkeypatch) -> ThreadingHTTPServer:
+    """A local stand-in for doi.org and the DataCite API. DOIs are resolved
+    from `server.doi_url`, and verify_type queries the server's DataCite
+    API."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DoiStubHandler)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.connections = set()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    address = f"http://127.0.0.1:{server.server_port}"
+    server.doi_url = f"{address}/doi.org/"
+    monkeypatch.setattr(
+        "soso.strategies.spase.spase.DATACITE_API", f"{address}/datacite/"
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 def pytest_configure(config):
     """A marker for tests that require internet connection."""
     config.addinivalue_line(
@@ -0,0 +1,188 @@
+"""For testing the SPASE conversion module."""
+
+import json
+import shutil
+from functools import partial
+from pathlib import Path
+import pytest
+from soso.strategies.spase import conversion
+from soso.strategies.spase.conversion import (
+    convert_record,
+    main,
+    load_manifest,
+    hash_file,
+    find_outputs_to_rebuild,
+    save_manifest,
+    DEPENDENTS_PATH,
+    PROFILE_PATH,
+)
+
+
+def test_main_writes_same_jsons_with_workers(spase_repo, capsys):
+    """Test that the main function writes the same JSONs and reports the same
+    problematic records when converting records in parallel."""
+
+    # Positive case: The JSONs written and the problematic records reported
+    # with worker processes match those of converting records one after
+    # another.
+    output = Path("SPASE_JSONs/SPASE/NumericalData")
+    main(str(spase_repo))
+    expected = {file.name: file.read_text() for file in output.iterdir()}
+    expected_report = capsys.readouterr().out.splitlines()[-1]
+    shutil.rmtree("SPASE_JSONs")
+    main(str(spase_repo), workers=2)
+    assert {file.name: file.read_text() for file in output.iterdir()} == expected
+    assert capsys.readouterr().out.splitlines()[-1] == expected_report
+    assert len(expected) == 3
+    assert "Person/Donald.A.Gurnett.xml" in expected_report
+    # Problems are reported by category.
+    problems = [
+        problem for entry in load_manifest().values() for problem in entry["problems"]
+    ]
+    assert {
+        problem["category"]
+        for problem in problems
+        if problem["subject"].endswith("Person/Donald.A.Gurnett.xml")
+    } == {"missing Person"}
+
+
+def test_main_skips_unchanged_records(spase_repo, capsys):
+    """Test that the main function only converts records that changed, or
+    whose linked records changed, since the last run when incremental."""
+    output = Path("SPASE_JSONs/SPASE/NumericalData")
+    main(str(spase_repo))
+    report = capsys.readouterr().out.splitlines()[-1]
+    manifest = load_manifest()
+    assert len(manifest) == 3
+    person = str(Path("SMWG/Person/Dennis.K.Haggerty.xml").resolve())
+    # the linked record is missing, so has no hash
+    assert manifest[str(spase_repo / "spase-P1D.xml")]["dependencies"][person] is None
+
+    # Positive case: Nothing changed, so no record is converted again, and the
+    # same problematic records are reported.
+    written = {file.name: file.stat().st_mtime_ns for file in output.iterdir()}
+    main(str(spase_repo), incremental=True)
+    out = capsys.readouterr().out.splitlines()
+    assert "0 records successfully converted to schema.org JSONs" in out
+    assert "3 unchanged records were skipped" in out
+    assert out[-1] == report
+    assert {file.name: file.stat().st_mtime_ns for file in output.iterdir()} == (
+        written
+    )
+
+    # Positive case: A changed record, and a record whose missing linked
+    # record now exists, are converted again.
+    with open(spase_repo / "spase-PT8S.xml", "a", encoding="utf-8") as f:
+        f.write("\n")
+    Path(person).parent.mkdir(parents=True)
+    shutil.copy(Path(__file__).parent / "data/spase/spase-David.T.Young.xml", person)
+    main(str(spase_repo), incremental=True)
+    out = capsys.readouterr().out.splitlines()
+    assert "2 records successfully converted to schema.org JSONs" in out
+    assert load_manifest()[str(spase_repo / "spase-P1D.xml")]["dependencies"][
+        person
+    ] == hash_file(person)
+
+    # Negative case: Without incremental, every record is converted.
+    main(str(spase_repo))
+    assert "3 records successfully converted" in capsys.readouterr().out
+
+
+def test_find_outputs_to_rebuild_returns_expected_value(spase_repo):
+    """Test that the find_outputs_to_rebuild function returns the JSONs made
+    from the given files."""
+    main(str(spase_repo))
+    outputs = {
+        str(spase_repo / f"spase-{duration}.xml"): (
+            f"./SPASE_JSONs/SPASE/NumericalData/spase-{duration}.json"
+        )
+        for duration in ["P1D", "PT0.25S", "PT8S"]
+    }
+
+    # Positive case: A linked record looked up by several records, even if it
+    # could not be found, affects each of their JSONs.
+    p1d = str(spase_repo / "spase-P1D.xml")
+    assert find_outputs_to_rebuild(["SMWG/Person/Chris.W.Piker.xml"]) == {
+        record: output for record, output in outputs.items() if record != p1d
+    }
+
+    # Positive case: Records and linked records only affect the JSONs made
+    # from them.
+    assert find_outputs_to_rebuild([p1d, "SMWG/Person/Dennis.K.Haggerty.xml"]) == {
+        p1d: outputs[p1d]
+    }
+
+    # Negative case: Files that no JSON was made from affect nothing.
+    assert not find_outputs_to_rebuild(["SMWG/Person/Nobody.xml"])
+    assert not find_outputs_to_rebuild([], manifest_path="missing.json")
+
+    # Negative case: Records of the index missing from the manifest, e.g.
+    # after an interrupted run, are skipped.
+    manifest = load_manifest()
+    del manifest[p1d]
+    save_manifest(manifest)
+    assert find_outputs_to_rebuild([p1d, "SMWG/Person/Chris.W.Piker.xml"]) == {
+        record: output for record, output in outputs.items() if record != p1d
+    }
+
+
+def test_main_keeps_manifest_of_converted_records(spase_repo, monkeypatch):
+    """Test that the main function saves the manifest of the records converted
+    before one that fails, and forgets the records deleted since, along with
+    their JSONs."""
+    order = conversion.get_paths(str(spase_repo), [])
+    assert len(order) == 3
+
+    # Negative case: A first record failing raises its error, and an empty
+    # manifest is saved, though no JSON was written.
+    with monkeypatch.context() as patch:
+        patch.setattr(conversion, "convert_record", partial(fail_on, order[0]))
+        with pytest.raises(ValueError):
+            main(str(spase_repo))
+    assert not load_manifest()
+
+    # Positive case: The records converted before a failure are kept.
+    with monkeypatch.context() as patch:
+        patch.setattr(conversion, "convert_record", partial(fail_on, order[-1]))
+        with pytest.raises(ValueError):
+            main(str(spase_repo))
+    assert sorted(load_manifest()) == sorted(order[:-1])
+    dependents = json.loads(Path(DEPENDENTS_PATH).read_text(encoding="utf-8"))
+    assert dependents[order[0]] == [order[0]]
+
+    # Positive case: Records deleted are forgotten, and their JSONs deleted,
+    # and those of other folders are kept.
+    other = spase_repo.parent / "Other" / "spase-P1D.xml"
+    other.parent.mkdir()
+    shutil.copy(order[0], other)
+    manifest = load_manifest()
+    manifest[str(other)] = {**manifest[order[0]], "output": "other.json"}
+    save_manifest(manifest)
+    output = manifest[order[1]]["output"]
+    assert Path(output).is_file()
+    Path(order[1]).unlink()
+    main(str(spase_repo))
+    assert sorted(load_manifest()) == sorted([order[0], order[2], str(other)])
+    assert not Path(output).exists()
+
+
+def fail_on(failing: str, record: str, *args) -> tuple:
+    """Converts a record as convert_record does, except for the failing
+    record, which raises a ValueError."""
+    if record == failing:
+        raise ValueError(record)
+    return convert_record(record, *args)
+
+
+def test_main_writes_profile_of_all_workers(spase_repo):
+    """Test that the main function writes the getter statistics of the records
+    converted by all workers when profiling."""
+    main(str(spase_repo), workers=2, profile=True)
+    profile = json.loads(Path(PROFILE_PATH).read_text(encoding="utf-8"))
+    assert profile["conversions"] == 3
+    assert profile["getters"]["get_creator"]["calls"] == 3
+
+    # Negative case: No profile is written when not profiling.
+    shutil.rmtree("SPASE_JSONs")
+    main(str(spase_repo))
+    assert not Path(PROFILE_PATH).exists()
@@ -0,0 +1,66 @@
+"""For testing the SPASE corpus module."""
+
+from pathlib import Path
+from soso.main import convert_to_graph
+from soso.strategies.spase.corpus import generate_corpus
+from soso.strategies.spase.spase import (
+    SPASE,
+    get_observatory,
+    take_problematic_records,
+)
+
+
+def test_generate_corpus_links_records(tmp_path, monkeypatch):
+    """Test that generate_corpus writes records whose linked records are found
+    under the home directory, from the records bundled with the package."""
+    templates = Path("tests/data/spase").resolve()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    take_problematic_records()
+    paths = generate_corpus(
+        tmp_path,
+        records=5,
+        persons=4,
+        instruments=3,
+        observatories=2,
+        observatory_groups=1,
+        contacts_per_record=2,
+        associations_per_record=2,
+    )
+    assert len(paths) == 5
+    assert len(list(tmp_path.rglob("*.xml"))) == 5 + 4 + 3 + 2 + 1
+    assert all(
+        Path(path).parent == tmp_path / "NASA/NumericalData/Synthetic" for path in paths
+    )
+
+    # The creator, related records and instruments are read from the linked
+    # records.
+    graph = convert_to_graph(paths[0], "spase")
+    assert "0000-0000-0000-" in graph["creator"][0]["identifier"]["value"]
+    assert graph["isBasedOn"]["name"].startswith("Synthetic NumericalData")
+    assert graph["prov:wasRevisionOf"]["name"].startswith("Synthetic NumericalData")
+    assert graph["prov:wasGeneratedBy"][0]["prov:used"]["name"].startswith(
+        "Synthetic Instrument"
+    )
+    record = SPASE(paths[0])
+    names = [item["name"] for item in get_observatory(record.metadata, record.file)]
+    assert names[0] == "Synthetic ObservatoryGroup 0"
+    assert names[1].startswith("Synthetic Observatory ")
+    assert not take_problematic_records()
+
+    # The same arguments write the same corpus, and the bundled records are
+    # those of the tests.
+    expected = Path(paths[1]).read_bytes()
+    generate_corpus(
+        tmp_path / "again",
+        records=5,
+        persons=4,
+        instruments=3,
+        observatories=2,
+        observatory_groups=1,
+        contacts_per_record=2,
+        associations_per_record=2,
+        templates=templates,
+    )
+    again = tmp_path / "again/NASA/NumericalData/Synthetic" / Path(paths[1]).name
+    assert again.read_bytes() == expected
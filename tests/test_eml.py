@@ -20,7 +20,11 @@ from soso.strategies.eml.eml import (
     get_methods,
     get_checksum,
     get_schema_version,
+    iterparse_metadata,
+    xpath,
+    XPATHS,
 )
+from soso.main import convert
 from soso.utilities import get_example_metadata_file_path, get_empty_metadata_file_path
 
 
@@ -734,3 +738,74 @@ def test_get_schema_version_returns_expected_value():
     # return None.
     eml = etree.parse(get_empty_metadata_file_path("EML"))
     assert get_schema_version(eml) is None
+
+
+def test_low_memory_mode_returns_the_same_graph():
+    """Test that converting in low-memory mode returns the same graph as
+    converting in the default mode."""
+    for file in [
+        get_example_metadata_file_path("EML"),
+        get_empty_metadata_file_path("EML"),
+    ]:
+        assert convert(file, "eml", low_memory=True) == convert(file, "eml")
+
+
+def test_iterparse_metadata_removes_converted_elements(tmp_path):
+    """Test that iterparse_metadata removes converted attribute and data
+    entity elements from the tree, except those related to a dataSource, and
+    returns the same values as the default mode."""
+    xml_content = """<eml:eml xmlns:eml="https://eml.ecoinformatics.org/eml-2.2.0">
+    <dataset>
+        <otherEntity><entityName>Other</entityName></otherEntity>
+        <dataTable>
+            <entityName>Table</entityName>
+            <attributeList>
+                <attribute><attributeName>plain</attributeName></attribute>
+                <attribute>
+                    <attributeName>derived</attributeName>
+                    <methods><methodStep><dataSource>
+                        <dataTable>
+                            <entityName>Source table</entityName>
+                            <physical><distribution><online>
+                                <url>https://example.data/source</url>
+                            </online></distribution></physical>
+                        </dataTable>
+                    </dataSource></methodStep></methods>
+                </attribute>
+            </attributeList>
+        </dataTable>
+    </dataset>
+</eml:eml>"""
+    file = tmp_path / "eml.xml"
+    file.write_text(xml_content, encoding="utf-8")
+    metadata, streamed = iterparse_metadata(str(file))
+
+    # The plain attribute and the otherEntity are removed, while the elements
+    # containing, or inside, the dataSource are kept.
+    assert [item.findtext("attributeName") for item in metadata.iter("attribute")] == [
+        "derived"
+    ]
+    assert not metadata.xpath(".//otherEntity")
+    assert len(metadata.xpath(".//dataTable")) == 2
+
+    # Values are in document order and match those of the default mode.
+    assert [item["name"] for item in streamed["attribute"]] == ["plain", "derived"]
+    assert [item["name"] for item in streamed["dataTable"]] == [
+        "Table",
+        "Source table",
+    ]
+    assert streamed["dataSource"] == ["https://example.data/source"]
+    for name in ["get_variable_measured", "get_distribution", "get_was_derived_from"]:
+        assert getattr(EML(file, low_memory=True), name)() == getattr(EML(file), name)()
+
+
+def test_xpath_returns_the_same_result_as_a_string_expression():
+    """Test that xpath returns the same result as passing the expression to
+    the element's xpath method, and registers expressions on first use."""
+    eml = etree.parse(get_example_metadata_file_path("EML"))
+    for expression in list(XPATHS):
+        assert xpath(eml, expression) == eml.xpath(expression)
+    assert ".//dataset/title" not in XPATHS
+    assert xpath(eml, ".//dataset/title") == eml.xpath(".//dataset/title")
+    assert ".//dataset/title" in XPATHS
+    del XPATHS[".//dataset/title"]
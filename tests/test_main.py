@@ -1,7 +1,11 @@
 """Test the converter."""
 
+import os
+import subprocess
+import sys
 from json import loads
-from soso.main import convert
+import pytest
+from soso.main import convert, convert_many, convert_to_graph
 from soso.utilities import get_example_metadata_file_path
 
 
@@ -90,3 +94,79 @@ def test_convert_with_kwargs(soso_properties):
     )
     res = loads(res)
     assert "not_a_property" not in res
+
+
+def test_convert_to_graph_returns_expected_value():
+    """Test that the convert_to_graph function returns the graph of the
+    convert function as a dictionary."""
+    for file, strategy in [
+        (get_example_metadata_file_path("EML"), "eml"),
+        ("tests/data/spase/spase-PT8S.xml", "spase"),
+    ]:
+        res = convert_to_graph(file=file, strategy=strategy, url="url_via_kwargs")
+        assert isinstance(res, dict)
+        assert res == loads(convert(file=file, strategy=strategy, url="url_via_kwargs"))
+
+
+def test_convert_many_returns_expected_value():
+    """Test that the convert_many function returns the expected value."""
+
+    # Positive case: Each file is converted as by the convert function, in the
+    # order given, and a file that fails to convert does not stop the batch.
+    files = [
+        "tests/data/spase/spase-PT8S.xml",
+        "tests/data/spase/missing.xml",
+        "tests/data/spase/spase-P1D.xml",
+    ]
+    res = list(convert_many(files, strategy="spase", name="name_via_kwargs"))
+    assert [file for file, _ in res] == files
+    assert res[0][1] == convert(files[0], strategy="spase", name="name_via_kwargs")
+    assert isinstance(res[1][1], OSError)
+    assert loads(res[2][1])["name"] == "name_via_kwargs"
+
+    # Negative case: An invalid strategy raises an error before any file is
+    # converted.
+    with pytest.raises(ValueError):
+        convert_many(files, strategy="not_a_strategy")
+
+
+# Budget for importing soso.main, in microseconds, as reported by
+# python -X importtime. Importing it took about 200 ms before heavy
+# dependencies were imported lazily, and about 15 ms after, so the budget
+# leaves a wide margin for slow machines.
+IMPORT_BUDGET = 100_000
+
+
+def test_import_is_fast_and_has_no_side_effects(tmp_path):
+    """Test that importing the package stays within the startup budget and
+    imports no strategy or the dependencies they need, and that importing the
+    strategies doesn't import the dependencies only needed to look up DOIs,
+    log or validate, or create files."""
+    code = (
+        "import sys\n"
+        "import soso.main\n"
+        "print(' '.join(sys.modules))\n"
+        "import soso.validation, soso.strategies.eml.eml, "
+        "soso.strategies.spase.spase\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "TMPDIR": str(tmp_path)},
+    )
+    assert not list(tmp_path.iterdir())
+    # Lines are "import time: <self us> | <cumulative us> | <indented name>"
+    imports = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        imports[name.strip()] = int(cumulative)
+    assert imports["soso.main"] <= IMPORT_BUDGET
+    main, strategies = [line.split() for line in result.stdout.splitlines()]
+    for module in ["lxml", "requests", "pyshacl"]:
+        assert module not in main
+    assert not [module for module in main if module.startswith("soso.strategies")]
+    for module in ["requests", "daiquiri", "pyshacl", "rdflib", "sqlite3"]:
+        assert module not in strategies
@@ -0,0 +1,73 @@
+"""For testing the profiling module."""
+
+from json import dumps
+from pathlib import Path
+from soso.main import convert, convert_many, convert_to_graph
+from soso.profiling import COUNTERS, GetterProfile
+from soso.strategies.spase.corpus import generate_corpus
+from soso.strategies.spase.spase import linked_records
+from soso.utilities import get_example_metadata_file_path
+
+
+def test_profile_records_every_getter_called():
+    """Test that a profile records a call of each getter called by convert,
+    without changing the graph returned."""
+    file = get_example_metadata_file_path("EML")
+    profile = GetterProfile()
+    graph = convert(file=file, strategy="EML", profile=profile)
+    assert graph == convert(file=file, strategy="EML")
+    assert profile.conversions == 1
+    assert len(profile.getters) == 31
+    for stats in profile.getters.values():
+        assert set(stats) == {"calls", "seconds", *COUNTERS}
+        assert stats["calls"] == 1
+        assert stats["seconds"] >= 0
+    # The profile can be serialized and aggregated.
+    dumps(profile.as_dict())
+    list(convert_many([file, file], "EML", profile=profile))
+    assert profile.conversions == 3
+    assert profile.getters["get_name"]["calls"] == 3
+
+
+def test_profile_counts_linked_records_read(tmp_path, monkeypatch):
+    """Test that a profile attributes the linked SPASE records read, from disk
+    or memory, to the getters reading them."""
+    templates = Path("tests/data/spase").resolve()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    paths = generate_corpus(
+        tmp_path, records=2, persons=2, contacts_per_record=2, templates=templates
+    )
+    linked_records.clear()
+    calls = []
+    profile = GetterProfile(callback=lambda name, stats: calls.append(name))
+    for path in paths:
+        convert_to_graph(path, "spase", profile=profile)
+    assert profile.conversions == 2
+    assert calls.count("get_creator") == 2
+    # The Person records of the contacts are read by the first getter asking
+    # for them, and reused by the others.
+    assert profile.getters["get_creator"]["files_read"] >= 1
+    assert profile.getters["get_contributor"]["linked_record_hits"] >= 1
+    for counter, total in [
+        ("files_read", linked_records.misses),
+        ("linked_record_hits", linked_records.hits),
+    ]:
+        assert sum(stats[counter] for stats in profile.getters.values()) == total
+
+
+def test_merge_adds_profiles():
+    """Test that merge adds the statistics of another profile, or of its
+    dictionary, such as one returned by a worker process."""
+    profile = GetterProfile()
+    profile.call("get_name", lambda: "name")
+    other = GetterProfile()
+    other.call("get_name", lambda: "name")
+    other.call("get_url", lambda: None)
+    other.conversions = 1
+    profile.merge(other)
+    profile.merge(other.as_dict())
+    assert profile.conversions == 2
+    assert profile.getters["get_name"]["calls"] == 3
+    assert profile.getters["get_url"]["calls"] == 2
+    assert other.getters["get_name"]["calls"] == 1
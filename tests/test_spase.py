@@ -1,6 +1,11 @@
 """Test additional SPASE module functions and methods."""
 
+import os
+import shutil
+from copy import deepcopy
 from datetime import datetime
+import pytest
+import requests
 from lxml import etree
 from soso.strategies.spase.spase import (
     get_schema_version,
@@ -22,13 +27,38 @@ from soso.strategies.spase.spase import (
     get_temporal,
     process_authors,
     verify_type,
+    verify_types,
     get_resource_id,
     get_relation,
     update_log,
     make_trial_start_and_stop,
     find_match,
+    SpaseIndex,
+    SPASE,
+    get_linked_record,
+    linked_records,
+    LinkedRecordCache,
+    MISSING_PERSON,
+    configure_ignore_creator_split,
+    get_ignore_creator_split,
+    ignores_creator_split,
+    configure_person_index,
+    get_person_index,
+    PersonIndex,
+    RecordIndex,
+    configure_instrument_index,
+    get_instrument_index,
+    InstrumentIndex,
+    take_linked_records,
+    get_problematic_records,
+    take_problematic_records,
+)
+from soso.main import convert
+from soso.utilities import (
+    get_empty_metadata_file_path,
+    get_example_metadata_file_path,
+    HTTP_POOL_SIZE,
 )
-from soso.utilities import get_empty_metadata_file_path, get_example_metadata_file_path
 
 # pylint: disable=too-many-lines
 
@@ -376,6 +406,15 @@ def test_get_observatory_returns_expected_value():
         ]
     )
 
+    # Positive case: Given the index of the record, the function gives the same
+    # value without walking the record again.
+    path = str(get_example_metadata_file_path("SPASE")).replace("\\", "/")
+    expected = get_observatory(spase, path)
+    index = SpaseIndex(spase)
+    walks = SpaseIndex.walks
+    assert get_observatory(spase, path, index) == expected
+    assert SpaseIndex.walks == walks
+
     # Negative case: If the schema version is not present, the function will
     # return None.
     spase = etree.parse(get_empty_metadata_file_path("SPASE"))
@@ -567,7 +606,7 @@ def test_get_is_part_of_returns_expected_value():
         assert get_is_part_of(
             spase,
             str(get_example_metadata_file_path("SPASE")).replace("\\", "/"),
-            **kwargs
+            **kwargs,
         ) == {
             "@id": "https://doi.org/10.48322/s9mg-he04",
             "@type": "Dataset",
@@ -648,7 +687,7 @@ def test_get_is_part_of_returns_expected_value():
         assert get_is_part_of(
             spase,
             str(get_example_metadata_file_path("SPASE")).replace("\\", "/"),
-            **kwargs
+            **kwargs,
         ) == {
             "@id": "https://doi.org/10.48322/s9mg-he04",
             "@type": "Dataset",
@@ -894,7 +933,7 @@ def test_get_relation_returns_expected_value():
         desired_root,
         ["Other"],
         str(get_example_metadata_file_path("SPASE")).replace("\\", "/"),
-        **kwargs
+        **kwargs,
     ) == (
         [
             {
@@ -1092,3 +1131,342 @@ def test_find_match_returns_expected_value():
     # Negative case: If no contact info is given, the function will
     # return None.
     assert find_match(None, None, None) == (None, None)
+
+
+def test_spase_index_returns_expected_value():
+    """Test that the SpaseIndex lookups return the expected values."""
+
+    spase = etree.fromstring(
+        "<Spase xmlns='http://www.spase-group.org/data/schema'>"
+        "<NumericalData><ResourceHeader><ResourceName>Name</ResourceName>"
+        "<Contact><Role>Author</Role></Contact>"
+        "<Contact><Role/><Role>PI</Role></Contact>"
+        "</ResourceHeader></NumericalData></Spase>"
+    ).getroottree()
+    index = SpaseIndex(spase)
+
+    # Positive case: Elements are found by tag suffix, in document order, and
+    # limited to the subtree of the given element.
+    contacts = index.iter("Contact", within=index.root)
+    assert len(contacts) == 2
+    assert len(index.iter("Role", within=index.root)) == 3
+    assert len(index.iter("Role", within=contacts[1])) == 2
+    assert index.iter("Name", within=index.root)[0].text == "Name"
+    assert index.last("Role", "Contact") is index.iter("Role", index.root)[-1]
+    assert len(index.findall("Contact", "Role")) == 3
+    assert index.findtext("ResourceHeader", "ResourceName") == "Name"
+    assert index.findtext("Contact", "Role") == "Author"
+
+    # Negative case: If nothing matches, the lookups return empty results.
+    assert index.iter("Person", within=index.root) == []
+    assert index.last("Person") is None
+    assert index.findall("ResourceHeader", "Person") == []
+    assert index.findtext("Person") is None
+
+    # Negative case: Searching an element that is not in the indexed tree
+    # raises an AttributeError, like calling iter() on a missing element.
+    with pytest.raises(AttributeError):
+        index.iter("Role", within=None)
+
+
+def test_convert_walks_spase_record_once():
+    """Test that converting a SPASE record walks its tree only once."""
+
+    # Positive case: All getters share the index built by the strategy, so a
+    # record with no resolvable linked records is walked a single time.
+    file = os.path.abspath("tests/data/spase/spase-PT8S.xml")
+    walks = SpaseIndex.walks
+    convert(file=file, strategy="spase")
+    assert SpaseIndex.walks - walks == 1
+
+
+def test_get_linked_record_returns_expected_value(tmp_path):
+    """Test that the get_linked_record function returns the expected value."""
+
+    record = tmp_path / "spase-PT8S.xml"
+    shutil.copy("tests/data/spase/spase-PT8S.xml", record)
+    linked_records.clear()
+
+    # Positive case: A linked record is parsed once and then served from the
+    # cache, however its path is written.
+    linked = get_linked_record(str(record))
+    assert linked.file == str(record.resolve())
+    assert get_linked_record(f"{tmp_path}/../{tmp_path.name}/{record.name}") is linked
+    assert (linked_records.hits, linked_records.misses) == (1, 1)
+
+    # Positive case: A record changed on disk is parsed again.
+    os.utime(record, ns=(0, 0))
+    assert get_linked_record(str(record)) is not linked
+    assert (linked_records.hits, linked_records.misses) == (1, 2)
+    assert len(linked_records) == 1
+
+    # Negative case: A missing record raises an error and is not cached.
+    with pytest.raises(FileNotFoundError):
+        get_linked_record(str(tmp_path / "missing.xml"))
+    assert len(linked_records) == 1
+
+
+def test_linked_record_cache_evicts_least_recently_used():
+    """Test that the LinkedRecordCache keeps at most maxsize records."""
+
+    # Positive case: The least recently used record is evicted first.
+    cache = LinkedRecordCache(maxsize=2)
+    first = cache.get("tests/data/spase/spase-PT8S.xml")
+    cache.get("tests/data/spase/spase-P1D.xml")
+    cache.get("tests/data/spase/spase-PT8S.xml")
+    cache.get("tests/data/spase/spase-PT10M.xml")
+    assert len(cache) == 2
+    assert cache.get("tests/data/spase/spase-PT8S.xml") is first
+    cache.get("tests/data/spase/spase-P1D.xml")
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_verify_types_returns_expected_value(doi_stub_server, tmp_path, monkeypatch):
+    """Test that the verify_types function returns the results of verify_type
+    for each link, looked up concurrently over pooled connections."""
+
+    # Positive case: Each DOI is resolved and looked up in DataCite, and the
+    # result matches that of verify_type.
+    urls = [f"{doi_stub_server.doi_url}10.1234/{i}" for i in range(3 * HTTP_POOL_SIZE)]
+    results = verify_types(urls + urls[:2])
+    assert list(results) == urls
+    assert results[urls[0]] == verify_type(urls[0])
+    is_dataset, is_article, non_spase_info = results[urls[5]]
+    assert (is_dataset, is_article) == (True, False)
+    assert non_spase_info["name"] == "10.1234/5"
+    assert non_spase_info["creators"]["name"] == "Doe, Jane"
+
+    # Positive case: Lookups run concurrently, but no more than HTTP_POOL_SIZE
+    # at a time, and reuse their connections.
+    assert 1 < doi_stub_server.max_in_flight <= HTTP_POOL_SIZE
+    assert doi_stub_server.requests == 2 * len(urls) + 2
+    assert len(doi_stub_server.connections) <= HTTP_POOL_SIZE
+
+    # Positive case: The related DOIs of a record are verified by get_relation.
+    monkeypatch.chdir(tmp_path)
+    desired_root = etree.fromstring(
+        "<NumericalData>"
+        + "".join(
+            f"<Association><AssociationID>{url}</AssociationID>"
+            "<AssociationType>PartOf</AssociationType></Association>"
+            for url in urls[:2]
+        )
+        + "</NumericalData>"
+    )
+    relation = get_relation(desired_root, ["PartOf"])
+    assert [entry["name"] for entry in relation] == ["10.1234/0", "10.1234/1"]
+
+    # Negative case: No links means no lookups.
+    assert not verify_types([])
+
+
+def test_spase_memoized_results_are_copies():
+    """Test that changing a result of a memoized SPASE method does not change
+    the result of later calls."""
+    spase = SPASE(get_example_metadata_file_path("SPASE"))
+    authors = spase._get_authors()  # pylint: disable=protected-access
+    expected = deepcopy(authors)
+    authors[0].append("Changed, Author")
+    assert spase._get_authors() == expected  # pylint: disable=protected-access
+    assert spase.memo_hits == 1
+
+
+def test_spase_memoized_results_are_computed_once(monkeypatch):
+    """Test that the authors of a SPASE record, used by several getters, are
+    read from the record once, unless memoization is turned off."""
+    calls = []
+
+    def counted_get_authors(*args) -> tuple:
+        calls.append(args)
+        return get_authors(*args)
+
+    monkeypatch.setattr("soso.strategies.spase.spase.get_authors", counted_get_authors)
+    spase = SPASE(get_example_metadata_file_path("SPASE"))
+    getters = [spase.get_contributor, spase.get_publisher, spase.get_date_published]
+    expected = [getter() for getter in getters]
+    assert len(calls) == 1
+    assert spase.memo_hits >= len(getters) - 1
+
+    spase.memoize = False
+    assert [getter() for getter in getters] == expected
+    assert len(calls) == 1 + len(getters)
+
+
+def test_take_problematic_records_returns_expected_value(doi_stub_server):
+    """Test that the problems found while converting records are collected by
+    category, once each, until taken."""
+    take_problematic_records()
+    spase = str(get_example_metadata_file_path("SPASE")).replace("\\", "/")
+
+    # Positive case: A linked record that is not found is a problem of its
+    # category, counted each time it is looked for.
+    for _ in range(2):
+        get_orcid_and_affiliation("spase://SMWG/Person/Nobody", spase)
+    problems = take_problematic_records()
+    assert len(problems) == 1
+    assert problems[0]["category"] == MISSING_PERSON
+    assert problems[0]["subject"].endswith("SMWG/Person/Nobody.xml")
+    assert problems[0]["count"] == 2
+
+    # Positive case: A failed lookup is an HTTP failure, and raises as before.
+    url = f"{doi_stub_server.doi_url}10.1234/a"
+    doi_stub_server.shutdown()
+    doi_stub_server.server_close()
+    with pytest.raises(requests.ConnectionError):
+        verify_type(url)
+    assert get_problematic_records() == url
+    assert get_problematic_records() == ""
+
+    # Negative case: Records found are not problems.
+    get_orcid_and_affiliation("spase://SMWG/Person/David.T.Young", spase)
+    assert not take_problematic_records()
+
+
+def test_ignores_creator_split_returns_expected_value(tmp_path, monkeypatch):
+    """Test that records whose creators should not be split are matched by
+    their exact path, from the bundled list or from a list overriding it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("SOSO_IGNORE_CREATOR_SPLIT", raising=False)
+    listed = "NASA/NumericalData/SOHO/UVCS/PT9M.xml"
+    configure_ignore_creator_split()
+
+    # Positive case: A listed record matches whether its path is relative to
+    # the home directory or absolute, with forward or back slashes.
+    assert ignores_creator_split(listed)
+    assert ignores_creator_split(str(tmp_path / listed))
+    assert ignores_creator_split("/" + listed)
+    assert ignores_creator_split(listed.replace("/", "\\"))
+
+    # Negative case: Parts of listed paths do not match.
+    assert not ignores_creator_split("NASA/NumericalData/SOHO/UVCS")
+    assert not ignores_creator_split("PT9M.xml")
+
+    # Positive case: The list can be overridden by a file, by paths, or by a
+    # file named in the environment, and the authors of the listed records
+    # are not split.
+    list_file = tmp_path / "ignore.txt"
+    list_file.write_text("Consortium/PT1M.xml\n\n", encoding="utf-8")
+    author = ["Team A; Team B"]
+    try:
+        configure_ignore_creator_split(list_file)
+        assert ignores_creator_split("Consortium/PT1M.xml")
+        assert not ignores_creator_split(listed)
+        assert process_authors(author, ["Author"], {}, "Consortium/PT1M.xml")[0] == (
+            author
+        )
+        assert len(process_authors(author, ["Author"], {}, listed)[0]) == 2
+        configure_ignore_creator_split([str(tmp_path / "Other/PT1M.xml")])
+        assert get_ignore_creator_split() == {"Other/PT1M.xml"}
+        monkeypatch.setenv("SOSO_IGNORE_CREATOR_SPLIT", str(list_file))
+        assert configure_ignore_creator_split() == {"Consortium/PT1M.xml"}
+    finally:
+        monkeypatch.delenv("SOSO_IGNORE_CREATOR_SPLIT", raising=False)
+        configure_ignore_creator_split()
+    assert ignores_creator_split(listed)
+
+
+def test_person_index_returns_expected_value(tmp_path, monkeypatch):
+    """Test that contacts are looked up in an index of Person records, built
+    once, without parsing their records, and give the same values."""
+    person = "spase://SMWG/Person/David.T.Young"
+    spase = str(get_example_metadata_file_path("SPASE")).replace("\\", "/")
+    folder = os.path.abspath("tests/data/spase")
+    monkeypatch.delenv("SOSO_PERSON_INDEX", raising=False)
+    monkeypatch.chdir(tmp_path)
+    configure_person_index()
+    expected = get_orcid_and_affiliation(person, spase)
+    database = tmp_path / "people.sqlite"
+
+    # Positive case: Person records are indexed, and other records are not.
+    index = PersonIndex(database)
+    indexed = index.build(folder)
+    assert 0 < indexed == len(index) < len(os.listdir(folder))
+    assert index.build(folder) == 0
+    try:
+        # Positive case: The index is read from its database, and contacts are
+        # looked up in it without parsing their records, which are still
+        # taken as linked records.
+        assert len(configure_person_index(database)) == indexed
+        take_linked_records()
+        misses = linked_records.misses
+        assert get_orcid_and_affiliation(person, spase) == expected
+        assert linked_records.misses == misses
+        assert (get_person_index().hits, get_person_index().misses) == (1, 0)
+        assert take_linked_records() == [
+            os.path.join(folder, "spase-David.T.Young.xml")
+        ]
+        monkeypatch.setenv("SOSO_PERSON_INDEX", str(database))
+        assert len(configure_person_index()) == indexed
+    finally:
+        monkeypatch.delenv("SOSO_PERSON_INDEX")
+        configure_person_index()
+    assert not get_person_index()
+
+    # Negative case: Records changed since they were indexed are not found.
+    record = tmp_path / "Person" / "David.T.Young.xml"
+    record.parent.mkdir()
+    shutil.copy(os.path.join(folder, "spase-David.T.Young.xml"), record)
+    index = PersonIndex(database)
+    assert index.build(record.parent) == 1
+    assert index.get(str(record)) == expected
+    os.utime(record, ns=(0, 0))
+    assert index.get(str(record)) is None
+    assert (index.hits, index.misses) == (1, 1)
+
+    # Negative case: An index needs a database to be built.
+    with pytest.raises(ValueError):
+        PersonIndex().build(folder)
+
+    # Negative case: An index must read records of a kind.
+    with pytest.raises(TypeError):
+        RecordIndex(database)  # pylint: disable=abstract-class-instantiated
+
+
+def test_instrument_index_returns_expected_value(tmp_path, monkeypatch):
+    """Test that the instruments and observatories of a record are looked up
+    in an index of their hierarchy, built once, without parsing their
+    records, and give the same values."""
+    spase = etree.parse(get_example_metadata_file_path("SPASE"))
+    path = str(get_example_metadata_file_path("SPASE")).replace("\\", "/")
+    folder = os.path.abspath("tests/data/spase")
+    monkeypatch.delenv("SOSO_INSTRUMENT_INDEX", raising=False)
+    monkeypatch.chdir(tmp_path)
+    configure_instrument_index()
+    expected = (get_instrument(spase, path), get_observatory(spase, path))
+    assert expected[0] and len(expected[1]) == 2
+    database = tmp_path / "index.sqlite"
+
+    # Positive case: Instrument and Observatory records are indexed with
+    # their parents, and other records are not. Indexes share a database.
+    index = InstrumentIndex(database)
+    indexed = index.build(folder)
+    assert 0 < indexed == len(index) < len(os.listdir(folder))
+    assert index.get(os.path.join(folder, "spase-FGM.xml"))[::3] == (
+        "Instrument",
+        "spase://SMWG/Observatory/MMS/4",
+    )
+    assert index.get(os.path.join(folder, "spase-MMS.xml"))[::3] == (
+        "Observatory",
+        None,
+    )
+    PersonIndex(database).build(folder)
+    assert len(InstrumentIndex(database)) == indexed
+    try:
+        # Positive case: The hierarchy is looked up in the index without
+        # parsing any records, which are still taken as linked records.
+        configure_instrument_index(database)
+        linked_records.clear()
+        take_linked_records()
+        assert (get_instrument(spase, path), get_observatory(spase, path)) == (expected)
+        assert (linked_records.hits, linked_records.misses) == (0, 0)
+        assert get_instrument_index().misses == 0
+        assert sorted(take_linked_records()) == [
+            os.path.join(folder, name)
+            for name in ["spase-FGM.xml", "spase-MMS-4.xml", "spase-MMS.xml"]
+        ]
+        monkeypatch.setenv("SOSO_INSTRUMENT_INDEX", str(database))
+        assert len(configure_instrument_index()) == indexed
+    finally:
+        monkeypatch.delenv("SOSO_INSTRUMENT_INDEX")
+        configure_instrument_index()
+    assert not get_instrument_index()
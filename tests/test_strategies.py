@@ -53,6 +53,21 @@ def test_strategy_reads_schema_version(strategy_instance, strategy_instance_no_m
     assert strategy_instance_no_meta.schema_version is None
 
 
+@pytest.mark.parametrize_strategies
+def test_strategy_memoizes_results(strategy_instance):
+    """Test that methods whose results are used by other methods compute them
+    once per instance, unless memoization is turned off."""
+    expected = strategy_instance.get_subject_of()
+    hits = strategy_instance.memo_hits
+    assert strategy_instance.get_subject_of() == expected
+    assert strategy_instance.memo_hits > hits
+
+    strategy_instance.memoize = False
+    hits = strategy_instance.memo_hits
+    assert strategy_instance.get_subject_of() == expected
+    assert strategy_instance.memo_hits == hits
+
+
 # SOSO properties are not universally shared across metadata dialects. In cases
 # where a property is not available, the corresponding strategy method will
 # return None. Therefore, each method test below first checks if the return
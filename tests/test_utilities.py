@@ -1,9 +1,11 @@
 """For testing the utilities module."""
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from json import dumps
 import pytest
+import requests
 from soso.utilities import (
     is_url,
     get_example_metadata_file_path,
@@ -11,11 +13,16 @@ from soso.utilities import (
     is_html,
     delete_null_values,
     delete_unused_vocabularies,
+    find_used_prefixes,
     generate_citation_from_doi,
     limit_to_5000_characters,
     as_numeric,
     guess_mime_type_with_fallback,
+    configure_http_cache,
+    CachedResponse,
+    ProblemCollector,
 )
+from soso.strategies.spase.spase import verify_type
 
 
 def test_get_example_metadata_file_path_returns_path(strategy_names):
@@ -139,6 +146,32 @@ def test_clean_context():
     assert dumps(delete_unused_vocabularies(graph)) == dumps(cleaned_graph)
 
 
+def test_find_used_prefixes_returns_expected_value():
+    """Test that the find_used_prefixes function returns the prefixes found
+    by searching the JSON serialized graph for "prefix:"."""
+    prefixes = ["prov", "provone", "rdfs", "n", "time"]
+
+    # Positive case: Prefixes are found in keys and in string values, at any
+    # depth, including at the end of longer words.
+    graph = {
+        "prov:wasGeneratedBy": [{"@type": "xprovone:Execution"}],
+        "temporalCoverage": ["2001/2002", 3, None],
+    }
+    assert find_used_prefixes(graph, prefixes) == {"prov", "provone"}
+    assert find_used_prefixes(graph, prefixes) == {
+        prefix for prefix in prefixes if prefix + ":" in dumps(graph)
+    }
+
+    # Positive case: Strings are searched in their JSON escaped form, as a
+    # newline serializes to "\n".
+    assert find_used_prefixes({"name": "line\n:"}, prefixes) == {"n"}
+
+    # Negative case: Prefixes not followed by ":", or only found in
+    # non-string values, are not used.
+    graph = {"prov": "rdfs", "time": {"rdfs :": 1}, "description": "é:"}
+    assert find_used_prefixes(graph, prefixes) == set()
+
+
 def test_generate_citation_from_doi():
     """Test that the generate_citation_from_doi function returns a citation
     for a valid DOI and set of parameters, and that it returns None
@@ -243,3 +276,100 @@ def test_truly_unknown_extension_returns_none():
 
 
 # End of test cases for the MIME type guessing utility ------------------------
+
+
+def test_http_cache_returns_expected_value(doi_stub_server, tmp_path, monkeypatch):
+    """Test that the HTTP cache shared by verify_type and
+    generate_citation_from_doi reuses responses across runs, honours its time
+    to live and can work offline."""
+    monkeypatch.setattr("soso.utilities._HTTP_CACHE", None)
+    url = f"{doi_stub_server.doi_url}10.1234/a"
+    citation_url = f"{doi_stub_server.doi_url}10.1234/b"
+
+    # Positive case: Responses are fetched once, and reused by later lookups
+    # and by later runs using the same directory.
+    cache = configure_http_cache(tmp_path)
+    expected = verify_type(url)
+    citation = generate_citation_from_doi(citation_url, style="apa", locale="en-US")
+    assert doi_stub_server.requests == 3
+    assert verify_type(url) == expected
+    assert generate_citation_from_doi(citation_url, "apa", "en-US") == citation
+    assert (cache.hits, cache.misses) == (3, 3)
+    configure_http_cache(tmp_path)
+    assert verify_type(url) == expected
+    assert doi_stub_server.requests == 3
+
+    # Positive case: Responses older than the time to live are fetched again.
+    configure_http_cache(tmp_path, ttl=0)
+    assert verify_type(url) == expected
+    assert doi_stub_server.requests == 5
+
+    # Positive case: Offline, cached responses are used whatever their age.
+    configure_http_cache(tmp_path, ttl=0, offline=True)
+    assert verify_type(url) == expected
+    assert doi_stub_server.requests == 5
+
+    # Negative case: Offline, responses missing from the cache are not
+    # fetched.
+    with pytest.raises(requests.ConnectionError):
+        verify_type(f"{doi_stub_server.doi_url}10.1234/c")
+    assert generate_citation_from_doi(f"{url}c", "apa", "en-US") is None
+    assert doi_stub_server.requests == 5
+
+    # Negative case: Error responses raise an HTTPError when checked.
+    with pytest.raises(requests.HTTPError):
+        CachedResponse(url, 404, {}, "").raise_for_status()
+
+
+def test_http_cache_counts_concurrent_requests(doi_stub_server, tmp_path, monkeypatch):
+    """Test that the HTTP cache counts every request made from several
+    threads as a hit or a miss."""
+    monkeypatch.setattr("soso.utilities._HTTP_CACHE", None)
+    cache = configure_http_cache(tmp_path)
+    url = f"{doi_stub_server.doi_url}10.1234/a"
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: cache.request("GET", url), range(200)))
+    assert cache.hits + cache.misses == 200
+    assert cache.misses >= 1
+
+
+def test_problem_collector_returns_expected_value():
+    """Test that the ProblemCollector keeps each problem once, with its count,
+    in the order first found, and merges problems taken from another."""
+
+    # Positive case: Repeated problems are counted, not kept twice.
+    collector = ProblemCollector()
+    collector.add("missing Person", "Person/A.xml")
+    collector.add("HTTP failure", "https://doi.org/10.1234/a")
+    collector.add("missing Person", "Person/A.xml")
+    assert len(collector) == 2
+    assert collector.counts() == {"missing Person": 1, "HTTP failure": 1}
+    assert collector.subjects() == ["Person/A.xml", "https://doi.org/10.1234/a"]
+    assert collector.problems()[0] == {
+        "category": "missing Person",
+        "subject": "Person/A.xml",
+        "count": 2,
+    }
+
+    # Positive case: Problems taken, e.g. in a worker process, are merged in
+    # another collector, and forgotten by the first.
+    other = ProblemCollector()
+    other.add("missing Instrument", "Instrument/B.xml")
+    other.merge(collector.take())
+    assert not collector
+    assert other.subjects() == [
+        "Instrument/B.xml",
+        "Person/A.xml",
+        "https://doi.org/10.1234/a",
+    ]
+    assert other.problems()[1]["count"] == 2
+
+    # Positive case: Problems added from many threads at once are all counted.
+    with ThreadPoolExecutor(8) as executor:
+        list(
+            executor.map(
+                lambda number: collector.add("HTTP failure", f"url {number % 3}"),
+                range(3000),
+            )
+        )
+    assert [problem["count"] for problem in collector.take()] == [1000] * 3
@@ -1,9 +1,15 @@
 """For testing the validation module."""
 
+import json
 from pathlib import Path
 import pytest
+import rdflib
+from soso.main import convert
+from soso.utilities import CachedResponse, get_example_metadata_file_path
 from soso.validation import (
+    Validator,
     validate,
+    validate_many,
     _get_shacl_file_path,
     _resolve_shacl_shape,
 )
@@ -72,3 +78,205 @@ def test_validate_with_default_shape():
     assert "soso_common_v1.2.3.ttl" in result["shacl_graph"]
     assert isinstance(result, dict)
     assert "conforms" in result
+
+
+def test_validator_gives_same_results_as_validate(tmp_path):
+    """Test that a Validator gives the results of validate, for data graphs
+    given as file paths, JSON-LD strings or dictionaries."""
+    graph = convert(get_example_metadata_file_path("EML"), "EML")
+    file_path = tmp_path / "graph.jsonld"
+    file_path.write_text(graph, encoding="utf-8")
+    expected = validate(str(file_path))
+    validator = Validator()
+    assert validator.shacl_graph == expected["shacl_graph"]
+    for data_graph in [str(file_path), graph, json.loads(graph), str(file_path)]:
+        result = validator.validate(data_graph)
+        assert result["data_graph"] is data_graph
+        assert result["shacl_graph"] == expected["shacl_graph"]
+        assert result["conforms"] == expected["conforms"]
+        assert result["report"] == expected["report"]
+
+
+def test_validator_with_local_shape(shacl_file_path, tmp_path):
+    """Test that a Validator validates against a local SHACL shape."""
+    validator = Validator(shacl_file_path)
+    assert validator.shacl_graph == shacl_file_path
+    data_graph = {
+        "@context": {"@vocab": "http://example.org/"},
+        "@id": "http://example.org/dataset",
+        "@type": "Dataset",
+    }
+    file_path = tmp_path / "graph.jsonld"
+    file_path.write_text(json.dumps(data_graph), encoding="utf-8")
+    result = validator.validate(data_graph)
+    assert result["conforms"] is True
+    assert result["report"] == validate(str(file_path), shacl_file_path)["report"]
+
+
+def test_structured_results_are_those_of_the_report(tmp_path):
+    """Test that the structured results of a data graph are those of its text
+    report, which is given along with them."""
+    file_path = tmp_path / "graph.jsonld"
+    file_path.write_text(
+        convert(get_example_metadata_file_path("EML"), "EML"), encoding="utf-8"
+    )
+    validator = Validator()
+    expected = validator.validate(file_path)
+    result = validator.validate(file_path, structured=True)
+    assert result == {**expected, "results": result["results"]}
+    assert json.loads(json.dumps(result, default=str))["report"] == expected["report"]
+    results = result["results"]
+    assert f"Results ({len(results)})" in expected["report"]
+    for value in results:
+        assert set(value) == {"shape", "severity", "path", "focus_node", "message"}
+        assert value["shape"].rsplit("#", 1)[-1] in expected["report"]
+        assert f"sh:{value['severity']}" in expected["report"]
+        assert f"Message: {value['message']}" in expected["report"]
+    assert {
+        "shape": "http://science-on-schema.org/1.2.3/validation/shacl#DatasetNS2Shape",
+        "severity": "Violation",
+        "path": None,
+        "focus_node": "[ a <https://schema.org/Dataset> ]",
+        "message": "Expecting SO namespace of <http://schema.org/> not "
+        "<https://schema.org/>",
+    } in results
+    structured = validate(str(file_path), structured=True)
+    assert structured["results"] == results
+    assert structured["report"] == expected["report"]
+
+
+def test_structured_results_of_property_shapes(shacl_file_path):
+    """Test that the structured results of a property shape have its path, and
+    the focus node, if not blank, by its IRI."""
+    shape = Path(shacl_file_path)
+    shape.write_text(
+        shape.read_text(encoding="utf-8").replace(
+            "sh:targetClass ex:Dataset .",
+            "sh:targetClass ex:Dataset ; "
+            "sh:property [ sh:path ex:name ; sh:minCount 1 ] .",
+        ),
+        encoding="utf-8",
+    )
+    data_graph = {
+        "@context": {"@vocab": "http://example.org/"},
+        "@id": "http://example.org/dataset",
+        "@type": "Dataset",
+    }
+    result = validate(data_graph, shacl_file_path, structured=True)
+    assert result["conforms"] is False
+    assert result["results"] == [
+        {
+            "shape": "http://example.org/DatasetShape http://example.org/name",
+            "severity": "Violation",
+            "path": "http://example.org/name",
+            "focus_node": "http://example.org/dataset",
+            "message": "Less than 1 values on :dataset->ex:name",
+        }
+    ]
+    assert "Result Path: ex:name" in result["report"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_summarizes_results(tmp_path, workers):
+    """Test that validate_many counts the results of each shape, in one or
+    more processes, and reports the graphs that could not be validated."""
+    dataset = {"@context": {"@vocab": "http://schema.org/"}, "@type": "Dataset"}
+    file_path = tmp_path / "graph.jsonld"
+    file_path.write_text(json.dumps(dataset), encoding="utf-8")
+    graphs = [file_path, dataset, tmp_path / "missing.jsonld", "{", str(file_path)]
+    summary = validate_many(graphs, workers=workers)
+    assert json.loads(json.dumps(summary)) == summary
+    assert summary["graphs"] == 5
+    assert summary["conforming"] == 0
+    assert summary["nonconforming"] == [str(file_path), "graph 1", str(file_path)]
+    assert set(summary["errors"]) == {str(tmp_path / "missing.jsonld"), "graph 3"}
+    assert summary["errors"]["graph 3"].startswith("JSONDecodeError")
+    shape = summary["shapes"]["http://schema.org/Dataset-url"]
+    assert shape == {
+        "severity": "Violation",
+        "results": 3,
+        "focus_nodes": ["[ a <http://schema.org/Dataset> ]"],
+        "data_graphs": sorted(["graph 1", str(file_path)]),
+    }
+    assert summary["shapes"]["http://schema.org/Dataset-sameAs"]["severity"] == (
+        "Warning"
+    )
+
+
+def test_validate_in_memory_graphs(tmp_path):
+    """Test that data graphs in memory are validated as the file they would
+    be written to."""
+    graph = convert(get_example_metadata_file_path("EML"), "EML")
+    file_path = tmp_path / "graph.jsonld"
+    file_path.write_text(graph, encoding="utf-8")
+    expected = validate(str(file_path))
+    parsed = rdflib.Graph().parse(data=graph, format="json-ld")
+    for data_graph in [json.loads(graph), graph, parsed]:
+        result = validate(data_graph)
+        assert result["data_graph"] is data_graph
+        assert result["conforms"] == expected["conforms"]
+        assert result["report"] == expected["report"]
+    assert list(tmp_path.iterdir()) == [file_path]
+
+
+def test_remote_contexts_are_fetched_once(monkeypatch):
+    """Test that a remote JSON-LD context is fetched once by a Validator, and
+    not at all when given."""
+    url = "https://example.org/context.jsonld"
+    context = {"@context": {"@vocab": "http://schema.org/"}}
+    fetched = []
+
+    class HttpCache:  # pylint: disable=too-few-public-methods
+        """Serves the context in place of the HTTP cache."""
+
+        def request(self, method, source, **_):
+            """Returns the context, noting that it was fetched."""
+            assert method == "GET"
+            fetched.append(source)
+            return CachedResponse(source, 200, {}, json.dumps(context))
+
+    monkeypatch.setattr("soso.validation.get_http_cache", HttpCache)
+    dataset = {"@context": [url, {"ex": "http://example.org/"}], "@type": "Dataset"}
+    expected = validate({**dataset, "@context": context["@context"]})
+    validator = Validator()
+    for _ in range(2):
+        result = validator.validate(dataset)
+        assert result["report"] == expected["report"]
+    assert fetched == [url]
+    assert validator.contexts == {url: context}
+    contexts = {url: context}
+    assert validate(dataset, contexts=contexts)["report"] == expected["report"]
+    assert validate_many([dataset] * 2, contexts=contexts)["nonconforming"] == [
+        "graph 0",
+        "graph 1",
+    ]
+    assert fetched == [url]
+
+
+def test_json_ld_strings_with_leading_whitespace_or_bom():
+    """Test that JSON-LD strings starting with white space or a byte order
+    mark are validated as such, rather than read as file paths."""
+    dataset = json.dumps({"@context": {"@vocab": "http://schema.org/"}})
+    expected = validate(dataset)
+    for data_graph in [f"\n  {dataset}", f"\ufeff{dataset}", f"\ufeff\n{dataset}"]:
+        assert validate(data_graph)["report"] == expected["report"]
+    assert not validate_many([f"\ufeff{dataset}"])["errors"]
+
+
+def test_validate_remote_data_graph(monkeypatch):
+    """Test that a data graph given by URL is fetched, rather than read as a
+    file path, and named by its URL in summaries."""
+    url = "https://example.org/graph.jsonld"
+    dataset = {"@context": {"@vocab": "http://schema.org/"}, "@type": "Dataset"}
+
+    class HttpCache:  # pylint: disable=too-few-public-methods
+        """Serves the data graph in place of the HTTP cache."""
+
+        def request(self, method, source, **_):
+            """Returns the data graph."""
+            assert (method, source) == ("GET", url)
+            return CachedResponse(source, 200, {}, json.dumps(dataset))
+
+    monkeypatch.setattr("soso.validation.get_http_cache", HttpCache)
+    assert validate(url)["report"] == validate(dataset)["report"]
+    assert validate_many([url])["nonconforming"] == [url]